@@ -5,7 +5,12 @@ Handles communication with Google Maps, TransLink, Lime, OpenWeatherMap, and Van
 
 import httpx
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+import functools
+import itertools
+import math
+import os
+import numpy as np
+from typing import List, Dict, Any, Optional, Tuple, Callable, Hashable, Awaitable
 from datetime import datetime, timedelta
 import logging
 
@@ -13,51 +18,414 @@ from .models import (
     Point, WeatherData, WeatherCondition, TrafficData,
     TransitData, BikeScooterData, TransportMode
 )
-from .config import settings
+from .config import get_settings
+from .cache import AsyncTTLCache, DiskCache, MISSING, swr_cached
+from .resilience import HostCircuitBreakers, RETRYABLE_STATUS_CODES, retry
 from .gtfs_parser import GTFSRTParser
 from .gtfs_static import GTFSStaticParser
 
+# orjson decodes response bodies several times faster than the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# HTTP/2 requires the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# ijson parses large JSON bodies incrementally instead of buffering them
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by all API clients
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT = httpx.Timeout(5.0, connect=2.0)  # 5s overall for faster failures, 2s to connect
+
+# Concurrent requests allowed per upstream host, sized to each service's rate
+# limits; hosts not listed get the keep-alive pool size
+HOST_CONCURRENCY_LIMITS = {
+    "maps.googleapis.com": 10,
+    "gtfsapi.translink.ca": 5,
+    "web-production.lime.bike": 5,
+    "api.openweathermap.org": 5,
+    "opendata.vancouver.ca": 5
+}
+
+# Cache TTLs (seconds) per endpoint
+ELEVATION_CACHE_TTL = float('inf')  # Elevation never changes
+WEATHER_CACHE_TTL = 120
+ROAD_CLOSURES_CACHE_TTL = 300
+
+# Responses larger than this (bytes) are logged as oversized
+MAX_RESPONSE_BYTES = 100_000
+
+# Open Data record fields read by routing.closure_avoidance; everything else is dropped server-side
+OPEN_DATA_FIELDS = (
+    "geo_point_2d", "geom", "location", "coordinates", "latitude", "longitude", "lat", "lng",
+    "project", "street", "closure_type", "status", "description"
+)
+
+# Google Elevation API accepts at most 512 locations per request
+ELEVATION_MAX_LOCATIONS = 512
 
-class GoogleMapsClient:
-    """Client for Google Maps API services."""
+# Upper bound (seconds) on each upstream fetch in APIClientManager.get_all_data
+DATA_FETCH_TIMEOUT = 3.0
+
+# Traffic responses with more steps than this are processed with NumPy
+TRAFFIC_VECTORIZE_THRESHOLD = 32
+
+# Traffic responses with more steps than this are parsed in a worker thread
+TRAFFIC_THREAD_THRESHOLD = 200
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an HTTP client with the shared pool and timeout settings."""
+    return httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+class _AsyncByteReader:
+    """File-like async reader over a response byte stream, as expected by ijson."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.bytes_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        try:
+            chunk = await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _check_response_size(url: str, size: int) -> None:
+    """Log responses over MAX_RESPONSE_BYTES so oversized payloads can be trimmed."""
+    if size > MAX_RESPONSE_BYTES:
+        logger.warning("Oversized response from %s: %s bytes (limit %s)", url, size, MAX_RESPONSE_BYTES)
+
+
+def _traffic_metrics(
+    durations: List[float],
+    durations_in_traffic: List[float],
+    distances: List[float]
+) -> Tuple[List[float], List[float], List[float]]:
+    """
+    Compute per-step congestion level and current/free-flow speeds (km/h).
+
+    Takes parallel arrays of step durations (s), durations in traffic (s), and
+    distances (m); long routes are computed with NumPy in one pass.
+    """
+    if len(durations) > TRAFFIC_VECTORIZE_THRESHOLD:
+        duration = np.asarray(durations, dtype=np.float64)
+        duration_in_traffic = np.asarray(durations_in_traffic, dtype=np.float64)
+        distance = np.asarray(distances, dtype=np.float64)
+
+        congestion = np.where(
+            duration > 0,
+            np.clip((duration_in_traffic - duration) / np.maximum(duration, 1), 0, 1),
+            0.0
+        )
+        current_speeds = distance / np.maximum(duration_in_traffic, 1) * 3.6  # m/s to km/h
+        free_flow_speeds = distance / np.maximum(duration, 1) * 3.6
+        return congestion.tolist(), current_speeds.tolist(), free_flow_speeds.tolist()
+
+    congestion = [
+        min(1.0, max(0, (in_traffic - duration) / duration)) if duration > 0 else 0
+        for duration, in_traffic in zip(durations, durations_in_traffic)
+    ]
+    current_speeds = [
+        distance / max(in_traffic, 1) * 3.6  # m/s to km/h
+        for distance, in_traffic in zip(distances, durations_in_traffic)
+    ]
+    free_flow_speeds = [
+        distance / max(duration, 1) * 3.6
+        for distance, duration in zip(distances, durations)
+    ]
+    return congestion, current_speeds, free_flow_speeds
+
+
+async def _nearby_for_endpoints(
+    get_nearby: Callable[..., Awaitable[List[Any]]],
+    origin: Point,
+    destination: Point,
+    radius: int
+) -> List[List[Any]]:
+    """
+    Search around both route endpoints, returning [origin_results, destination_results].
+
+    When the endpoints are closer than ``radius`` the two search circles mostly
+    overlap, so one search from the midpoint with a radius covering both is
+    issued and its results are used for both endpoints.
+    """
+    distance = origin.distance_to(destination)
+    if distance < radius:
+        midpoint = Point(lat=(origin.lat + destination.lat) / 2, lng=(origin.lng + destination.lng) / 2)
+        results = await get_nearby(midpoint, math.ceil(distance / 2 + radius))
+        return [results, results]
+
+    return list(await asyncio.gather(get_nearby(origin, radius), get_nearby(destination, radius)))
+
+
+# "lat,lng" formatting for request params; bound once so it runs as a C-level call
+_fmt = "{:.6f},{:.6f}".format
+
+
+def _parse_traffic(steps: List[Dict[str, Any]]) -> List[TrafficData]:
+    """Build per-step traffic data from Google Directions route steps."""
+    # Extract step fields into parallel arrays
+    durations = [step.get("duration", {}).get("value", 0) for step in steps]
+    durations_in_traffic = [
+        step.get("duration_in_traffic", {}).get("value", duration)
+        for step, duration in zip(steps, durations)
+    ]
+    distances = [step.get("distance", {}).get("value", 0) for step in steps]
+    start_locations = [step.get("start_location", {}) for step in steps]
+
+    congestion, current_speeds, free_flow_speeds = _traffic_metrics(durations, durations_in_traffic, distances)
+
+    return [
+        # Values are already numeric and clamped, so skip re-validating every step
+        TrafficData.model_construct(
+            edge_key=(start.get("lat", 0.0), start.get("lng", 0.0)),
+            current_speed=current_speed,
+            free_flow_speed=free_flow_speed,
+            congestion_level=congestion_level
+        )
+        for start, current_speed, free_flow_speed, congestion_level
+        in zip(start_locations, current_speeds, free_flow_speeds, congestion)
+    ]
+
+
+def _round_point(point: Point, ndigits: int = 5) -> Tuple[float, float]:
+    """Round a point (5 digits is ~1m precision) so nearby requests share a key."""
+    return (round(point.lat, ndigits), round(point.lng, ndigits))
+
+
+def dedupe(key: Callable[..., Hashable]):
+    """
+    Share in-flight requests between concurrent callers.
+
+    The first call for a given ``key(self, *args, **kwargs)`` issues the request;
+    concurrent calls with the same key await that request instead of sending
+    their own. The entry is dropped as soon as the request completes.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            request_key = (func.__name__, key(self, *args, **kwargs))
+            future = self._inflight.get(request_key)
+            if future is None:
+                future = asyncio.ensure_future(func(self, *args, **kwargs))
+                self._inflight[request_key] = future
+                future.add_done_callback(lambda _: self._inflight.pop(request_key, None))
+            # Shield so one caller timing out doesn't cancel the request for the others
+            return await asyncio.shield(future)
+        return wrapper
+    return decorator
+
+
+class _Dedup:
+    """Mixin holding the in-flight request table used by ``dedupe``."""
 
     def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+
+class HostSemaphores:
+    """Per-host concurrency limits, so one slow upstream can't take the whole pool."""
+
+    def __init__(
+        self,
+        limit: int = HTTP_LIMITS.max_keepalive_connections,
+        host_limits: Optional[Dict[str, int]] = None
+    ):
+        self.limit = limit
+        self.host_limits = host_limits or {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def __call__(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore for the host of a URL."""
+        host = httpx.URL(url).host
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            limit = self.host_limits.get(host, self.limit)
+            semaphore = self._semaphores[host] = asyncio.Semaphore(limit)
+        return semaphore
+
+
+class _APIClient(_Dedup):
+    """Base class for service clients sharing an HTTP client, host limits, and circuit breakers."""
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        host_semaphores: Optional[HostSemaphores] = None,
+        breakers: Optional[HostCircuitBreakers] = None
+    ):
+        super().__init__()
+        self.client = client or create_http_client()
+        self._host_semaphores = host_semaphores or HostSemaphores()
+        self._breakers = breakers or HostCircuitBreakers()
+
+        # Last response carrying an ETag/Last-Modified per request URL, for conditional GETs
+        self._validated_responses = AsyncTTLCache(maxsize=256)
+
+    @retry(max_attempts=3, base=0.2, max_backoff=2.0)
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a GET request, waiting for a free slot on the target host.
+
+        Transport errors and retryable statuses (429/5xx) are retried with
+        backoff, and count towards the host's circuit breaker.
+        """
+        async with self._host_semaphores(url):
+            return await self._breakers(url).call(self._send_get, url, **kwargs)
+
+    async def _send_get(self, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a single GET, raising for statuses that should be retried.
+
+        Responses with an ETag or Last-Modified header are kept and revalidated
+        with If-None-Match / If-Modified-Since, so unchanged data comes back as
+        a bodiless 304 and the stored response is replayed.
+        """
+        request_key = str(httpx.URL(url, params=kwargs.get("params")))
+        cached, _ = self._validated_responses.get(request_key)
+        if cached is not MISSING:
+            conditional_headers = {}
+            if "ETag" in cached.headers:
+                conditional_headers["If-None-Match"] = cached.headers["ETag"]
+            if "Last-Modified" in cached.headers:
+                conditional_headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **conditional_headers}
+
+        response = await self.client.get(url, **kwargs)
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            response.raise_for_status()
+
+        if response.status_code == 304 and cached is not MISSING:
+            logger.debug("Not modified, replaying cached response for %s", url)
+            return cached
+        if response.status_code == 200 and ("ETag" in response.headers or "Last-Modified" in response.headers):
+            self._validated_responses.set(request_key, response, ttl=float('inf'))
+        return response
+
+    @retry(max_attempts=3, base=0.2, max_backoff=2.0)
+    async def _get_items(self, url: str, prefix: str, **kwargs) -> List[Any]:
+        """
+        Stream a GET response and collect the JSON items found at ``prefix``.
+
+        Records are parsed as the body downloads, so large payloads are never
+        held in memory as one buffer. Requires ijson.
+        """
+        async with self._host_semaphores(url):
+            return await self._breakers(url).call(self._stream_items, url, prefix, **kwargs)
+
+    async def _stream_items(self, url: str, prefix: str, **kwargs) -> List[Any]:
+        """Send a single streamed GET and parse the items at ``prefix``."""
+        async with self.client.stream("GET", url, **kwargs) as response:
+            response.raise_for_status()
+            reader = _AsyncByteReader(response.aiter_bytes())
+            items = [item async for item in ijson.items(reader, prefix, use_float=True)]
+        _check_response_size(url, reader.bytes_read)
+        return items
+
+
+class GoogleMapsClient(_APIClient):
+    """Client for Google Maps API services."""
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        host_semaphores: Optional[HostSemaphores] = None,
+        breakers: Optional[HostCircuitBreakers] = None,
+        disk_cache: Optional[DiskCache] = None
+    ):
+        super().__init__(client, host_semaphores, breakers)
+        settings = get_settings()
         self.api_key = settings.google_maps_api_key
         self.base_url = settings.google_maps_base_url
-        self.client = httpx.AsyncClient(timeout=5.0)  # Reduced from 30s to 5s for faster failures
+
+        # Request URLs and fixed params, built once per client
+        self._elevation_url = f"{self.base_url}/elevation/json"
+        self._directions_url = f"{self.base_url}/directions/json"
+        self._geocode_url = f"{self.base_url}/geocode/json"
+        self._base_params = {"key": self.api_key}
+
+        # Per-point elevation cache keyed on rounded (lat, lng), persisted to disk when available
+        self._elevation_cache = AsyncTTLCache(maxsize=10000, store=disk_cache)
 
     async def get_elevation(self, points: List[Point]) -> List[float]:
-        """Get elevation data for a list of points."""
+        """
+        Get elevation data for a list of points.
+
+        Elevations are cached per point, so only points that haven't been seen
+        before are sent to Google, batched into as few requests as possible.
+        """
         if not self.api_key:
             logger.warning("Google Maps API key not configured")
             return [0.0] * len(points)
 
-        try:
-            # Convert points to string format
-            locations = "|".join([f"{p.lat},{p.lng}" for p in points])
-
-            url = f"{self.base_url}/elevation/json"
-            params = {
-                "locations": locations,
-                "key": self.api_key
-            }
+        keys = [_round_point(p) for p in points]
+        cached = await self._elevation_cache.get_many(dict.fromkeys(keys))
+        elevations: Dict[Tuple[float, float], float] = {key: value for key, (value, _) in cached.items()}
+        missing = [key for key in dict.fromkeys(keys) if key not in elevations]
+
+        if missing:
+            chunks = [
+                tuple(missing[i:i + ELEVATION_MAX_LOCATIONS])
+                for i in range(0, len(missing), ELEVATION_MAX_LOCATIONS)
+            ]
+            results = await asyncio.gather(
+                *(self._fetch_elevations(chunk) for chunk in chunks),
+                return_exceptions=True
+            )
 
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
+            fetched_elevations = {}
+            for chunk, fetched in zip(chunks, results):
+                # Failed chunks fall back to 0.0 below and are retried next call
+                if isinstance(fetched, Exception):
+                    logger.error("Error fetching elevation data: %s", fetched)
+                    continue
+                fetched_elevations.update(zip(chunk, fetched))
+
+            # Cache every fetched point in one disk write
+            await self._elevation_cache.set_many(fetched_elevations, ELEVATION_CACHE_TTL)
+            elevations.update(fetched_elevations)
+
+        return [elevations.get(key, 0.0) for key in keys]
+
+    @dedupe(key=lambda self, locations: locations)
+    async def _fetch_elevations(self, locations: Tuple[Tuple[float, float], ...]) -> List[float]:
+        """Fetch elevations for (lat, lng) pairs in one request; raises on API errors."""
+        params = {
+            **self._base_params,
+            "locations": "|".join(itertools.starmap(_fmt, locations))
+        }
 
-            data = response.json()
-            if data.get("status") == "OK":
-                return [result["elevation"] for result in data.get("results", [])]
-            else:
-                logger.error(f"Google Elevation API error: {data.get('status')}")
-                return [0.0] * len(points)
+        response = await self._get(self._elevation_url, params=params)
+        response.raise_for_status()
 
-        except Exception as e:
-            logger.error(f"Error fetching elevation data: {e}")
-            return [0.0] * len(points)
+        data = _loads(response.content)
+        if data.get("status") != "OK":
+            raise ValueError(f"Google Elevation API error: {data.get('status')}")
+        return [result["elevation"] for result in data.get("results", [])]
 
+    @dedupe(key=lambda self, origin, destination: (_round_point(origin), _round_point(destination)))
     async def get_traffic_data(self, origin: Point, destination: Point) -> List[TrafficData]:
         """Get traffic data for a route."""
         if not self.api_key:
@@ -65,48 +433,35 @@ class GoogleMapsClient:
             return []
 
         try:
-            url = f"{self.base_url}/directions/json"
             params = {
-                "origin": f"{origin.lat},{origin.lng}",
-                "destination": f"{destination.lat},{destination.lng}",
+                **self._base_params,
+                "origin": _fmt(origin.lat, origin.lng),
+                "destination": _fmt(destination.lat, destination.lng),
                 "departure_time": "now",
-                "traffic_model": "best_guess",
-                "key": self.api_key
+                "traffic_model": "best_guess"
             }
 
-            response = await self.client.get(url, params=params)
+            response = await self._get(self._directions_url, params=params)
             response.raise_for_status()
 
-            data = response.json()
-            traffic_data = []
-
-            if data.get("status") == "OK" and data.get("routes"):
-                route = data["routes"][0]
-                for leg in route.get("legs", []):
-                    for step in leg.get("steps", []):
-                        # Extract traffic information from step
-                        duration = step.get("duration", {}).get("value", 0)
-                        duration_in_traffic = step.get("duration_in_traffic", {}).get("value", duration)
+            data = _loads(response.content)
+            if data.get("status") != "OK" or not data.get("routes"):
+                return []
 
-                        # Calculate congestion level
-                        if duration > 0:
-                            congestion = max(0, (duration_in_traffic - duration) / duration)
-                        else:
-                            congestion = 0
+            steps = [step for leg in data["routes"][0].get("legs", []) for step in leg.get("steps", [])]
 
-                        traffic_data.append(TrafficData(
-                            edge_id=f"google_{step.get('start_location', {}).get('lat')}_{step.get('start_location', {}).get('lng')}",
-                            current_speed=step.get("distance", {}).get("value", 0) / max(duration_in_traffic, 1) * 3.6,  # m/s to km/h
-                            free_flow_speed=step.get("distance", {}).get("value", 0) / max(duration, 1) * 3.6,
-                            congestion_level=min(1.0, congestion)
-                        ))
-
-            return traffic_data
+            # Parse long routes in a worker thread so the event loop keeps serving other requests
+            if len(steps) > TRAFFIC_THREAD_THRESHOLD:
+                return await asyncio.to_thread(_parse_traffic, steps)
+            return _parse_traffic(steps)
 
         except Exception as e:
-            logger.error(f"Error fetching traffic data: {e}")
+            logger.error("Error fetching traffic data: %s", e)
             return []
 
+    @dedupe(key=lambda self, origin, destination, mode="driving", alternatives=True, avoid=None, departure_time=None: (
+        _round_point(origin), _round_point(destination), mode, alternatives, tuple(avoid or ()), departure_time
+    ))
     async def get_directions(
         self,
         origin: Point,
@@ -135,13 +490,12 @@ class GoogleMapsClient:
             return None
 
         try:
-            url = f"{self.base_url}/directions/json"
             params = {
-                "origin": f"{origin.lat},{origin.lng}",
-                "destination": f"{destination.lat},{destination.lng}",
+                **self._base_params,
+                "origin": _fmt(origin.lat, origin.lng),
+                "destination": _fmt(destination.lat, destination.lng),
                 "mode": mode,
-                "alternatives": "true" if alternatives else "false",
-                "key": self.api_key
+                "alternatives": "true" if alternatives else "false"
             }
 
             if avoid:
@@ -153,20 +507,21 @@ class GoogleMapsClient:
                 params["departure_time"] = "now"
                 params["traffic_model"] = "best_guess"
 
-            response = await self.client.get(url, params=params)
+            response = await self._get(self._directions_url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             if data.get("status") == "OK":
                 return data
 
-            logger.error(f"Google Directions API error: {data.get('status')} - {data.get('error_message', '')}")
+            logger.error("Google Directions API error: %s - %s", data.get('status'), data.get('error_message', ''))
             return None
 
         except Exception as e:
-            logger.error(f"Error fetching directions: {e}")
+            logger.error("Error fetching directions: %s", e)
             return None
 
+    @dedupe(key=lambda self, address: address.lower().strip())
     async def geocode(self, address: str) -> Optional[Point]:
         """Geocode an address to coordinates."""
         if not self.api_key:
@@ -174,16 +529,12 @@ class GoogleMapsClient:
             return None
 
         try:
-            url = f"{self.base_url}/geocode/json"
-            params = {
-                "address": address,
-                "key": self.api_key
-            }
+            params = {**self._base_params, "address": address}
 
-            response = await self.client.get(url, params=params)
+            response = await self._get(self._geocode_url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             if data.get("status") == "OK" and data.get("results"):
                 location = data["results"][0]["geometry"]["location"]
                 return Point(lat=location["lat"], lng=location["lng"])
@@ -191,21 +542,33 @@ class GoogleMapsClient:
             return None
 
         except Exception as e:
-            logger.error(f"Error geocoding address: {e}")
+            logger.error("Error geocoding address: %s", e)
             return None
 
 
-class TransLinkClient:
+class TransLinkClient(_APIClient):
     """Client for TransLink (Vancouver public transit) GTFS-RT V3 API.
 
     Note: The old RTTI API was retired on December 3, 2024.
     This client now uses the GTFS Realtime V3 API.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        host_semaphores: Optional[HostSemaphores] = None,
+        breakers: Optional[HostCircuitBreakers] = None
+    ):
+        super().__init__(client, host_semaphores, breakers)
+        settings = get_settings()
         self.api_key = settings.translink_api_key
         self.base_url = settings.translink_base_url
-        self.client = httpx.AsyncClient(timeout=5.0)  # Reduced from 30s to 5s for faster failures
+
+        # Feed URLs and auth params, built once per client
+        self._trip_updates_url = f"{self.base_url}/gtfsrealtime"
+        self._positions_url = f"{self.base_url}/gtfsposition"
+        self._alerts_url = f"{self.base_url}/gtfsalerts"
+        self._base_params = {"apikey": self.api_key}
         self.parser = GTFSRTParser()
         self.gtfs_static = GTFSStaticParser()  # For stop name to ID mapping
 
@@ -242,6 +605,7 @@ class TransLinkClient:
                 loop = asyncio.get_event_loop()
                 await loop.run_in_executor(None, self.gtfs_static.load)
 
+    @dedupe(key=lambda self: None)
     async def get_trip_updates(self) -> bytes:
         """Get GTFS Realtime trip updates feed (Protocol Buffer format)."""
         if not self.api_key:
@@ -249,16 +613,13 @@ class TransLinkClient:
             return b""
 
         try:
-            url = f"{self.base_url}/gtfsrealtime"
-            params = {"apikey": self.api_key}
-
-            response = await self.client.get(url, params=params)
+            response = await self._get(self._trip_updates_url, params=self._base_params)
             response.raise_for_status()
 
             return response.content  # Return raw bytes (Protocol Buffer format)
 
         except Exception as e:
-            logger.error(f"Error fetching TransLink trip updates: {e}")
+            logger.error("Error fetching TransLink trip updates: %s", e)
             return b""
 
     async def get_parsed_trip_updates(self) -> List[Dict]:
@@ -367,6 +728,7 @@ class TransLinkClient:
         trip_updates = await self.get_parsed_trip_updates()
         return self.parser.get_route_delays(trip_updates, route_id)
 
+    @dedupe(key=lambda self: None)
     async def get_position_updates(self) -> bytes:
         """Get GTFS Realtime position updates feed (Protocol Buffer format)."""
         if not self.api_key:
@@ -374,18 +736,16 @@ class TransLinkClient:
             return b""
 
         try:
-            url = f"{self.base_url}/gtfsposition"
-            params = {"apikey": self.api_key}
-
-            response = await self.client.get(url, params=params)
+            response = await self._get(self._positions_url, params=self._base_params)
             response.raise_for_status()
 
             return response.content  # Return raw bytes (Protocol Buffer format)
 
         except Exception as e:
-            logger.error(f"Error fetching TransLink position updates: {e}")
+            logger.error("Error fetching TransLink position updates: %s", e)
             return b""
 
+    @dedupe(key=lambda self: None)
     async def get_service_alerts(self) -> bytes:
         """Get GTFS Realtime service alerts feed (Protocol Buffer format)."""
         if not self.api_key:
@@ -393,16 +753,13 @@ class TransLinkClient:
             return b""
 
         try:
-            url = f"{self.base_url}/gtfsalerts"
-            params = {"apikey": self.api_key}
-
-            response = await self.client.get(url, params=params)
+            response = await self._get(self._alerts_url, params=self._base_params)
             response.raise_for_status()
 
             return response.content  # Return raw bytes (Protocol Buffer format)
 
         except Exception as e:
-            logger.error(f"Error fetching TransLink service alerts: {e}")
+            logger.error("Error fetching TransLink service alerts: %s", e)
             return b""
 
     async def get_nearby_stops(self, point: Point, radius: int = 500) -> List[TransitData]:
@@ -431,14 +788,23 @@ class TransLinkClient:
         return {}
 
 
-class LimeClient:
+class LimeClient(_APIClient):
     """Client for Lime bike/scooter sharing API."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        host_semaphores: Optional[HostSemaphores] = None,
+        breakers: Optional[HostCircuitBreakers] = None
+    ):
+        super().__init__(client, host_semaphores, breakers)
+        settings = get_settings()
         self.api_key = settings.lime_api_key
         self.base_url = settings.lime_base_url
-        self.client = httpx.AsyncClient(timeout=5.0)  # Reduced from 30s to 5s for faster failures
+        self._vehicles_url = f"{self.base_url}/vehicles"
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
 
+    @dedupe(key=lambda self, point, radius=1000: (_round_point(point), radius))
     async def get_available_vehicles(self, point: Point, radius: int = 1000) -> List[BikeScooterData]:
         """Get available bikes and scooters near a point."""
         if not self.api_key:
@@ -448,47 +814,69 @@ class LimeClient:
         try:
             # Note: This is a simplified implementation
             # Real Lime API would require proper authentication and endpoints
-            url = f"{self.base_url}/vehicles"
             params = {
                 "lat": point.lat,
                 "lng": point.lng,
                 "radius": radius
             }
-            headers = {
-                "Authorization": f"Bearer {self.api_key}"
-            }
 
-            response = await self.client.get(url, params=params, headers=headers)
+            response = await self._get(self._vehicles_url, params=params, headers=self._headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             vehicles = []
 
+            # Fields are coerced here, so models are built without per-record validation
             for vehicle in data.get("data", {}).get("attributes", {}).get("vehicles", []):
-                vehicles.append(BikeScooterData(
-                    station_id=vehicle.get("id", ""),
-                    location=Point(
-                        lat=vehicle.get("attributes", {}).get("lat", 0),
-                        lng=vehicle.get("attributes", {}).get("lng", 0)
+                attributes = vehicle.get("attributes", {})
+                vehicle_type = attributes.get("type")
+                vehicles.append(BikeScooterData.model_construct(
+                    station_id=str(vehicle.get("id", "")),
+                    location=Point.model_construct(
+                        lat=float(attributes.get("lat", 0)),
+                        lng=float(attributes.get("lng", 0))
                     ),
-                    available_bikes=1 if vehicle.get("attributes", {}).get("type") == "bike" else 0,
-                    available_scooters=1 if vehicle.get("attributes", {}).get("type") == "scooter" else 0
+                    available_bikes=1 if vehicle_type == "bike" else 0,
+                    available_scooters=1 if vehicle_type == "scooter" else 0
                 ))
 
             return vehicles
 
         except Exception as e:
-            logger.error(f"Error fetching Lime vehicles: {e}")
+            logger.error("Error fetching Lime vehicles: %s", e)
             return []
 
 
-class OpenWeatherClient:
+# Map OpenWeatherMap condition groups to our enum
+_CONDITION_MAP: Dict[str, WeatherCondition] = {
+    "clear": WeatherCondition.CLEAR,
+    "clouds": WeatherCondition.CLEAR,
+    "rain": WeatherCondition.RAIN,
+    "drizzle": WeatherCondition.RAIN,
+    "thunderstorm": WeatherCondition.RAIN,
+    "snow": WeatherCondition.SNOW,
+    "mist": WeatherCondition.FOG,
+    "fog": WeatherCondition.FOG,
+    "haze": WeatherCondition.FOG
+}
+
+
+class OpenWeatherClient(_APIClient):
     """Client for OpenWeatherMap API."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        host_semaphores: Optional[HostSemaphores] = None,
+        breakers: Optional[HostCircuitBreakers] = None
+    ):
+        super().__init__(client, host_semaphores, breakers)
+        settings = get_settings()
         self.api_key = settings.openweather_api_key
         self.base_url = settings.openweather_base_url
-        self.client = httpx.AsyncClient(timeout=5.0)  # Reduced from 30s to 5s for faster failures
+        self._weather_url = f"{self.base_url}/weather"
+        self._base_params = {"appid": self.api_key, "units": "metric"}
+        self._cache = AsyncTTLCache()
 
     async def get_current_weather(self, point: Point) -> WeatherData:
         """Get current weather conditions for a point."""
@@ -504,49 +892,10 @@ class OpenWeatherClient:
             )
 
         try:
-            url = f"{self.base_url}/weather"
-            params = {
-                "lat": point.lat,
-                "lon": point.lng,
-                "appid": self.api_key,
-                "units": "metric"
-            }
-
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
-            weather = data.get("weather", [{}])[0]
-            main = data.get("main", {})
-            wind = data.get("wind", {})
-            visibility = data.get("visibility", 10000) / 1000  # Convert to km
-
-            # Map weather condition to our enum
-            condition_map = {
-                "clear": WeatherCondition.CLEAR,
-                "clouds": WeatherCondition.CLEAR,
-                "rain": WeatherCondition.RAIN,
-                "drizzle": WeatherCondition.RAIN,
-                "thunderstorm": WeatherCondition.RAIN,
-                "snow": WeatherCondition.SNOW,
-                "mist": WeatherCondition.FOG,
-                "fog": WeatherCondition.FOG,
-                "haze": WeatherCondition.FOG
-            }
-
-            condition = condition_map.get(weather.get("main", "").lower(), WeatherCondition.CLEAR)
-
-            return WeatherData(
-                condition=condition,
-                temperature=main.get("temp", 20.0),
-                humidity=main.get("humidity", 50.0),
-                wind_speed=wind.get("speed", 0.0) * 3.6,  # m/s to km/h
-                precipitation=main.get("rain", {}).get("1h", 0.0),
-                visibility=visibility
-            )
+            return await self._fetch_current_weather(point)
 
         except Exception as e:
-            logger.error(f"Error fetching weather data: {e}")
+            logger.error("Error fetching weather data: %s", e)
             return WeatherData(
                 condition=WeatherCondition.CLEAR,
                 temperature=20.0,
@@ -556,96 +905,150 @@ class OpenWeatherClient:
                 visibility=10.0
             )
 
+    # Weather is keyed at ~1km precision; conditions don't vary below that
+    @swr_cached("weather", ttl=WEATHER_CACHE_TTL, key=lambda self, point: _round_point(point, 2))
+    @dedupe(key=lambda self, point: _round_point(point, 2))
+    async def _fetch_current_weather(self, point: Point) -> WeatherData:
+        """Fetch current weather from OpenWeatherMap; raises on API errors."""
+        params = {**self._base_params, "lat": point.lat, "lon": point.lng}
+
+        response = await self._get(self._weather_url, params=params)
+        response.raise_for_status()
+
+        data = _loads(response.content)
+        weather = data.get("weather", [{}])[0]
+        main = data.get("main", {})
+        wind = data.get("wind", {})
+        visibility = data.get("visibility", 10000) / 1000  # Convert to km
+
+        condition = _CONDITION_MAP.get(weather.get("main", "").lower(), WeatherCondition.CLEAR)
+
+        return WeatherData(
+            condition=condition,
+            temperature=main.get("temp", 20.0),
+            humidity=main.get("humidity", 50.0),
+            wind_speed=wind.get("speed", 0.0) * 3.6,  # m/s to km/h
+            precipitation=main.get("rain", {}).get("1h", 0.0),
+            visibility=visibility
+        )
+
 
-class VancouverOpenDataClient:
+class VancouverOpenDataClient(_APIClient):
     """Client for City of Vancouver Open Data API."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        host_semaphores: Optional[HostSemaphores] = None,
+        breakers: Optional[HostCircuitBreakers] = None,
+        disk_cache: Optional[DiskCache] = None
+    ):
+        super().__init__(client, host_semaphores, breakers)
+        settings = get_settings()
         self.base_url = settings.vancouver_open_data_base_url
-        self.client = httpx.AsyncClient(timeout=5.0)  # Reduced from 30s to 5s for faster failures
+        self._datastore_url = f"{self.base_url}/datastore_search"
+        self._cache = AsyncTTLCache(store=disk_cache)
 
     async def get_road_closures(self) -> List[Dict[str, Any]]:
         """Get current road closures and construction."""
         try:
             # This is a simplified implementation
             # Real implementation would use the actual Vancouver Open Data API
-            url = f"{self.base_url}/datastore_search"
-            params = {
-                "resource_id": "road-closures",  # This would be the actual resource ID
-                "limit": 100
-            }
-
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
-            return data.get("result", {}).get("records", [])
+            return await self._fetch_records("road-closures")  # This would be the actual resource ID
 
         except Exception as e:
-            logger.error(f"Error fetching road closures: {e}")
+            logger.error("Error fetching road closures: %s", e)
             return []
 
     async def get_construction_zones(self) -> List[Dict[str, Any]]:
         """Get current construction zones."""
         try:
             # Similar to road closures, this would use the actual API
-            url = f"{self.base_url}/datastore_search"
-            params = {
-                "resource_id": "construction-zones",
-                "limit": 100
-            }
-
-            response = await self.client.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
-            return data.get("result", {}).get("records", [])
+            return await self._fetch_records("construction-zones")
 
         except Exception as e:
-            logger.error(f"Error fetching construction zones: {e}")
+            logger.error("Error fetching construction zones: %s", e)
             return []
 
+    @swr_cached("datastore_search", ttl=ROAD_CLOSURES_CACHE_TTL, key=lambda self, resource_id: resource_id)
+    @dedupe(key=lambda self, resource_id: resource_id)
+    async def _fetch_records(self, resource_id: str) -> List[Dict[str, Any]]:
+        """Fetch datastore records for a resource; raises on API errors."""
+        params = {
+            "resource_id": resource_id,
+            "fields": ",".join(OPEN_DATA_FIELDS),
+            "limit": 100
+        }
+
+        if IJSON_AVAILABLE:
+            return await self._get_items(self._datastore_url, "result.records.item", params=params)
+
+        response = await self._get(self._datastore_url, params=params)
+        response.raise_for_status()
+        _check_response_size(self._datastore_url, len(response.content))
+
+        data = _loads(response.content)
+        return data.get("result", {}).get("records", [])
+
 
 class APIClientManager:
     """Manages all API clients and provides unified interface."""
 
     def __init__(self):
-        self.google_maps = GoogleMapsClient()
-        self.translink = TransLinkClient()
-        self.lime = LimeClient()
-        self.openweather = OpenWeatherClient()
-        self.vancouver_data = VancouverOpenDataClient()
+        # One connection pool, set of host limits, and set of circuit breakers for all services
+        self._http = create_http_client()
+        self._host_sem = HostSemaphores(host_limits=HOST_CONCURRENCY_LIMITS)
+        self._breakers = HostCircuitBreakers(failure_threshold=5, reset_timeout=30)
+
+        # Elevation and Open Data responses change rarely enough to keep across restarts
+        cache_dir = get_settings().cache_dir
+        self._disk_cache = DiskCache(os.path.join(cache_dir, "api_cache.sqlite")) if cache_dir else None
+
+        self.google_maps = GoogleMapsClient(self._http, self._host_sem, self._breakers, self._disk_cache)
+        self.translink = TransLinkClient(self._http, self._host_sem, self._breakers)
+        self.lime = LimeClient(self._http, self._host_sem, self._breakers)
+        self.openweather = OpenWeatherClient(self._http, self._host_sem, self._breakers)
+        self.vancouver_data = VancouverOpenDataClient(self._http, self._host_sem, self._breakers, self._disk_cache)
 
     async def get_all_data(self, origin: Point, destination: Point) -> Dict[str, Any]:
         """Fetch all relevant data for route calculation."""
-        tasks = [
-            self.openweather.get_current_weather(origin),
-            self.google_maps.get_traffic_data(origin, destination),
-            self.translink.get_nearby_stops(origin),
-            self.translink.get_nearby_stops(destination),
-            self.lime.get_available_vehicles(origin),
-            self.lime.get_available_vehicles(destination),
-            self.vancouver_data.get_road_closures(),
-            self.vancouver_data.get_construction_zones()
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = {
+            "weather": self.openweather.get_current_weather(origin),
+            "traffic": self.google_maps.get_traffic_data(origin, destination),
+            "transit": _nearby_for_endpoints(self.translink.get_nearby_stops, origin, destination, radius=500),
+            "lime": _nearby_for_endpoints(self.lime.get_available_vehicles, origin, destination, radius=1000),
+            "road_closures": self.vancouver_data.get_road_closures(),
+            "construction": self.vancouver_data.get_construction_zones()
+        }
+
+        # Bound each fetch so one hung upstream can't stall the whole response;
+        # a timed-out fetch falls back to empty data like any other failure
+        results = await asyncio.gather(
+            *(asyncio.wait_for(task, timeout=DATA_FETCH_TIMEOUT) for task in tasks.values()),
+            return_exceptions=True
+        )
+        for name, result in zip(tasks, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning("Fetching %s data timed out after %ss", name, DATA_FETCH_TIMEOUT)
+            elif isinstance(result, Exception):
+                logger.error("Error fetching %s data: %s", name, result)
+
+        transit = results[2] if not isinstance(results[2], Exception) else [[], []]
+        lime = results[3] if not isinstance(results[3], Exception) else [[], []]
 
         return {
             "weather": results[0] if not isinstance(results[0], Exception) else None,
             "traffic": results[1] if not isinstance(results[1], Exception) else [],
-            "transit_origin": results[2] if not isinstance(results[2], Exception) else [],
-            "transit_destination": results[3] if not isinstance(results[3], Exception) else [],
-            "lime_origin": results[4] if not isinstance(results[4], Exception) else [],
-            "lime_destination": results[5] if not isinstance(results[5], Exception) else [],
-            "road_closures": results[6] if not isinstance(results[6], Exception) else [],
-            "construction": results[7] if not isinstance(results[7], Exception) else []
+            "transit_origin": transit[0],
+            "transit_destination": transit[1],
+            "lime_origin": lime[0],
+            "lime_destination": lime[1],
+            "road_closures": results[4] if not isinstance(results[4], Exception) else [],
+            "construction": results[5] if not isinstance(results[5], Exception) else []
         }
 
     async def close(self) -> None:
-        """Close all HTTP clients."""
-        await self.google_maps.client.aclose()
-        await self.translink.client.aclose()
-        await self.lime.client.aclose()
-        await self.openweather.client.aclose()
-        await self.vancouver_data.client.aclose()
+        """Close the shared HTTP client and disk cache."""
+        await self._http.aclose()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
@@ -0,0 +1,296 @@
+"""
+Caching for external API responses.
+Provides an LRU cache with per-entry TTLs and stale-while-revalidate refreshes,
+optionally backed by an on-disk store that survives restarts.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sentinel returned by AsyncTTLCache.get for missing keys
+MISSING = object()
+
+# Stale entries are still served, so rows are only purged from disk this long
+# (seconds) after they expire
+DISK_CACHE_PURGE_AFTER = 7 * 86400
+
+# Purge expired rows once per this many writes (and when the store is opened)
+DISK_CACHE_PURGE_EVERY = 10_000
+
+# Keys per SELECT in DiskCache.get_many, under SQLite's bound parameter limit
+DISK_CACHE_QUERY_BATCH = 500
+
+
+class DiskCache:
+    """
+    SQLite store that persists cache entries across restarts.
+
+    The database file is opened on first use, so creating a store is free.
+
+    Keys are stored by ``repr`` and values as JSON, so both must be built from
+    plain Python types. Expiry times are wall-clock timestamps.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # The connection is used from worker threads, one statement at a time
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use (call with the lock held)."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+            self.purge_expired()
+        return self._conn
+
+    def get(self, key: Hashable) -> Tuple[Any, float]:
+        """
+        Look up a key.
+
+        Returns:
+            Tuple of (value, expires_at); value is ``MISSING`` if the key is not stored
+        """
+        return self.get_many([key]).get(key, (MISSING, 0.0))
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Tuple[Any, float]]:
+        """Look up several keys; returns (value, expires_at) for the ones that are stored."""
+        by_repr = {repr(key): key for key in keys}
+        reprs = list(by_repr)
+        found = {}
+        try:
+            with self._lock:
+                for i in range(0, len(reprs), DISK_CACHE_QUERY_BATCH):
+                    batch = reprs[i:i + DISK_CACHE_QUERY_BATCH]
+                    rows = self._connection().execute(
+                        f"SELECT key, value, expires_at FROM cache WHERE key IN ({','.join('?' * len(batch))})",
+                        batch
+                    ).fetchall()
+                    for key_repr, value, expires_at in rows:
+                        found[by_repr[key_repr]] = (json.loads(value), expires_at)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Disk cache read failed: %s", e)
+        return found
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        """Store a value until the wall-clock time ``expires_at``."""
+        self.set_many([(key, value, expires_at)])
+
+    def set_many(self, entries: Iterable[Tuple[Hashable, Any, float]]) -> None:
+        """Store several (key, value, expires_at) entries in one transaction."""
+        try:
+            rows = [(repr(key), json.dumps(value), expires_at) for key, value, expires_at in entries]
+            with self._lock:
+                conn = self._connection()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)", rows
+                )
+                conn.commit()
+                self._writes += len(rows)
+                purge = self._writes >= DISK_CACHE_PURGE_EVERY
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            logger.warning("Disk cache write failed: %s", e)
+            return
+
+        if purge:
+            self.purge_expired()
+
+    def purge_expired(self) -> None:
+        """Delete rows that expired more than DISK_CACHE_PURGE_AFTER seconds ago."""
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time() - DISK_CACHE_PURGE_AFTER,))
+                conn.commit()
+                self._writes = 0
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Disk cache purge failed: %s", e)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class AsyncTTLCache:
+    """
+    LRU cache whose entries go stale after a TTL.
+
+    Stale entries are still served; ``get_or_fetch`` refreshes them in a
+    background task so callers only wait on the network for a cold miss.
+    With a ``store``, entries are also written to disk and memory misses are
+    looked up there, so a restarted server starts warm.
+    """
+
+    def __init__(self, maxsize: int = 1024, store: Optional[DiskCache] = None):
+        self.maxsize = maxsize
+        self.store = store
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()  # key -> (value, expires_at)
+        self._refreshing: Set[Hashable] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Tuple[Any, bool]:
+        """
+        Look up a key.
+
+        Returns:
+            Tuple of (value, is_fresh); value is ``MISSING`` if the key is not cached
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is None:
+                return MISSING, False
+
+        self._data.move_to_end(key)
+        value, expires_at = entry
+        return value, time.monotonic() < expires_at
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a value that stays fresh for ``ttl`` seconds."""
+        self._remember(key, value, time.monotonic() + ttl)
+        if self.store is not None:
+            self.store.set(key, value, time.time() + ttl)
+
+    async def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Tuple[Any, bool]]:
+        """
+        Look up several keys, reading memory misses from the disk store in one
+        query off the event loop.
+
+        Returns:
+            Dict of key -> (value, is_fresh) for the keys that are cached
+        """
+        found: Dict[Hashable, Tuple[Any, float]] = {}
+        misses: List[Hashable] = []
+        for key in keys:
+            entry = self._data.get(key)
+            if entry is None:
+                misses.append(key)
+            else:
+                self._data.move_to_end(key)
+                found[key] = entry
+
+        if misses and self.store is not None:
+            stored = await asyncio.to_thread(self.store.get_many, misses)
+            now, wall_now = time.monotonic(), time.time()
+            for key, (value, expires_at) in stored.items():
+                # Convert the stored wall-clock expiry to this process's monotonic clock
+                entry = (value, now + (expires_at - wall_now))
+                self._remember(key, *entry)
+                found[key] = entry
+
+        now = time.monotonic()
+        return {key: (value, now < expires_at) for key, (value, expires_at) in found.items()}
+
+    async def set_many(self, items: Dict[Hashable, Any], ttl: float) -> None:
+        """Store several values that stay fresh for ``ttl`` seconds, in one disk write."""
+        expires_at = time.monotonic() + ttl
+        for key, value in items.items():
+            self._remember(key, value, expires_at)
+        if self.store is not None and items:
+            wall_expires_at = time.time() + ttl
+            await asyncio.to_thread(
+                self.store.set_many, [(key, value, wall_expires_at) for key, value in items.items()]
+            )
+
+    def _remember(self, key: Hashable, value: Any, expires_at: float) -> None:
+        """Put an entry in memory, evicting the least recently used past maxsize."""
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def _load(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """Load an entry from the disk store into memory, if there is one."""
+        if self.store is None:
+            return None
+
+        value, expires_at = self.store.get(key)
+        if value is MISSING:
+            return None
+
+        # Convert the stored wall-clock expiry to this process's monotonic clock
+        entry = (value, time.monotonic() + (expires_at - time.time()))
+        self._remember(key, *entry)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk store is left as is)."""
+        self._data.clear()
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """
+        Return the cached value for ``key``, fetching it on a miss.
+
+        Fresh hits are returned directly. Stale hits are returned immediately
+        while ``fetch`` runs in the background to replace them.
+        """
+        value, fresh = (await self.get_many([key])).get(key, (MISSING, False))
+        if value is MISSING:
+            value = await fetch()
+            await self.set_many({key: value}, ttl)
+        elif not fresh:
+            self._schedule_refresh(key, fetch, ttl)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]], ttl: float) -> None:
+        """Refresh a stale entry in the background (at most one refresh per key)."""
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self.set_many({key: await fetch()}, ttl)
+            except Exception as e:
+                # Keep serving the stale value; the next access retries
+                logger.warning("Background refresh failed for %s: %s", key, e)
+            finally:
+                self._refreshing.discard(key)
+
+        self._refreshing.add(key)
+        task = asyncio.create_task(refresh())
+        # Hold a reference so the task isn't garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+def swr_cached(endpoint: str, ttl: float, key: Callable[..., Hashable]):
+    """
+    Cache an async client method in ``self._cache`` with stale-while-revalidate.
+
+    Entries are keyed on ``(endpoint, key(self, *args, **kwargs))``. Exceptions
+    are never cached, so decorate the method that raises on failure rather
+    than the one that falls back to default data.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache_key = (endpoint, key(self, *args, **kwargs))
+            return await self._cache.get_or_fetch(cache_key, lambda: func(self, *args, **kwargs), ttl)
+        return wrapper
+    return decorator
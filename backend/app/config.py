@@ -3,37 +3,39 @@ Configuration settings for the Vancouver Route Recommendation System.
 Handles environment variables and API configurations.
 """
 
-import os
+import functools
 from typing import List
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     # API Keys
-    google_maps_api_key: str = os.getenv("GOOGLE_MAPS_API_KEY", "")
-    translink_api_key: str = os.getenv("TRANSLINK_API_KEY", "")
-    lime_api_key: str = os.getenv("LIME_API_KEY", "")
-    openweather_api_key: str = os.getenv("OPENWEATHER_API_KEY", "")
+    # Fields are read from the matching environment variables (case-insensitive)
+    # when Settings is instantiated, not at import time
+    google_maps_api_key: str = ""
+    translink_api_key: str = ""
+    lime_api_key: str = ""
+    openweather_api_key: str = ""
 
     # Database
-    database_url: str = os.getenv("DATABASE_URL", "sqlite:///./route_recommendation.db")
+    database_url: str = "sqlite:///./route_recommendation.db"
+
+    # Directory for the persistent API response cache; empty disables it
+    cache_dir: str = ".cache"
 
     # Application settings
-    debug: bool = os.getenv("DEBUG", "True").lower() == "true"
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    cors_origins: List[str] = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8080,http://10.0.0.225:3000").split(",")
+    debug: bool = True
+    log_level: str = "INFO"
+    cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8080", "http://10.0.0.225:3000"]
 
     # Gamification settings
-    sustainability_points_bike: int = int(os.getenv("SUSTAINABILITY_POINTS_BIKE", "10"))
-    sustainability_points_walk: int = int(os.getenv("SUSTAINABILITY_POINTS_WALK", "15"))
-    sustainability_points_transit: int = int(os.getenv("SUSTAINABILITY_POINTS_TRANSIT", "8"))
-    sustainability_points_car: int = int(os.getenv("SUSTAINABILITY_POINTS_CAR", "0"))
+    sustainability_points_bike: int = 10
+    sustainability_points_walk: int = 15
+    sustainability_points_transit: int = 8
+    sustainability_points_car: int = 0
 
     # Vancouver-specific settings
     vancouver_bounds: dict = {
@@ -55,8 +57,16 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first access.
+
+    Call ``get_settings.cache_clear()`` to pick up changed environment variables.
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+    return Settings()
 
 
 def validate_api_keys() -> dict:
@@ -64,6 +74,19 @@ def validate_api_keys() -> dict:
     Validate that required API keys are present.
     Returns a dictionary with validation results.
     """
+    settings = get_settings()
+    # Copy so callers can't mutate the cached result
+    return dict(_validate_keys(
+        settings.google_maps_api_key,
+        settings.translink_api_key,
+        settings.lime_api_key,
+        settings.openweather_api_key
+    ))
+
+
+@functools.lru_cache(maxsize=1)
+def _validate_keys(google_maps_key: str, translink_key: str, lime_key: str, openweather_key: str) -> dict:
+    """Validate key values; cached on the values so it runs once per settings load."""
     # Check if keys are present and not placeholder values
     def is_valid_key(key_value: str) -> bool:
         if not key_value:
@@ -76,10 +99,10 @@ def validate_api_keys() -> dict:
         return not any(pattern in key_lower for pattern in placeholder_patterns)
 
     validation_results = {
-        "google_maps": is_valid_key(settings.google_maps_api_key),
-        "translink": is_valid_key(settings.translink_api_key),
-        "lime": is_valid_key(settings.lime_api_key),
-        "openweather": is_valid_key(settings.openweather_api_key),
+        "google_maps": is_valid_key(google_maps_key),
+        "translink": is_valid_key(translink_key),
+        "lime": is_valid_key(lime_key),
+        "openweather": is_valid_key(openweather_key),
         "all_required": True
     }
 
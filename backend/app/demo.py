@@ -3,16 +3,107 @@ Demo mode for Route Recommendation System.
 Provides sample data and functionality when API keys are not available.
 """
 
+import functools
+import math
 import random
 import uuid
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from collections import defaultdict
 from datetime import datetime
 
+import numpy as np
+
 from .models import (
     Point, Route, RouteStep, RouteRequest, RouteResponse,
     TransportMode, RoutePreference, WeatherData, WeatherCondition
 )
 
+# Shared generator so random demo values are drawn in batches rather than one call per value
+_rng = np.random.default_rng()
+
+# Meters per degree of arc on the sphere used by Point.distance_to
+_METERS_PER_DEGREE = math.radians(6371000)
+
+
+def _cheap_distance(p1: Point, p2: Point) -> float:
+    """
+    Approximate distance in meters using an equirectangular projection.
+
+    Within 0.1% of Point.distance_to (haversine) at metro Vancouver scale,
+    with one trig call instead of six.
+    """
+    dx = (p2.lng - p1.lng) * math.cos(math.radians((p1.lat + p2.lat) * 0.5))
+    dy = p2.lat - p1.lat
+    return math.hypot(dx, dy) * _METERS_PER_DEGREE
+
+
+def _build_token_index(names: Tuple[str, ...]) -> Dict[str, Tuple[int, ...]]:
+    """Map each word in the location names to the positions of the names containing it."""
+    index: Dict[str, List[int]] = defaultdict(list)
+    for position, name in enumerate(names):
+        for token in set(name.split()):
+            index[token].append(position)
+    return {token: tuple(positions) for token, positions in index.items()}
+
+
+# All route preferences in declaration order, materialized once
+_ALL_PREFERENCES = tuple(RoutePreference)
+
+# Transport modes used for demo steps, per preference
+_MODES_BY_PREFERENCE = {
+    RoutePreference.FASTEST: (TransportMode.CAR, TransportMode.SKYTRAIN, TransportMode.BUS),
+    RoutePreference.SAFEST: (TransportMode.WALKING, TransportMode.BUS, TransportMode.SKYTRAIN),
+    RoutePreference.ENERGY_EFFICIENT: (TransportMode.WALKING, TransportMode.BIKING, TransportMode.BUS),
+    RoutePreference.SCENIC: (TransportMode.WALKING, TransportMode.BIKING, TransportMode.SCOOTER),
+    RoutePreference.HEALTHY: (TransportMode.WALKING, TransportMode.BIKING),
+    RoutePreference.CHEAPEST: (TransportMode.WALKING, TransportMode.BUS)
+}
+_DEFAULT_MODES = (TransportMode.WALKING, TransportMode.BUS)
+
+# Template for demo station locations; copies skip Point validation
+_POINT_PROTO = Point.model_construct(lat=0.0, lng=0.0)
+
+# Directions used in demo step instructions
+_COMPASS_DIRECTIONS = ("north", "south", "east", "west", "northeast", "northwest", "southeast", "southwest")
+
+# Sustainability points earned per km by mode
+_POINTS_PER_KM = {
+    TransportMode.WALKING: 15,
+    TransportMode.BIKING: 10,
+    TransportMode.SCOOTER: 8,
+    TransportMode.BUS: 8,
+    TransportMode.SKYTRAIN: 8,
+    TransportMode.CAR: 0
+}
+
+# Demo route scores per preference
+_SAFETY_SCORES = {
+    RoutePreference.SAFEST: 0.95,
+    RoutePreference.HEALTHY: 0.90,
+    RoutePreference.ENERGY_EFFICIENT: 0.85,
+    RoutePreference.SCENIC: 0.80,
+    RoutePreference.CHEAPEST: 0.75,
+    RoutePreference.FASTEST: 0.70
+}
+
+_ENERGY_SCORES = {
+    RoutePreference.ENERGY_EFFICIENT: 0.95,
+    RoutePreference.HEALTHY: 0.90,
+    RoutePreference.SCENIC: 0.85,
+    RoutePreference.SAFEST: 0.80,
+    RoutePreference.CHEAPEST: 0.75,
+    RoutePreference.FASTEST: 0.60
+}
+
+_SCENIC_SCORES = {
+    RoutePreference.SCENIC: 0.95,
+    RoutePreference.HEALTHY: 0.85,
+    RoutePreference.ENERGY_EFFICIENT: 0.80,
+    RoutePreference.SAFEST: 0.75,
+    RoutePreference.CHEAPEST: 0.70,
+    RoutePreference.FASTEST: 0.60
+}
+
 
 class DemoDataProvider:
     """Provides demo data for testing without API keys."""
@@ -51,6 +142,11 @@ class DemoDataProvider:
         "airport": Point(lat=49.1967, lng=-123.1815),
     }
 
+    # Location names and points as tuples, built once for geocoding lookups
+    _LOC_KEYS = tuple(VANCOUVER_LOCATIONS)
+    _LOC_VALUES = tuple(VANCOUVER_LOCATIONS.values())
+    _TOKEN_INDEX = _build_token_index(_LOC_KEYS)
+
     # Transport mode speeds (km/h)
     MODE_SPEEDS = {
         TransportMode.WALKING: 5.0,
@@ -87,50 +183,83 @@ class DemoDataProvider:
         (TransportMode.BUS, TransportMode.CAR): 240,
     }
 
+    # Modes by integer ID (position in TransportMode) and speeds as an array indexed by ID,
+    # so step speeds are looked up with one NumPy index instead of a dict probe per step
+    _MODE_LIST = tuple(TransportMode)
+    _MODE_SPEED_TABLE = np.array(list(map(MODE_SPEEDS.get, TransportMode)), dtype=np.float64)  # NaN if no speed
+
+    # Mode IDs available to each preference
+    _PREFERENCE_MODE_IDS = {
+        preference: np.array([tuple(TransportMode).index(mode) for mode in modes])
+        for preference, modes in _MODES_BY_PREFERENCE.items()
+    }
+    _DEFAULT_MODE_IDS = np.array(list(map(_MODE_LIST.index, _DEFAULT_MODES)))
+
     @classmethod
     def geocode_address(cls, address: str) -> Optional[Point]:
         """Demo geocoding - returns coordinates for known Vancouver locations."""
-        address_lower = address.lower().strip()
+        point = cls._match_location(address.lower().strip())
+        if point is not None:
+            return point
+
+        # If no match found, return a random Vancouver location
+        return random.choice(cls._LOC_VALUES)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _match_location(address_lower: str) -> Optional[Point]:
+        """Find the known location matching a normalized address (cached per address)."""
+        locations = DemoDataProvider.VANCOUVER_LOCATIONS
 
         # Direct match
-        if address_lower in cls.VANCOUVER_LOCATIONS:
-            return cls.VANCOUVER_LOCATIONS[address_lower]
+        if address_lower in locations:
+            return locations[address_lower]
 
-        # Partial matches
-        for location, point in cls.VANCOUVER_LOCATIONS.items():
-            if any(word in location for word in address_lower.split()):
-                return point
+        # The first location in table order containing any query word wins, as a
+        # whole word or a substring (e.g. "gran" for "granville island"). A whole
+        # word always matches as a substring too, so the word index bounds the
+        # substring scan to the locations before the first whole-word match.
+        words = set(address_lower.split())
+        token_index = DemoDataProvider._TOKEN_INDEX
+        positions = [position for word in words for position in token_index.get(word, ())]
+        first_word_match = min(positions, default=len(DemoDataProvider._LOC_KEYS))
 
-        # If no match found, return a random Vancouver location
-        return random.choice(list(cls.VANCOUVER_LOCATIONS.values()))
+        for position in range(first_word_match):
+            if any(word in DemoDataProvider._LOC_KEYS[position] for word in words):
+                return DemoDataProvider._LOC_VALUES[position]
+
+        return DemoDataProvider._LOC_VALUES[first_word_match] if positions else None
 
     @classmethod
     def generate_demo_routes(cls, request: RouteRequest) -> RouteResponse:
-        """Generate demo routes for testing without API keys."""
-        # Calculate distance between origin and destination
-        distance = request.origin.distance_to(request.destination)
+        """
+        Generate demo routes for testing without API keys.
 
-        # Generate routes for each preference
-        routes = []
-
-        for preference in request.preferences:
-            route_id = str(uuid.uuid4())
+        Routes, steps and points are built with ``model_construct``: every value
+        is generated here and already valid, so Pydantic validation is skipped.
+        """
+        # Calculate distance between origin and destination
+        distance = _cheap_distance(request.origin, request.destination)
 
-            # Generate steps based on preference
-            steps = cls._generate_demo_steps(request, preference, distance)
+        # One route per requested preference, plus a couple of alternatives with
+        # different preferences when fewer than three routes were requested
+        preferences = list(request.preferences)
+        primary_count = len(preferences)
+        if primary_count < 3:
+            requested = set(preferences)
+            preferences += [p for p in _ALL_PREFERENCES if p not in requested][:2]
 
-            # Calculate totals
-            total_distance = sum(step.distance for step in steps)
-            total_time = sum(step.estimated_time for step in steps)
-            total_sustainability_points = sum(step.sustainability_points for step in steps)
+        routes = []
+        alternatives = []
 
-            # Calculate scores based on preference
-            safety_score = cls._get_demo_safety_score(preference)
-            energy_efficiency = cls._get_demo_energy_efficiency(preference)
-            scenic_score = cls._get_demo_scenic_score(preference)
+        for index, preference in enumerate(preferences):
+            # Generate steps and their totals based on preference
+            steps, total_distance, total_time, total_sustainability_points = cls._generate_demo_steps(
+                request, preference, distance
+            )
 
-            route = Route(
-                id=route_id,
+            route = Route.model_construct(
+                id=uuid.uuid4().hex,
                 origin=request.origin,
                 destination=request.destination,
                 steps=steps,
@@ -138,36 +267,12 @@ class DemoDataProvider:
                 total_time=total_time,
                 total_sustainability_points=total_sustainability_points,
                 preference=preference,
-                safety_score=safety_score,
-                energy_efficiency=energy_efficiency,
-                scenic_score=scenic_score
+                safety_score=cls._get_demo_safety_score(preference),
+                energy_efficiency=cls._get_demo_energy_efficiency(preference),
+                scenic_score=cls._get_demo_scenic_score(preference)
             )
 
-            routes.append(route)
-
-        # Generate a few alternative routes
-        alternatives = []
-        if len(routes) < 3:
-            # Add some alternative routes with different preferences
-            alt_preferences = [p for p in RoutePreference if p not in request.preferences]
-            for alt_pref in alt_preferences[:2]:
-                route_id = str(uuid.uuid4())
-                steps = cls._generate_demo_steps(request, alt_pref, distance)
-
-                route = Route(
-                    id=route_id,
-                    origin=request.origin,
-                    destination=request.destination,
-                    steps=steps,
-                    total_distance=sum(step.distance for step in steps),
-                    total_time=sum(step.estimated_time for step in steps),
-                    total_sustainability_points=sum(step.sustainability_points for step in steps),
-                    preference=alt_pref,
-                    safety_score=cls._get_demo_safety_score(alt_pref),
-                    energy_efficiency=cls._get_demo_energy_efficiency(alt_pref),
-                    scenic_score=cls._get_demo_scenic_score(alt_pref)
-                )
-                alternatives.append(route)
+            (routes if index < primary_count else alternatives).append(route)
 
         return RouteResponse(
             routes=routes,
@@ -177,49 +282,52 @@ class DemoDataProvider:
         )
 
     @classmethod
-    def _generate_demo_steps(cls, request: RouteRequest, preference: RoutePreference, total_distance: float) -> List[RouteStep]:
-        """Generate demo route steps based on preference."""
+    def _generate_demo_steps(
+        cls, request: RouteRequest, preference: RoutePreference, total_distance: float
+    ) -> Tuple[List[RouteStep], float, int, int]:
+        """
+        Generate demo route steps based on preference.
+
+        Returns:
+            Tuple of (steps, total distance, total time, total sustainability points)
+        """
         steps = []
+        route_distance = 0.0
+        route_time = 0
+        route_points = 0
 
         # Choose transport modes based on preference
-        if preference == RoutePreference.FASTEST:
-            modes = [TransportMode.CAR, TransportMode.SKYTRAIN, TransportMode.BUS]
-        elif preference == RoutePreference.SAFEST:
-            modes = [TransportMode.WALKING, TransportMode.BUS, TransportMode.SKYTRAIN]
-        elif preference == RoutePreference.ENERGY_EFFICIENT:
-            modes = [TransportMode.WALKING, TransportMode.BIKING, TransportMode.BUS]
-        elif preference == RoutePreference.SCENIC:
-            modes = [TransportMode.WALKING, TransportMode.BIKING, TransportMode.SCOOTER]
-        elif preference == RoutePreference.HEALTHY:
-            modes = [TransportMode.WALKING, TransportMode.BIKING]
-        elif preference == RoutePreference.CHEAPEST:
-            modes = [TransportMode.WALKING, TransportMode.BUS]
-        else:
-            modes = [TransportMode.WALKING, TransportMode.BUS]
+        preference_mode_ids = cls._PREFERENCE_MODE_IDS.get(preference, cls._DEFAULT_MODE_IDS)
 
         # Generate 2-4 steps
-        num_steps = random.randint(2, 4)
+        num_steps = int(_rng.integers(2, 5))
         step_distance = total_distance / num_steps
+        step_km = step_distance / 1000
+
+        # Draw every step's mode, direction and slope (random for demo) up front
+        mode_ids = preference_mode_ids[_rng.integers(0, len(preference_mode_ids), size=num_steps)]
+        direction_indices = _rng.integers(0, len(_COMPASS_DIRECTIONS), size=num_steps).tolist()
+        slopes = _rng.uniform(-3, 5, size=num_steps).tolist()
+
+        # Time for each step based on mode and distance (seconds)
+        estimated_times = (step_km / cls._MODE_SPEED_TABLE[mode_ids] * 3600).astype(np.int64).tolist()
+        mode_ids = mode_ids.tolist()
+
+        # Step end points (simplified - evenly spaced on the line towards the destination)
+        o_lat, o_lng = request.origin.lat, request.origin.lng
+        d_lat, d_lng = request.destination.lat, request.destination.lng
+        progress = np.arange(1, num_steps + 1, dtype=np.float64) / num_steps
+        lats = (o_lat + (d_lat - o_lat) * progress).tolist()
+        lngs = (o_lng + (d_lng - o_lng) * progress).tolist()
 
         current_point = request.origin
 
         for i in range(num_steps):
             # Choose mode for this step
-            mode = random.choice(modes)
-
-            # Calculate next point (simplified - just move towards destination)
-            progress = (i + 1) / num_steps
-            lat_diff = request.destination.lat - request.origin.lat
-            lng_diff = request.destination.lng - request.origin.lng
-
-            next_point = Point(
-                lat=request.origin.lat + (lat_diff * progress),
-                lng=request.origin.lng + (lng_diff * progress)
-            )
+            mode = cls._MODE_LIST[mode_ids[i]]
 
-            # Calculate time based on mode and distance
-            mode_speed = cls.MODE_SPEEDS[mode]  # km/h
-            estimated_time = int((step_distance / 1000) / mode_speed * 3600)  # seconds
+            next_point = Point.model_construct(lat=lats[i], lng=lngs[i])
+            estimated_time = estimated_times[i]
 
             # Generate instructions
             if i == 0:
@@ -227,15 +335,12 @@ class DemoDataProvider:
             elif i == num_steps - 1:
                 instructions = f"Arrive at your destination"
             else:
-                directions = ["north", "south", "east", "west", "northeast", "northwest", "southeast", "southwest"]
-                direction = random.choice(directions)
-                instructions = f"Continue {step_distance/1000:.1f}km {direction} using {mode.value}"
+                instructions = f"Continue {step_km:.1f}km {_COMPASS_DIRECTIONS[direction_indices[i]]} using {mode.value}"
 
             # Calculate sustainability points
-            sustainability_points = cls._calculate_sustainability_points(mode, step_distance)
+            sustainability_points = int(step_km * _POINTS_PER_KM.get(mode, 0))
 
-            # Calculate slope (random for demo)
-            slope = random.uniform(-3, 5)
+            slope = slopes[i]
 
             # Determine effort level
             effort_level = "moderate"
@@ -244,8 +349,7 @@ class DemoDataProvider:
             elif slope < -1:
                 effort_level = "low"
 
-            step = RouteStep(
-                id=str(uuid.uuid4()),
+            step = RouteStep.model_construct(
                 mode=mode,
                 distance=step_distance,
                 estimated_time=estimated_time,
@@ -260,60 +364,26 @@ class DemoDataProvider:
             steps.append(step)
             current_point = next_point
 
-        return steps
+            route_distance += step_distance
+            route_time += estimated_time
+            route_points += sustainability_points
 
-    @classmethod
-    def _calculate_sustainability_points(cls, mode: TransportMode, distance: float) -> int:
-        """Calculate sustainability points for a route step."""
-        points_per_km = {
-            TransportMode.WALKING: 15,
-            TransportMode.BIKING: 10,
-            TransportMode.SCOOTER: 8,
-            TransportMode.BUS: 8,
-            TransportMode.SKYTRAIN: 8,
-            TransportMode.CAR: 0
-        }
-
-        return int((distance / 1000) * points_per_km.get(mode, 0))
+        return steps, route_distance, route_time, route_points
 
     @classmethod
     def _get_demo_safety_score(cls, preference: RoutePreference) -> float:
         """Get demo safety score based on preference."""
-        scores = {
-            RoutePreference.SAFEST: 0.95,
-            RoutePreference.HEALTHY: 0.90,
-            RoutePreference.ENERGY_EFFICIENT: 0.85,
-            RoutePreference.SCENIC: 0.80,
-            RoutePreference.CHEAPEST: 0.75,
-            RoutePreference.FASTEST: 0.70
-        }
-        return scores.get(preference, 0.80)
+        return _SAFETY_SCORES.get(preference, 0.80)
 
     @classmethod
     def _get_demo_energy_efficiency(cls, preference: RoutePreference) -> float:
         """Get demo energy efficiency score based on preference."""
-        scores = {
-            RoutePreference.ENERGY_EFFICIENT: 0.95,
-            RoutePreference.HEALTHY: 0.90,
-            RoutePreference.SCENIC: 0.85,
-            RoutePreference.SAFEST: 0.80,
-            RoutePreference.CHEAPEST: 0.75,
-            RoutePreference.FASTEST: 0.60
-        }
-        return scores.get(preference, 0.80)
+        return _ENERGY_SCORES.get(preference, 0.80)
 
     @classmethod
     def _get_demo_scenic_score(cls, preference: RoutePreference) -> float:
         """Get demo scenic score based on preference."""
-        scores = {
-            RoutePreference.SCENIC: 0.95,
-            RoutePreference.HEALTHY: 0.85,
-            RoutePreference.ENERGY_EFFICIENT: 0.80,
-            RoutePreference.SAFEST: 0.75,
-            RoutePreference.CHEAPEST: 0.70,
-            RoutePreference.FASTEST: 0.60
-        }
-        return scores.get(preference, 0.75)
+        return _SCENIC_SCORES.get(preference, 0.75)
 
     @classmethod
     def get_demo_weather_data(cls) -> WeatherData:
@@ -325,26 +395,33 @@ class DemoDataProvider:
             WeatherCondition.SNOW
         ]
 
-        return WeatherData(
-            temperature=random.uniform(5, 25),  # Vancouver temperature range
-            condition=random.choice(conditions),
-            humidity=random.uniform(40, 90),
-            wind_speed=random.uniform(5, 25),
-            visibility=random.uniform(5, 15),
-            uv_index=random.uniform(0, 10),
+        # Temperature (Vancouver range), humidity, wind speed, visibility
+        temperature, humidity, wind_speed, visibility = _rng.uniform([5, 40, 5, 5], [25, 90, 25, 15]).tolist()
+
+        return WeatherData.model_construct(
+            temperature=temperature,
+            condition=conditions[_rng.integers(len(conditions))],
+            humidity=humidity,
+            wind_speed=wind_speed,
+            precipitation=0.0,
+            visibility=visibility,
             timestamp=datetime.now()
         )
 
     @classmethod
     def get_demo_traffic_data(cls) -> List[Dict]:
         """Get demo traffic data."""
+        levels = ["low", "moderate", "high"]
+        speeds = _rng.uniform(20, 60, size=5).tolist()
+        level_indices = _rng.integers(0, len(levels), size=5).tolist()
+        now = datetime.now()
         return [
             {
                 "edge_id": f"demo_edge_{i}",
-                "current_speed": random.uniform(20, 60),
+                "current_speed": speeds[i],
                 "free_flow_speed": 50,
-                "congestion_level": random.choice(["low", "moderate", "high"]),
-                "timestamp": datetime.now()
+                "congestion_level": levels[level_indices[i]],
+                "timestamp": now
             }
             for i in range(5)
         ]
@@ -352,12 +429,13 @@ class DemoDataProvider:
     @classmethod
     def get_demo_road_closures(cls) -> List[Dict]:
         """Get demo road closure data."""
+        now = datetime.now()
         return [
             {
                 "road_name": "Demo Street",
                 "closure_type": "construction",
-                "start_time": datetime.now(),
-                "end_time": datetime.now(),
+                "start_time": now,
+                "end_time": now,
                 "description": "Demo road closure for testing"
             }
         ]
@@ -378,20 +456,166 @@ class DemoDataProvider:
     @classmethod
     def get_demo_bike_share_data(cls) -> List[Dict]:
         """Get demo bike/scooter share data."""
+        bikes = _rng.integers(0, 21, size=10).tolist()
+        scooters = _rng.integers(0, 11, size=10).tolist()
+        lats = (49.2827 + _rng.uniform(-0.1, 0.1, size=10)).tolist()
+        lngs = (-123.1207 + _rng.uniform(-0.1, 0.1, size=10)).tolist()
         return [
             {
                 "station_id": f"demo_station_{i}",
-                "available_bikes": random.randint(0, 20),
-                "available_scooters": random.randint(0, 10),
-                "location": Point(
-                    lat=49.2827 + random.uniform(-0.1, 0.1),
-                    lng=-123.1207 + random.uniform(-0.1, 0.1)
-                )
+                "available_bikes": bikes[i],
+                "available_scooters": scooters[i],
+                "location": _POINT_PROTO.model_copy(update={"lat": lats[i], "lng": lngs[i]})
             }
             for i in range(10)
         ]
 
 
+# Bonus reward points per route preference
+_PREFERENCE_BONUSES = {
+    RoutePreference.ENERGY_EFFICIENT: 50,
+    RoutePreference.HEALTHY: 40,
+    RoutePreference.SCENIC: 30,
+    RoutePreference.SAFEST: 25,
+    RoutePreference.CHEAPEST: 20,
+    RoutePreference.FASTEST: 10
+}
+
+# CO2 saved per meter travelled (0.2 kg per km)
+_CO2_KG_PER_METER = 0.0002
+
+# Static gamification catalogs, built once and shared by every call
+_DEMO_ACHIEVEMENTS = (
+    {
+        "id": "first_route",
+        "name": "First Steps",
+        "description": "Complete your first route",
+        "icon": "🚶",
+        "points_reward": 10
+    },
+    {
+        "id": "eco_warrior",
+        "name": "Eco Warrior",
+        "description": "Earn 100+ sustainability points in a single route",
+        "icon": "🌱",
+        "points_reward": 50
+    },
+    {
+        "id": "speed_demon",
+        "name": "Speed Demon",
+        "description": "Complete 10 fastest routes",
+        "icon": "⚡",
+        "points_reward": 30
+    },
+    {
+        "id": "scenic_explorer",
+        "name": "Scenic Explorer",
+        "description": "Complete 5 scenic routes",
+        "icon": "🏞️",
+        "points_reward": 40
+    },
+    {
+        "id": "health_enthusiast",
+        "name": "Health Enthusiast",
+        "description": "Complete 10 healthy routes",
+        "icon": "💪",
+        "points_reward": 60
+    }
+)
+
+_DEMO_BADGES = (
+    {
+        "id": "vancouver_explorer",
+        "name": "Vancouver Explorer",
+        "description": "Explore all major Vancouver neighborhoods",
+        "icon": "🏙️",
+        "rarity": "common"
+    },
+    {
+        "id": "sustainability_champion",
+        "name": "Sustainability Champion",
+        "description": "Earn 1000+ sustainability points",
+        "icon": "🌍",
+        "rarity": "rare"
+    },
+    {
+        "id": "multi_modal_master",
+        "name": "Multi-Modal Master",
+        "description": "Use all transportation modes",
+        "icon": "🚌",
+        "rarity": "epic"
+    },
+    {
+        "id": "weather_warrior",
+        "name": "Weather Warrior",
+        "description": "Complete routes in all weather conditions",
+        "icon": "🌧️",
+        "rarity": "legendary"
+    }
+)
+
+_DEMO_DAILY_CHALLENGES = (
+    {
+        "id": "walk_5km",
+        "name": "Walk 5km Today",
+        "description": "Complete a 5km walking route",
+        "reward_points": 25,
+        "progress": 0,
+        "target": 5000,
+        "unit": "meters"
+    },
+    {
+        "id": "eco_route",
+        "name": "Eco-Friendly Route",
+        "description": "Complete an energy-efficient route",
+        "reward_points": 30,
+        "progress": 0,
+        "target": 1,
+        "unit": "routes"
+    },
+    {
+        "id": "explore_neighborhood",
+        "name": "Explore New Neighborhood",
+        "description": "Visit a new Vancouver neighborhood",
+        "reward_points": 40,
+        "progress": 0,
+        "target": 1,
+        "unit": "neighborhoods"
+    }
+)
+
+_DEMO_SUSTAINABILITY_TIPS = (
+    {
+        "id": "walking_tip",
+        "title": "Walk for Short Trips",
+        "description": "Walking for trips under 1km can save significant emissions and improve your health.",
+        "category": "transportation",
+        "impact": "high"
+    },
+    {
+        "id": "bike_tip",
+        "title": "Use Bike Lanes",
+        "description": "Vancouver has extensive bike lane networks. Use them for safer and more efficient cycling.",
+        "category": "safety",
+        "impact": "medium"
+    },
+    {
+        "id": "transit_tip",
+        "title": "Combine Transit Modes",
+        "description": "Combine walking, biking, and transit for the most efficient and sustainable journeys.",
+        "category": "efficiency",
+        "impact": "high"
+    },
+    {
+        "id": "weather_tip",
+        "title": "Check Weather Before You Go",
+        "description": "Plan your route based on weather conditions to ensure a comfortable and safe journey.",
+        "category": "planning",
+        "impact": "medium"
+    }
+)
+
+
 class DemoGamificationProvider:
     """Provides demo gamification data."""
 
@@ -402,16 +626,7 @@ class DemoGamificationProvider:
         sustainability_points = route.total_sustainability_points
 
         # Bonus points for different preferences
-        preference_bonuses = {
-            RoutePreference.ENERGY_EFFICIENT: 50,
-            RoutePreference.HEALTHY: 40,
-            RoutePreference.SCENIC: 30,
-            RoutePreference.SAFEST: 25,
-            RoutePreference.CHEAPEST: 20,
-            RoutePreference.FASTEST: 10
-        }
-
-        bonus_points = preference_bonuses.get(route.preference, 0)
+        bonus_points = _PREFERENCE_BONUSES.get(route.preference, 0)
         total_points = sustainability_points + bonus_points
 
         # Random achievements and badges for demo
@@ -434,7 +649,7 @@ class DemoGamificationProvider:
 
         return {
             "sustainability_points": total_points,
-            "co2_saved": round(route.total_distance / 1000 * 0.2, 2),  # kg CO2
+            "co2_saved": round(route.total_distance * _CO2_KG_PER_METER, 2),  # kg CO2
             "achievements_unlocked": achievements_unlocked,
             "badges_earned": badges_earned,
             "level_up": total_points > 500,
@@ -442,158 +657,39 @@ class DemoGamificationProvider:
         }
 
     @classmethod
-    def get_demo_achievements(cls) -> List[Dict]:
+    def get_demo_achievements(cls) -> Tuple[Dict, ...]:
         """Get demo achievements."""
-        return [
-            {
-                "id": "first_route",
-                "name": "First Steps",
-                "description": "Complete your first route",
-                "icon": "🚶",
-                "points_reward": 10
-            },
-            {
-                "id": "eco_warrior",
-                "name": "Eco Warrior",
-                "description": "Earn 100+ sustainability points in a single route",
-                "icon": "🌱",
-                "points_reward": 50
-            },
-            {
-                "id": "speed_demon",
-                "name": "Speed Demon",
-                "description": "Complete 10 fastest routes",
-                "icon": "⚡",
-                "points_reward": 30
-            },
-            {
-                "id": "scenic_explorer",
-                "name": "Scenic Explorer",
-                "description": "Complete 5 scenic routes",
-                "icon": "🏞️",
-                "points_reward": 40
-            },
-            {
-                "id": "health_enthusiast",
-                "name": "Health Enthusiast",
-                "description": "Complete 10 healthy routes",
-                "icon": "💪",
-                "points_reward": 60
-            }
-        ]
+        return _DEMO_ACHIEVEMENTS
 
     @classmethod
-    def get_demo_badges(cls) -> List[Dict]:
+    def get_demo_badges(cls) -> Tuple[Dict, ...]:
         """Get demo badges."""
-        return [
-            {
-                "id": "vancouver_explorer",
-                "name": "Vancouver Explorer",
-                "description": "Explore all major Vancouver neighborhoods",
-                "icon": "🏙️",
-                "rarity": "common"
-            },
-            {
-                "id": "sustainability_champion",
-                "name": "Sustainability Champion",
-                "description": "Earn 1000+ sustainability points",
-                "icon": "🌍",
-                "rarity": "rare"
-            },
-            {
-                "id": "multi_modal_master",
-                "name": "Multi-Modal Master",
-                "description": "Use all transportation modes",
-                "icon": "🚌",
-                "rarity": "epic"
-            },
-            {
-                "id": "weather_warrior",
-                "name": "Weather Warrior",
-                "description": "Complete routes in all weather conditions",
-                "icon": "🌧️",
-                "rarity": "legendary"
-            }
-        ]
+        return _DEMO_BADGES
 
     @classmethod
-    def get_demo_daily_challenges(cls) -> List[Dict]:
+    def get_demo_daily_challenges(cls) -> Tuple[Dict, ...]:
         """Get demo daily challenges."""
-        return [
-            {
-                "id": "walk_5km",
-                "name": "Walk 5km Today",
-                "description": "Complete a 5km walking route",
-                "reward_points": 25,
-                "progress": 0,
-                "target": 5000,
-                "unit": "meters"
-            },
-            {
-                "id": "eco_route",
-                "name": "Eco-Friendly Route",
-                "description": "Complete an energy-efficient route",
-                "reward_points": 30,
-                "progress": 0,
-                "target": 1,
-                "unit": "routes"
-            },
-            {
-                "id": "explore_neighborhood",
-                "name": "Explore New Neighborhood",
-                "description": "Visit a new Vancouver neighborhood",
-                "reward_points": 40,
-                "progress": 0,
-                "target": 1,
-                "unit": "neighborhoods"
-            }
-        ]
+        return _DEMO_DAILY_CHALLENGES
 
     @classmethod
     def get_demo_leaderboard(cls) -> List[Dict]:
         """Get demo leaderboard data."""
         names = ["Alex", "Jordan", "Casey", "Taylor", "Morgan", "Riley", "Avery", "Quinn", "Sage", "River"]
+        total_points = _rng.integers(1000, 5001, size=10).tolist()
+        routes_completed = _rng.integers(50, 201, size=10).tolist()
+        sustainability_scores = _rng.integers(80, 101, size=10).tolist()
         return [
             {
                 "rank": i + 1,
                 "username": names[i],
-                "total_points": random.randint(1000, 5000),
-                "routes_completed": random.randint(50, 200),
-                "sustainability_score": random.randint(80, 100)
+                "total_points": total_points[i],
+                "routes_completed": routes_completed[i],
+                "sustainability_score": sustainability_scores[i]
             }
             for i in range(10)
         ]
 
     @classmethod
-    def get_demo_sustainability_tips(cls) -> List[Dict]:
+    def get_demo_sustainability_tips(cls) -> Tuple[Dict, ...]:
         """Get demo sustainability tips."""
-        return [
-            {
-                "id": "walking_tip",
-                "title": "Walk for Short Trips",
-                "description": "Walking for trips under 1km can save significant emissions and improve your health.",
-                "category": "transportation",
-                "impact": "high"
-            },
-            {
-                "id": "bike_tip",
-                "title": "Use Bike Lanes",
-                "description": "Vancouver has extensive bike lane networks. Use them for safer and more efficient cycling.",
-                "category": "safety",
-                "impact": "medium"
-            },
-            {
-                "id": "transit_tip",
-                "title": "Combine Transit Modes",
-                "description": "Combine walking, biking, and transit for the most efficient and sustainable journeys.",
-                "category": "efficiency",
-                "impact": "high"
-            },
-            {
-                "id": "weather_tip",
-                "title": "Check Weather Before You Go",
-                "description": "Plan your route based on weather conditions to ensure a comfortable and safe journey.",
-                "category": "planning",
-                "impact": "medium"
-            }
-        ]
+        return _DEMO_SUSTAINABILITY_TIPS
@@ -196,7 +196,7 @@ class GamificationEngine:
             return False
 
         except (json.JSONDecodeError, KeyError) as e:
-            logger.error(f"Error evaluating achievement condition: {e}")
+            logger.error("Error evaluating achievement condition: %s", e)
             return False
 
     def _evaluate_badge_condition(self, badge: Badge, route: Route, user_profile: UserProfile) -> bool:
@@ -217,7 +217,7 @@ class GamificationEngine:
             return False
 
         except (json.JSONDecodeError, KeyError) as e:
-            logger.error(f"Error evaluating badge condition: {e}")
+            logger.error("Error evaluating badge condition: %s", e)
             return False
 
     def _check_level_up(self, user_profile: UserProfile, points_earned: int) -> bool:
@@ -4,47 +4,162 @@ Creates and manages the graph of streets, paths, and transit routes.
 """
 
 import networkx as nx
-from typing import List, Dict, Set, Tuple, Optional
+import numpy as np
+from typing import List, Dict, Hashable, Set, Tuple, Optional
+import functools
 import logging
 from datetime import datetime
 import asyncio
+import os
+import pickle
+import time
 
 # Optional imports with fallbacks
 try:
     import osmnx as ox
+    from osmnx._errors import InsufficientResponseError
     OSMNX_AVAILABLE = True
+    # OSMnx 2 takes bounding boxes as (west, south, east, north)
+    OSMNX_V2 = int(ox.__version__.split('.')[0]) >= 2
 except ImportError:
     OSMNX_AVAILABLE = False
+    OSMNX_V2 = True
     logging.warning("OSMnx not available. Using fallback network generation.")
 
+    class InsufficientResponseError(Exception):
+        """Stand-in for OSMnx's empty query result error."""
+
 try:
-    import geopandas as gpd
-    GEOPANDAS_AVAILABLE = True
+    import igraph as ig
+    IGRAPH_AVAILABLE = True
 except ImportError:
-    GEOPANDAS_AVAILABLE = False
-    logging.warning("GeoPandas not available. Using basic coordinate handling.")
+    IGRAPH_AVAILABLE = False
+
+try:
+    from pyproj import Transformer
+    PYPROJ_AVAILABLE = True
+except ImportError:
+    PYPROJ_AVAILABLE = False
+    logging.warning("pyproj not available. Assuming OSM coordinates are longitude/latitude.")
 
 from .models import (
     Node, Edge, Point, TransportMode, WeatherData, TrafficData,
     TransitData, BikeScooterData
 )
 from .api_clients import APIClientManager
-from .config import settings
+from .config import get_settings
+from .spatial_index import SpatialIndex, haversine, haversine_distances
 
 logger = logging.getLogger(__name__)
 
+# Column order of the per-mode edge cost arrays
+EDGE_MODES = tuple(TransportMode)
+MODE_COLUMNS = {mode: column for column, mode in enumerate(EDGE_MODES)}
+
+# Energy cost per meter, one entry per EDGE_MODES column
+_ENERGY_COSTS = {
+    TransportMode.WALKING: 0.1,  # Low energy cost
+    TransportMode.BIKING: 0.05,  # Very low energy cost
+    TransportMode.CAR: 0.5  # High energy cost
+}
+ENERGY_COST_PER_METER = np.array([_ENERGY_COSTS.get(mode, 0.2) for mode in EDGE_MODES])  # Medium by default
+
+# Edge fields whose current values live in the builder's edge columns; they are
+# left out of graph attributes and filled in on the models by get_edge
+DYNAMIC_EDGE_FIELDS = frozenset({"current_traffic_speed", "weather_penalty", "event_penalty", "energy_cost"})
+
+
+def _static_edge_attrs(edge: Edge) -> Dict:
+    """Graph attributes for an edge: its model fields without the dynamic ones."""
+    return {name: value for name, value in edge.__dict__.items() if name not in DYNAMIC_EDGE_FIELDS}
+
+
+def _tag_value(road_data: Dict, name: str) -> Hashable:
+    """Get an OSM tag as a hashable value (simplified edges can hold lists)."""
+    value = road_data.get(name, '')
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _shortest_parallel_edges(edges) -> List[Tuple[Hashable, Hashable, Dict]]:
+    """Keep only the shortest of parallel OSM edges, as (u, v, data) triples."""
+    shortest: Dict[Tuple[Hashable, Hashable], Dict] = {}
+    for u, v, _, data in edges:
+        current = shortest.get((u, v))
+        if current is None or data.get('length', np.inf) < current.get('length', np.inf):
+            shortest[(u, v)] = data
+    return [(u, v, data) for (u, v), data in shortest.items()]
+
+
+# How long a built graph saved to disk is reused (seconds)
+GRAPH_CACHE_TTL = 6 * 3600
+
+# Part of the cached graph's file name; bump it whenever the saved graph layout
+# changes so files written by older builds are never loaded
+GRAPH_CACHE_VERSION = 1
+
+# The OSM download area is split into an OSM_TILE_GRID x OSM_TILE_GRID grid of
+# tiles fetched in parallel; Overpass only serves a couple of queries per client
+# at once, so at most OSM_TILE_CONCURRENCY tiles are in flight
+OSM_TILE_GRID = 3
+OSM_TILE_CONCURRENCY = 2
+
+# OSM highway tags that make up the driveable street network
+DRIVE_HIGHWAYS = frozenset({
+    'motorway', 'motorway_link', 'trunk', 'trunk_link', 'primary', 'primary_link',
+    'secondary', 'secondary_link', 'tertiary', 'tertiary_link', 'residential',
+    'unclassified', 'living_street', 'service'
+})
+
+# OSM highway tags that can't be walked or cycled
+NON_WALK_HIGHWAYS = frozenset({
+    'motorway', 'motorway_link', 'trunk', 'trunk_link', 'abandoned', 'bus_guideway',
+    'construction', 'planned', 'proposed', 'raceway', 'razed'
+})
+
 
 class VancouverGraphBuilder:
     """Builds and manages the routing graph for Vancouver."""
 
-    def __init__(self):
-        self.graph = nx.MultiDiGraph()
+    def __init__(self, api_client: Optional[APIClientManager] = None):
+        # Routing only ever takes the cheapest edge between two nodes, so parallel
+        # edges are collapsed while building and a plain DiGraph suffices
+        self.graph = nx.DiGraph()
         self.nodes: Dict[str, Node] = {}
         self.edges: Dict[str, Edge] = {}
-        self.api_client = APIClientManager()
+
+        # Share the caller's API clients (and connection pool) when given one
+        self._owns_api_client = api_client is None
+        self.api_client = api_client or APIClientManager()
+
+        # Combined drive/walk OSM download shared by the street and pedestrian passes
+        self._osm_graph: Optional[nx.MultiDiGraph] = None
+
+        # Set when OSM data could not be used and the synthetic grid was built
+        # instead; such graphs are never cached so the next start retries OSM
+        self._used_fallback = False
+
+        # OSM node id -> our node id string, so every edge endpoint and graph key
+        # for a node shares one string object instead of re-stringifying the id
+        self._osm_node_ids: Dict[int, str] = {}
+
+        # Lazily built spatial indexes keyed by node type (None = all nodes)
+        self._spatial_indexes: Dict[Optional[str], SpatialIndex] = {}
+
+        # Per-edge dynamic costs stored column-wise, one row per entry of
+        # edge_ids. They are the only copy of those costs: self.edges and the
+        # graph keep the static edge descriptions, so read edges with get_edge
+        self._build_edge_columns()
+
+        # C-backed copy of the graph for shortest-path queries (needs python-igraph),
+        # plus per-mode (subgraph, edge weights) views of it keyed by mode (None = all
+        # edges); built by _build_igraph and dropped whenever the edge rows change
+        self.igraph = None
+        self._igraph_views: Dict[Optional[TransportMode], Tuple["ig.Graph", List[float]]] = {}
+        self._vertex_ids: List[str] = []
+        self._vertex_index: Dict[str, int] = {}
 
         # Vancouver bounding box
-        self.bounds = settings.vancouver_bounds
+        self.bounds = get_settings().vancouver_bounds
 
         # Transport mode speeds (km/h)
         self.mode_speeds = {
@@ -58,7 +173,7 @@ class VancouverGraphBuilder:
             TransportMode.WESTCOAST_EXPRESS: 60.0
         }
 
-    async def build_graph(self, center_point: Point, radius: int = 5000) -> nx.MultiDiGraph:
+    async def build_graph(self, center_point: Point, radius: int = 5000) -> nx.DiGraph:
         """
         Build the routing graph for Vancouver.
 
@@ -67,33 +182,82 @@ class VancouverGraphBuilder:
             radius: Radius in meters to include
 
         Returns:
-            NetworkX MultiDiGraph with nodes and edges
+            NetworkX DiGraph with nodes and edges
         """
-        logger.info(f"Building graph for Vancouver centered at {center_point}")
+        logger.info("Building graph for Vancouver centered at %s", center_point)
+
+        cache_path = self._graph_cache_path(center_point, radius)
+        if cache_path and await asyncio.to_thread(self._load_cached_graph, cache_path):
+            await self._update_edge_costs()
+            self._build_igraph()
+            logger.info("Loaded cached graph with %s nodes and %s edges", len(self.graph.nodes), len(self.graph.edges))
+            return self.graph
 
         try:
             # Download street network from OpenStreetMap
             await self._build_street_network(center_point, radius)
 
-            # Add transit stops and routes
-            await self._add_transit_network(center_point, radius)
-
-            # Add bike/scooter sharing stations
-            await self._add_shared_mobility_stations(center_point, radius)
-
-            # Add pedestrian paths and bike lanes
-            await self._add_pedestrian_bike_network(center_point, radius)
+            # Transit stops, bike/scooter sharing stations, and pedestrian paths
+            # only depend on the street network, so add them concurrently. Each
+            # stage updates the graph between awaits, so no locking is needed.
+            await asyncio.gather(
+                self._add_transit_network(center_point, radius),
+                self._add_shared_mobility_stations(center_point, radius),
+                self._add_pedestrian_bike_network(center_point, radius)
+            )
 
             # Update edge costs with real-time data
             await self._update_edge_costs()
+            self._build_igraph()
+
+            logger.info("Graph built with %s nodes and %s edges", len(self.graph.nodes), len(self.graph.edges))
 
-            logger.info(f"Graph built with {len(self.graph.nodes)} nodes and {len(self.graph.edges)} edges")
+            if cache_path and not self._used_fallback:
+                await asyncio.to_thread(self._save_cached_graph, cache_path)
             return self.graph
 
         except Exception as e:
-            logger.error(f"Error building graph: {e}")
+            logger.error("Error building graph: %s", e)
             raise
 
+    def _graph_cache_path(self, center_point: Point, radius: int) -> Optional[str]:
+        """Get the file a graph built for this area is cached in, if caching is enabled."""
+        cache_dir = get_settings().cache_dir
+        if not cache_dir:
+            return None
+        return os.path.join(
+            cache_dir, f"graph_v{GRAPH_CACHE_VERSION}_{center_point.lat:.4f}_{center_point.lng:.4f}_{radius}.pkl"
+        )
+
+    def _load_cached_graph(self, path: str) -> bool:
+        """Load a graph saved by _save_cached_graph if it is still fresh."""
+        try:
+            if time.time() - os.path.getmtime(path) > GRAPH_CACHE_TTL:
+                return False
+            with open(path, "rb") as f:
+                graph, nodes, edges = pickle.load(f)
+            self.graph, self.nodes, self.edges = graph, nodes, edges
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning("Could not load cached graph from %s: %s", path, e)
+            return False
+
+        self._spatial_indexes.clear()
+        return True
+
+    def _save_cached_graph(self, path: str):
+        """Save the built graph so later starts can skip downloading and rebuilding it."""
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            # Write to a temporary file first so readers never see a partial pickle
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump((self.graph, self.nodes, self.edges), f, protocol=5)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Could not cache graph to %s: %s", path, e)
+
     async def _build_street_network(self, center_point: Point, radius: int):
         """Build the street network using OpenStreetMap data."""
         if not OSMNX_AVAILABLE:
@@ -103,81 +267,172 @@ class VancouverGraphBuilder:
 
         try:
             # Configure OSMnx for Vancouver
-            ox.config(use_cache=True, log_console=False)
-
-            # Download street network
-            graph = ox.graph_from_point(
-                (center_point.lat, center_point.lng),
-                dist=radius,
-                network_type='drive',  # Includes all driveable roads
-                simplify=True
+            ox.settings.use_cache = True
+            ox.settings.log_console = False
+
+            # Download streets and paths in one pass; the pedestrian pass reuses it
+            graph = self._osm_graph = await self._download_osm_graph(center_point, radius)
+            drive_edges = _shortest_parallel_edges(
+                edge for edge in graph.edges(data=True, keys=True) if self._is_drive_road(edge[3])
             )
+            drive_node_ids = {u for u, _, _ in drive_edges} | {v for _, v, _ in drive_edges}
+
+            # Convert to our graph format, collecting nodes and edges for bulk insertion
+            street_ids = [
+                node_id for node_id, data in graph.nodes(data=True)
+                if node_id in drive_node_ids and 'x' in data and 'y' in data
+            ]
+            # Coordinates come straight out of NumPy as floats, so points skip validation
+            street_nodes: Dict[str, Node] = {}
+            for node_id, lat, lng in zip(street_ids, *self._osm_node_coords(graph, street_ids)):
+                node = Node(
+                    id=str(node_id),
+                    point=Point.model_construct(lat=lat, lng=lng),
+                    node_type="intersection",
+                    elevation=graph.nodes[node_id].get('elevation', 0)
+                )
 
-            # Convert to our graph format
-            for node_id, data in graph.nodes(data=True):
-                if 'x' in data and 'y' in data:
-                    # Convert from UTM to lat/lng
-                    if GEOPANDAS_AVAILABLE:
-                        from shapely.geometry import Point as ShapelyPoint
-                        point_geom = ShapelyPoint(data['x'], data['y'])
-                        lat, lng = ox.projection.project_geometry(
-                            point_geom,
-                            from_crs=graph.graph['crs'],
-                            to_crs='EPSG:4326'
-                        ).centroid.coords[0]
-                    else:
-                        # Simple approximation for demo purposes
-                        lat = center_point.lat + (data['y'] - center_point.lat) * 0.00001
-                        lng = center_point.lng + (data['x'] - center_point.lng) * 0.00001
-
-                    node = Node(
-                        id=str(node_id),
-                        point=Point(lat=lat, lng=lng),
-                        node_type="intersection",
-                        elevation=data.get('elevation', 0)
-                    )
+                street_nodes[node.id] = node
+                self._osm_node_ids[node_id] = node.id
+
+            # Node graph attributes are the models' field values as-is (NetworkX copies
+            # the dict), which skips re-serializing already validated models
+            self.nodes.update(street_nodes)
+            self.graph.add_nodes_from((node_id, node.__dict__) for node_id, node in street_nodes.items())
+
+            # Add edges, computing all their lengths in one vectorized pass
+            osm_ids = self._osm_node_ids
+            osm_edges = [
+                (osm_ids[u], osm_ids[v], data)
+                for u, v, data in drive_edges
+                if u in osm_ids and v in osm_ids
+            ]
+            distances = self._edge_distances([(u, v) for u, v, _ in osm_edges])
+
+            street_edges: List[Tuple[str, str, Edge]] = []
+            for (u, v, data), distance in zip(osm_edges, distances):
+                highway, access = _tag_value(data, 'highway'), _tag_value(data, 'access')
+                edge = Edge(
+                    id=f"{u}_{v}",
+                    from_node=u,
+                    to_node=v,
+                    distance=distance,
+                    allowed_modes=self._allowed_modes_for(highway, access),  # Based on road type
+                    is_bike_lane=self._bike_lane_for(highway, 'cycleway' in data, access),
+                    is_sidewalk=True,  # Assume sidewalks exist
+                    has_transit_service=self._transit_service_for(highway, _tag_value(data, 'public_transport'))
+                )
 
-                    self.nodes[str(node_id)] = node
-                    self.graph.add_node(str(node_id), **node.dict())
-
-            # Add edges
-            for u, v, key, data in graph.edges(data=True, keys=True):
-                if str(u) in self.nodes and str(v) in self.nodes:
-                    # Determine allowed modes based on road type
-                    allowed_modes = self._get_allowed_modes(data)
-
-                    # Calculate distance
-                    from_node = self.nodes[str(u)]
-                    to_node = self.nodes[str(v)]
-                    distance = from_node.point.distance_to(to_node.point)
-
-                    edge = Edge(
-                        id=f"{u}_{v}_{key}",
-                        from_node=str(u),
-                        to_node=str(v),
-                        distance=distance,
-                        allowed_modes=allowed_modes,
-                        is_bike_lane=self._has_bike_lane(data),
-                        is_sidewalk=True,  # Assume sidewalks exist
-                        has_transit_service=self._has_transit_service(data)
-                    )
+                street_edges.append((u, v, edge))
 
-                    self.edges[edge.id] = edge
-                    self.graph.add_edge(str(u), str(v), key=key, **edge.dict())
+            self.edges.update((edge.id, edge) for _, _, edge in street_edges)
+            self.graph.add_edges_from((u, v, _static_edge_attrs(edge)) for u, v, edge in street_edges)
 
-            logger.info(f"Added {len(self.nodes)} street nodes and {len(self.edges)} street edges")
+            self._invalidate_spatial_index("intersection")
+            logger.info("Added %s street nodes and %s street edges", len(self.nodes), len(self.edges))
 
         except Exception as e:
-            logger.error(f"Error building street network: {e}")
+            logger.error("Error building street network: %s", e)
             # Fallback: create a simple grid
             await self._create_fallback_network(center_point, radius)
 
-    def _get_allowed_modes(self, road_data: Dict) -> List[TransportMode]:
-        """Determine allowed transport modes for a road segment."""
-        allowed_modes = [TransportMode.WALKING]  # Always allow walking
+    async def _download_osm_graph(self, center_point: Point, radius: int) -> nx.MultiDiGraph:
+        """
+        Download the OSM network in the square of half-width ``radius`` around a point.
 
+        The square is split into tiles that are downloaded in parallel and merged.
+        OSM node ids are global, so nodes on tile boundaries merge into one.
+        """
+        lat_delta = radius / 111320
+        lng_delta = radius / (111320 * np.cos(np.radians(center_point.lat)))
+        lat_edges = np.linspace(center_point.lat - lat_delta, center_point.lat + lat_delta, OSM_TILE_GRID + 1).tolist()
+        lng_edges = np.linspace(center_point.lng - lng_delta, center_point.lng + lng_delta, OSM_TILE_GRID + 1).tolist()
+
+        semaphore = asyncio.Semaphore(OSM_TILE_CONCURRENCY)
+
+        async def download_tile(south: float, north: float, west: float, east: float) -> Optional[nx.MultiDiGraph]:
+            async with semaphore:
+                if OSMNX_V2:
+                    bbox_args, bbox_kwargs = (), {'bbox': (west, south, east, north)}
+                else:
+                    bbox_args, bbox_kwargs = (north, south, east, west), {}
+                try:
+                    return await asyncio.to_thread(
+                        ox.graph_from_bbox, *bbox_args, **bbox_kwargs,
+                        network_type='all',  # Driveable roads plus walking and cycling paths
+                        simplify=True,
+                        truncate_by_edge=True  # Keep edges crossing into the next tile
+                    )
+                except InsufficientResponseError as e:
+                    # Tiles over water have no streets
+                    logger.debug("No OSM network in tile (%s, %s, %s, %s): %s", south, north, west, east, e)
+                    return None
+
+        tiles = await asyncio.gather(*(
+            download_tile(lat_edges[i], lat_edges[i + 1], lng_edges[j], lng_edges[j + 1])
+            for i in range(OSM_TILE_GRID) for j in range(OSM_TILE_GRID)
+        ))
+        tiles = [tile for tile in tiles if tile is not None]
+        if not tiles:
+            raise ValueError(f"No OSM network found around {center_point}")
+
+        return nx.compose_all(tiles)
+
+    def _osm_node_coords(self, graph: nx.MultiDiGraph, node_ids: List) -> Tuple[List[float], List[float]]:
+        """
+        Get the latitudes and longitudes of OSM nodes.
+
+        Node x/y coordinates are in the graph's CRS (longitude/latitude unless the
+        graph was projected), so all of them are transformed in a single call.
+        """
+        xs = np.fromiter((graph.nodes[node_id]['x'] for node_id in node_ids), dtype=float, count=len(node_ids))
+        ys = np.fromiter((graph.nodes[node_id]['y'] for node_id in node_ids), dtype=float, count=len(node_ids))
+
+        crs = graph.graph.get('crs', 'EPSG:4326')
+        if PYPROJ_AVAILABLE:
+            xs, ys = Transformer.from_crs(crs, 'EPSG:4326', always_xy=True).transform(xs, ys)
+        elif str(crs).upper() != 'EPSG:4326':
+            logger.warning("pyproj not available, treating %s coordinates as longitude/latitude", crs)
+
+        return np.asarray(ys).tolist(), np.asarray(xs).tolist()
+
+    def _highway_tags(self, road_data: Dict) -> Set[str]:
+        """Get a road's highway tags (simplified OSM edges can carry several)."""
         highway = road_data.get('highway', '')
-        access = road_data.get('access', '')
+        return set(highway) if isinstance(highway, list) else {highway}
+
+    def _is_drive_road(self, road_data: Dict) -> bool:
+        """Check if a road segment belongs to the driveable street network."""
+        return not DRIVE_HIGHWAYS.isdisjoint(self._highway_tags(road_data))
+
+    def _is_walk_road(self, road_data: Dict) -> bool:
+        """Check if a road segment can be walked or cycled."""
+        return not self._highway_tags(road_data) <= NON_WALK_HIGHWAYS
+
+    def _get_allowed_modes(self, road_data: Dict) -> Tuple[TransportMode, ...]:
+        """Determine allowed transport modes for a road segment."""
+        return self._allowed_modes_for(_tag_value(road_data, 'highway'), _tag_value(road_data, 'access'))
+
+    def _has_bike_lane(self, road_data: Dict) -> bool:
+        """Check if road has bike lane."""
+        return self._bike_lane_for(
+            _tag_value(road_data, 'highway'), 'cycleway' in road_data, _tag_value(road_data, 'access')
+        )
+
+    def _has_transit_service(self, road_data: Dict) -> bool:
+        """Check if road has transit service."""
+        return self._transit_service_for(
+            _tag_value(road_data, 'highway'), _tag_value(road_data, 'public_transport')
+        )
+
+    # There are only a few hundred distinct tag combinations across Vancouver,
+    # so the tag checks below are memoized on the tag values
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _allowed_modes_for(highway: Hashable, access: Hashable) -> Tuple[TransportMode, ...]:
+        """Allowed transport modes for a road's highway and access tags."""
+        allowed_modes = [TransportMode.WALKING]  # Always allow walking
 
         # Car access
         if highway in ['primary', 'secondary', 'tertiary', 'residential', 'trunk', 'motorway']:
@@ -194,22 +449,19 @@ class VancouverGraphBuilder:
             if access != 'no':
                 allowed_modes.append(TransportMode.SCOOTER)
 
-        return allowed_modes
+        return tuple(allowed_modes)
 
-    def _has_bike_lane(self, road_data: Dict) -> bool:
-        """Check if road has bike lane."""
-        return (
-            road_data.get('highway') == 'cycleway' or
-            'cycleway' in road_data or
-            'bicycle' in road_data.get('access', '')
-        )
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _bike_lane_for(highway: Hashable, has_cycleway_tag: bool, access: Hashable) -> bool:
+        """Whether a road with these tags has a bike lane."""
+        return highway == 'cycleway' or has_cycleway_tag or 'bicycle' in access
 
-    def _has_transit_service(self, road_data: Dict) -> bool:
-        """Check if road has transit service."""
-        return (
-            road_data.get('highway') in ['primary', 'secondary', 'tertiary'] or
-            'bus' in road_data.get('public_transport', '')
-        )
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _transit_service_for(highway: Hashable, public_transport: Hashable) -> bool:
+        """Whether a road with these tags has transit service."""
+        return highway in ['primary', 'secondary', 'tertiary'] or 'bus' in public_transport
 
     async def _add_transit_network(self, center_point: Point, radius: int):
         """Add transit stops and routes to the graph."""
@@ -217,26 +469,29 @@ class VancouverGraphBuilder:
             # Get nearby transit stops
             transit_stops = await self.api_client.translink.get_nearby_stops(center_point, radius)
 
-            for stop in transit_stops:
-                # Create transit stop node
-                node = Node(
+            # Create transit stop nodes and add them in one batch
+            transit_nodes = [
+                Node(
                     id=f"transit_{stop.stop_id}",
-                    point=Point(lat=stop.location.lat, lng=stop.location.lng),
+                    point=Point.model_construct(lat=stop.location.lat, lng=stop.location.lng),
                     node_type="transit_stop",
                     name=stop.stop_name,
                     accessibility_features=["wheelchair"] if stop.accessibility else []
                 )
-
-                self.nodes[node.id] = node
-                self.graph.add_node(node.id, **node.dict())
-
-                # Connect to nearest street nodes
+                for stop in transit_stops
+            ]
+            self.nodes.update((node.id, node) for node in transit_nodes)
+            self.graph.add_nodes_from((node.id, node.__dict__) for node in transit_nodes)
+            self._invalidate_spatial_index("transit_stop")
+
+            # Connect to nearest street nodes
+            for node in transit_nodes:
                 await self._connect_transit_to_streets(node)
 
-            logger.info(f"Added {len(transit_stops)} transit stops")
+            logger.info("Added %s transit stops", len(transit_stops))
 
         except Exception as e:
-            logger.error(f"Error adding transit network: {e}")
+            logger.error("Error adding transit network: %s", e)
 
     async def _add_shared_mobility_stations(self, center_point: Point, radius: int):
         """Add bike/scooter sharing stations to the graph."""
@@ -244,26 +499,29 @@ class VancouverGraphBuilder:
             # Get Lime vehicles
             lime_vehicles = await self.api_client.lime.get_available_vehicles(center_point, radius)
 
-            for vehicle in lime_vehicles:
-                if vehicle.available_bikes > 0 or vehicle.available_scooters > 0:
-                    # Create shared mobility node
-                    node = Node(
-                        id=f"lime_{vehicle.station_id}",
-                        point=vehicle.location,
-                        node_type="shared_mobility",
-                        name=f"Lime Station {vehicle.station_id}"
-                    )
-
-                    self.nodes[node.id] = node
-                    self.graph.add_node(node.id, **node.dict())
+            # Create shared mobility nodes and add them in one batch
+            mobility_nodes = [
+                Node(
+                    id=f"lime_{vehicle.station_id}",
+                    point=vehicle.location,
+                    node_type="shared_mobility",
+                    name=f"Lime Station {vehicle.station_id}"
+                )
+                for vehicle in lime_vehicles
+                if vehicle.available_bikes > 0 or vehicle.available_scooters > 0
+            ]
+            self.nodes.update((node.id, node) for node in mobility_nodes)
+            self.graph.add_nodes_from((node.id, node.__dict__) for node in mobility_nodes)
+            self._invalidate_spatial_index("shared_mobility")
 
-                    # Connect to nearest street nodes
-                    await self._connect_shared_mobility_to_streets(node)
+            # Connect to nearest street nodes
+            for node in mobility_nodes:
+                await self._connect_shared_mobility_to_streets(node)
 
-            logger.info(f"Added {len(lime_vehicles)} shared mobility stations")
+            logger.info("Added %s shared mobility stations", len(lime_vehicles))
 
         except Exception as e:
-            logger.error(f"Error adding shared mobility stations: {e}")
+            logger.error("Error adding shared mobility stations: %s", e)
 
     async def _add_pedestrian_bike_network(self, center_point: Point, radius: int):
         """Add pedestrian paths and bike lanes to the graph."""
@@ -271,79 +529,88 @@ class VancouverGraphBuilder:
             logger.warning("OSMnx not available, skipping pedestrian network")
             return
 
+        if self._osm_graph is None:
+            logger.warning("No OSM network downloaded, skipping pedestrian network")
+            return
+
         try:
-            # Download pedestrian network
-            ped_graph = ox.graph_from_point(
-                (center_point.lat, center_point.lng),
-                dist=radius,
-                network_type='walk',
-                simplify=True
+            # Paths come from the street pass download; streets are already in the graph
+            ped_graph = self._osm_graph
+            path_edges = _shortest_parallel_edges(
+                edge for edge in ped_graph.edges(data=True, keys=True)
+                if not self._is_drive_road(edge[3]) and self._is_walk_road(edge[3])
             )
 
-            # Add pedestrian-specific nodes and edges
-            for node_id, data in ped_graph.nodes(data=True):
-                if 'x' in data and 'y' in data and str(node_id) not in self.nodes:
-                    if GEOPANDAS_AVAILABLE:
-                        from shapely.geometry import Point as ShapelyPoint
-                        point_geom = ShapelyPoint(data['x'], data['y'])
-                        lat, lng = ox.projection.project_geometry(
-                            point_geom,
-                            from_crs=ped_graph.graph['crs'],
-                            to_crs='EPSG:4326'
-                        ).centroid.coords[0]
-                    else:
-                        # Simple approximation
-                        lat = center_point.lat + (data['y'] - center_point.lat) * 0.00001
-                        lng = center_point.lng + (data['x'] - center_point.lng) * 0.00001
-
-                    node = Node(
-                        id=f"ped_{node_id}",
-                        point=Point(lat=lat, lng=lng),
-                        node_type="pedestrian_path"
-                    )
+            # Paths join streets at shared intersections; other path nodes get their own ids
+            graph_ids = {
+                node_id: self._osm_node_ids.get(node_id) or f"ped_{node_id}"
+                for edge in path_edges for node_id in edge[:2]
+            }
+
+            # Add pedestrian-specific nodes and edges, collected for bulk insertion
+            ped_ids = [
+                node_id for node_id, data in ped_graph.nodes(data=True)
+                if 'x' in data and 'y' in data and graph_ids.get(node_id, "").startswith("ped_")
+            ]
+            ped_nodes: Dict[str, Node] = {}
+            for node_id, lat, lng in zip(ped_ids, *self._osm_node_coords(ped_graph, ped_ids)):
+                node = Node(
+                    id=graph_ids[node_id],
+                    point=Point.model_construct(lat=lat, lng=lng),
+                    node_type="pedestrian_path"
+                )
 
-                    self.nodes[node.id] = node
-                    self.graph.add_node(node.id, **node.dict())
-
-            # Add pedestrian edges
-            for u, v, key, data in ped_graph.edges(data=True, keys=True):
-                if f"ped_{u}" in self.nodes and f"ped_{v}" in self.nodes:
-                    from_node = self.nodes[f"ped_{u}"]
-                    to_node = self.nodes[f"ped_{v}"]
-                    distance = from_node.point.distance_to(to_node.point)
-
-                    edge = Edge(
-                        id=f"ped_{u}_{v}_{key}",
-                        from_node=f"ped_{u}",
-                        to_node=f"ped_{v}",
-                        distance=distance,
-                        allowed_modes=[TransportMode.WALKING, TransportMode.BIKING],
-                        is_sidewalk=True
-                    )
+                ped_nodes[node.id] = node
+
+            self.nodes.update(ped_nodes)
+            self.graph.add_nodes_from((node_id, node.__dict__) for node_id, node in ped_nodes.items())
+            self._invalidate_spatial_index("pedestrian_path")
+
+            # Add pedestrian edges, except where a street already joins the same nodes
+            osm_edges = [
+                (u, v)
+                for u, v, _ in path_edges
+                if graph_ids[u] in self.nodes and graph_ids[v] in self.nodes
+                and not self.graph.has_edge(graph_ids[u], graph_ids[v])
+            ]
+            distances = self._edge_distances([(graph_ids[u], graph_ids[v]) for u, v in osm_edges])
+
+            ped_edges: List[Edge] = []
+            for (u, v), distance in zip(osm_edges, distances):
+                edge = Edge(
+                    id=f"ped_{u}_{v}",
+                    from_node=graph_ids[u],
+                    to_node=graph_ids[v],
+                    distance=distance,
+                    allowed_modes=[TransportMode.WALKING, TransportMode.BIKING],
+                    is_sidewalk=True
+                )
 
-                    self.edges[edge.id] = edge
-                    self.graph.add_edge(f"ped_{u}", f"ped_{v}", key=key, **edge.dict())
+                ped_edges.append(edge)
+
+            self.edges.update((edge.id, edge) for edge in ped_edges)
+            self.graph.add_edges_from((edge.from_node, edge.to_node, _static_edge_attrs(edge)) for edge in ped_edges)
 
             logger.info("Added pedestrian and bike network")
 
         except Exception as e:
-            logger.error(f"Error adding pedestrian/bike network: {e}")
+            logger.error("Error adding pedestrian/bike network: %s", e)
+
+        finally:
+            # The raw OSM graph is only needed while building
+            self._osm_graph = None
+            self._osm_node_ids = {}
 
     async def _connect_transit_to_streets(self, transit_node: Node):
         """Connect transit stops to nearest street nodes."""
-        min_distance = float('inf')
-        nearest_street_node = None
-
-        for node_id, node in self.nodes.items():
-            if node.node_type == "intersection":
-                distance = transit_node.point.distance_to(node.point)
-                if distance < min_distance and distance < 200:  # Within 200m
-                    min_distance = distance
-                    nearest_street_node = node_id
+        nearest_street_node = self._get_spatial_index("intersection").nearest(
+            transit_node.point.lat, transit_node.point.lng, max_distance=200  # Within 200m
+        )
 
         if nearest_street_node:
             # Create walking connection
-            distance = transit_node.point.distance_to(self.nodes[nearest_street_node].point)
+            street_point = self.nodes[nearest_street_node].point
+            distance = haversine(transit_node.point.lat, transit_node.point.lng, street_point.lat, street_point.lng)
             edge = Edge(
                 id=f"transit_walk_{transit_node.id}_{nearest_street_node}",
                 from_node=transit_node.id,
@@ -353,7 +620,7 @@ class VancouverGraphBuilder:
             )
 
             self.edges[edge.id] = edge
-            self.graph.add_edge(transit_node.id, nearest_street_node, **edge.dict())
+            self.graph.add_edge(transit_node.id, nearest_street_node, **_static_edge_attrs(edge))
 
             # Reverse edge
             reverse_edge = Edge(
@@ -365,23 +632,18 @@ class VancouverGraphBuilder:
             )
 
             self.edges[reverse_edge.id] = reverse_edge
-            self.graph.add_edge(nearest_street_node, transit_node.id, **reverse_edge.dict())
+            self.graph.add_edge(nearest_street_node, transit_node.id, **_static_edge_attrs(reverse_edge))
 
     async def _connect_shared_mobility_to_streets(self, mobility_node: Node):
         """Connect shared mobility stations to nearest street nodes."""
-        min_distance = float('inf')
-        nearest_street_node = None
-
-        for node_id, node in self.nodes.items():
-            if node.node_type == "intersection":
-                distance = mobility_node.point.distance_to(node.point)
-                if distance < min_distance and distance < 100:  # Within 100m
-                    min_distance = distance
-                    nearest_street_node = node_id
+        nearest_street_node = self._get_spatial_index("intersection").nearest(
+            mobility_node.point.lat, mobility_node.point.lng, max_distance=100  # Within 100m
+        )
 
         if nearest_street_node:
             # Create walking connection
-            distance = mobility_node.point.distance_to(self.nodes[nearest_street_node].point)
+            street_point = self.nodes[nearest_street_node].point
+            distance = haversine(mobility_node.point.lat, mobility_node.point.lng, street_point.lat, street_point.lng)
             edge = Edge(
                 id=f"mobility_walk_{mobility_node.id}_{nearest_street_node}",
                 from_node=mobility_node.id,
@@ -391,7 +653,112 @@ class VancouverGraphBuilder:
             )
 
             self.edges[edge.id] = edge
-            self.graph.add_edge(mobility_node.id, nearest_street_node, **edge.dict())
+            self.graph.add_edge(mobility_node.id, nearest_street_node, **_static_edge_attrs(edge))
+
+    def _build_edge_columns(self):
+        """Lay out the edges' cost inputs as arrays, one row per edge."""
+        edges = list(self.edges.values())
+        self.edge_ids: List[str] = [edge.id for edge in edges]
+        self.edge_rows: Dict[str, int] = {edge_id: row for row, edge_id in enumerate(self.edge_ids)}
+        self.edge_distance = np.fromiter((edge.distance for edge in edges), dtype=float, count=len(edges))
+
+        self.edge_allowed_mask = np.zeros((len(edges), len(EDGE_MODES)), dtype=bool)
+        self.edge_allowed_mask[
+            [row for row, edge in enumerate(edges) for _ in edge.allowed_modes],
+            [MODE_COLUMNS[mode] for edge in edges for mode in edge.allowed_modes]
+        ] = True
+        self._edge_primary_mode = np.fromiter(
+            (MODE_COLUMNS[edge.allowed_modes[0]] for edge in edges), dtype=np.intp, count=len(edges)
+        )
+
+        self.edge_traffic_speed = np.full(len(edges), np.nan)  # km/h, NaN if unknown
+        self.edge_weather_penalty = np.ones(len(edges))
+        self.edge_event_penalty = np.ones(len(edges))
+        self.edge_energy_cost = np.zeros((len(edges), len(EDGE_MODES)))
+
+        # The igraph copy's edges no longer line up with the rows
+        self.igraph = None
+        self._igraph_views = {}
+
+    def _build_igraph(self):
+        """
+        Mirror the graph into igraph, with edges in edge_ids row order, and
+        build the per-mode subgraphs and weight lists shortest_path searches.
+        """
+        if not IGRAPH_AVAILABLE:
+            return
+
+        self._vertex_ids = list(self.nodes)
+        self._vertex_index = {node_id: index for index, node_id in enumerate(self._vertex_ids)}
+        graph = ig.Graph(
+            n=len(self._vertex_ids),
+            edges=[
+                (self._vertex_index[edge.from_node], self._vertex_index[edge.to_node])
+                for edge in map(self.edges.__getitem__, self.edge_ids)
+            ],
+            directed=True
+        )
+
+        # Subgraph edges keep their relative order, so they line up with the masked weights
+        views = {None: (graph, self.edge_distance.tolist())}
+        for mode, column in MODE_COLUMNS.items():
+            allowed = self.edge_allowed_mask[:, column]
+            views[mode] = (
+                graph.subgraph_edges(np.flatnonzero(allowed).tolist(), delete_vertices=False),
+                self.edge_distance[allowed].tolist()
+            )
+
+        self.igraph, self._igraph_views = graph, views
+
+    def shortest_path(self, source: str, target: str, mode: Optional[TransportMode] = None) -> List[str]:
+        """
+        Find the shortest path by distance between two nodes.
+
+        Args:
+            source: Start node id
+            target: End node id
+            mode: Only use edges that allow this transport mode
+
+        Returns:
+            Node ids along the path, or an empty list if the target is unreachable
+            or either node is not in the graph
+        """
+        if source not in self.graph or target not in self.graph:
+            return []
+
+        if self.igraph is not None:
+            graph, weights = self._igraph_views[mode]
+            path = graph.get_shortest_paths(
+                self._vertex_index[source], self._vertex_index[target], weights=weights
+            )[0]
+            return [self._vertex_ids[index] for index in path]
+
+        def weight(u, v, data):
+            # None hides edges that don't allow the mode
+            return data["distance"] if mode is None or mode in data["allowed_modes"] else None
+
+        try:
+            # Searching from both ends meets in the middle, settling far fewer nodes on long routes
+            return nx.bidirectional_dijkstra(self.graph, source, target, weight=weight)[1]
+        except nx.NetworkXNoPath:
+            return []
+
+    def get_edge(self, edge_id: str) -> Edge:
+        """Get an edge model with its current dynamic costs filled in."""
+        edge = self.edges[edge_id]
+        row = self.edge_rows.get(edge_id)
+        if row is None:
+            return edge
+
+        traffic_speed = self.edge_traffic_speed[row]
+        return edge.model_copy(update={
+            "current_traffic_speed": None if np.isnan(traffic_speed) else float(traffic_speed),
+            "weather_penalty": float(self.edge_weather_penalty[row]),
+            "event_penalty": float(self.edge_event_penalty[row]),
+            "energy_cost": {
+                mode: float(self.edge_energy_cost[row, MODE_COLUMNS[mode]]) for mode in edge.allowed_modes
+            }
+        })
 
     async def _update_edge_costs(self):
         """Update edge costs with real-time data."""
@@ -399,108 +766,132 @@ class VancouverGraphBuilder:
             # Get real-time data
             # This would be called with actual origin/destination points
             # For now, we'll use default values
+            self._build_edge_columns()
 
-            for edge_id, edge in self.edges.items():
-                # Update with default values
-                edge.current_traffic_speed = self.mode_speeds.get(edge.allowed_modes[0], 20.0)
-                edge.weather_penalty = 1.0
-                edge.event_penalty = 1.0
-
-                # Calculate energy costs
-                for mode in edge.allowed_modes:
-                    if mode == TransportMode.WALKING:
-                        edge.energy_cost[mode] = edge.distance * 0.1  # Low energy cost
-                    elif mode == TransportMode.BIKING:
-                        edge.energy_cost[mode] = edge.distance * 0.05  # Very low energy cost
-                    elif mode == TransportMode.CAR:
-                        edge.energy_cost[mode] = edge.distance * 0.5  # High energy cost
-                    else:
-                        edge.energy_cost[mode] = edge.distance * 0.2  # Medium energy cost
+            # Default to the speed of each edge's primary mode
+            mode_speeds = np.array([self.mode_speeds.get(mode, 20.0) for mode in EDGE_MODES])
+            self.edge_traffic_speed = mode_speeds[self._edge_primary_mode]
+
+            # Calculate energy costs for every edge and mode at once, zero where not allowed
+            np.multiply(self.edge_distance[:, None], ENERGY_COST_PER_METER, out=self.edge_energy_cost)
+            self.edge_energy_cost *= self.edge_allowed_mask
 
             logger.info("Updated edge costs with real-time data")
 
         except Exception as e:
-            logger.error(f"Error updating edge costs: {e}")
+            logger.error("Error updating edge costs: %s", e)
 
     async def _create_fallback_network(self, center_point: Point, radius: int):
         """Create a simple fallback network if OSM data fails."""
         logger.warning("Creating fallback network due to OSM data failure")
+        self._used_fallback = True
 
         # Create a simple grid network
         grid_size = 100  # meters
         lat_step = grid_size / 111000  # Approximate degrees per meter
         lng_step = grid_size / (111000 * abs(center_point.lat))
 
-        nodes_created = 0
-        for i in range(-radius//grid_size, radius//grid_size + 1):
-            for j in range(-radius//grid_size, radius//grid_size + 1):
-                lat = center_point.lat + i * lat_step
-                lng = center_point.lng + j * lng_step
-
-                # Check if within bounds
-                if (self.bounds["south"] <= lat <= self.bounds["north"] and
-                    self.bounds["west"] <= lng <= self.bounds["east"]):
-
-                    node = Node(
-                        id=f"grid_{i}_{j}",
-                        point=Point(lat=lat, lng=lng),
-                        node_type="intersection"
-                    )
-
-                    self.nodes[node.id] = node
-                    self.graph.add_node(node.id, **node.dict())
-                    nodes_created += 1
+        # Grid offsets and coordinates for every cell at once
+        offsets = np.arange(-radius//grid_size, radius//grid_size + 1)
+        grid_i, grid_j = np.meshgrid(offsets, offsets, indexing="ij")
+        lats = center_point.lat + grid_i * lat_step
+        lngs = center_point.lng + grid_j * lng_step
 
-        # Connect grid nodes
-        for node_id, node in self.nodes.items():
-            if node_id.startswith("grid_"):
-                i, j = map(int, node_id.split("_")[1:])
-
-                # Connect to adjacent nodes
-                for di, dj in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    neighbor_id = f"grid_{i+di}_{j+dj}"
-                    if neighbor_id in self.nodes:
-                        neighbor = self.nodes[neighbor_id]
-                        distance = node.point.distance_to(neighbor.point)
+        # Check if within bounds
+        inside = (
+            (lats >= self.bounds["south"]) & (lats <= self.bounds["north"]) &
+            (lngs >= self.bounds["west"]) & (lngs <= self.bounds["east"])
+        )
 
-                        edge = Edge(
-                            id=f"{node_id}_{neighbor_id}",
-                            from_node=node_id,
-                            to_node=neighbor_id,
-                            distance=distance,
-                            allowed_modes=[TransportMode.WALKING, TransportMode.BIKING, TransportMode.CAR]
-                        )
+        grid_nodes: Dict[str, Node] = {}
+        for i, j, lat, lng in zip(
+            grid_i[inside].tolist(), grid_j[inside].tolist(), lats[inside].tolist(), lngs[inside].tolist()
+        ):
+            node = Node(
+                id=f"grid_{i}_{j}",
+                point=Point.model_construct(lat=lat, lng=lng),
+                node_type="intersection"
+            )
+            grid_nodes[node.id] = node
+
+        self.nodes.update(grid_nodes)
+        self.graph.add_nodes_from((node_id, node.__dict__) for node_id, node in grid_nodes.items())
+        self._invalidate_spatial_index("intersection")
+
+        # Connect grid nodes to adjacent nodes, one shifted view of the grid per direction
+        rows, cols = inside.shape
+        edge_ends = []
+        for di, dj in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+            source = (slice(max(-di, 0), rows - max(di, 0)), slice(max(-dj, 0), cols - max(dj, 0)))
+            target = (slice(max(di, 0), rows - max(-di, 0)), slice(max(dj, 0), cols - max(-dj, 0)))
+            valid = inside[source] & inside[target]
+            edge_ends.append([array[cells][valid] for cells in (source, target) for array in (grid_i, grid_j, lats, lngs)])
+
+        from_i, from_j, from_lat, from_lng, to_i, to_j, to_lat, to_lng = (
+            np.concatenate(column) for column in zip(*edge_ends)
+        )
+        distances = haversine_distances(from_lat, from_lng, to_lat, to_lng)
 
-                        self.edges[edge.id] = edge
-                        self.graph.add_edge(node_id, neighbor_id, **edge.dict())
+        grid_edges = [
+            Edge(
+                id=f"grid_{i}_{j}_grid_{ni}_{nj}",
+                from_node=f"grid_{i}_{j}",
+                to_node=f"grid_{ni}_{nj}",
+                distance=distance,
+                allowed_modes=[TransportMode.WALKING, TransportMode.BIKING, TransportMode.CAR]
+            )
+            for i, j, ni, nj, distance in zip(
+                from_i.tolist(), from_j.tolist(), to_i.tolist(), to_j.tolist(), distances.tolist()
+            )
+        ]
+
+        self.edges.update((edge.id, edge) for edge in grid_edges)
+        self.graph.add_edges_from((edge.from_node, edge.to_node, _static_edge_attrs(edge)) for edge in grid_edges)
+
+        logger.info("Created fallback network with %s nodes", len(grid_nodes))
+
+    def _edge_distances(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """Haversine lengths in meters of (from_node, to_node) pairs, computed in one pass."""
+        if not pairs:
+            return []
+
+        rows = {node_id: row for row, node_id in enumerate(self.nodes)}
+        coords = np.array([(node.point.lat, node.point.lng) for node in self.nodes.values()])
+        index = np.array([(rows[u], rows[v]) for u, v in pairs], dtype=np.intp)
+        start, end = coords[index[:, 0]], coords[index[:, 1]]
+        return haversine_distances(start[:, 0], start[:, 1], end[:, 0], end[:, 1]).tolist()
+
+    def _get_spatial_index(self, node_type: Optional[str] = None) -> SpatialIndex:
+        """Get the spatial index over nodes of a type, building it if needed."""
+        index = self._spatial_indexes.get(node_type)
+        if index is None:
+            nodes = [
+                node for node in self.nodes.values()
+                if node_type is None or node.node_type == node_type
+            ]
+            index = SpatialIndex(
+                [node.id for node in nodes],
+                [node.point.lat for node in nodes],
+                [node.point.lng for node in nodes],
+                ref_lat=(self.bounds["north"] + self.bounds["south"]) / 2
+            )
+            self._spatial_indexes[node_type] = index
+        return index
 
-        logger.info(f"Created fallback network with {nodes_created} nodes")
+    def _invalidate_spatial_index(self, node_type: str):
+        """Drop the indexes that include nodes of a type after nodes are added."""
+        self._spatial_indexes.pop(node_type, None)
+        self._spatial_indexes.pop(None, None)
 
     def get_nearest_node(self, point: Point, node_type: Optional[str] = None) -> Optional[str]:
         """Find the nearest node to a given point."""
-        min_distance = float('inf')
-        nearest_node = None
-
-        for node_id, node in self.nodes.items():
-            if node_type is None or node.node_type == node_type:
-                distance = point.distance_to(node.point)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_node = node_id
-
-        return nearest_node
+        return self._get_spatial_index(node_type).nearest(point.lat, point.lng)
 
     def get_nodes_in_radius(self, point: Point, radius: float) -> List[str]:
         """Get all nodes within a given radius of a point."""
-        nodes_in_radius = []
-
-        for node_id, node in self.nodes.items():
-            distance = point.distance_to(node.point)
-            if distance <= radius:
-                nodes_in_radius.append(node_id)
-
-        return nodes_in_radius
+        return self._get_spatial_index().within(point.lat, point.lng, radius)
 
     async def close(self):
-        """Close API client connections."""
-        await self.api_client.close()
+        """Close API client connections, unless they were passed in by the caller."""
+        if self._owns_api_client:
+            await self.api_client.close()
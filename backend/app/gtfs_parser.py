@@ -109,11 +109,11 @@ class GTFSRTParser:
 
                     trip_updates.append(trip_info)
 
-            logger.info(f"Parsed {len(trip_updates)} trip updates from GTFS-RT feed")
+            logger.info("Parsed %s trip updates from GTFS-RT feed", len(trip_updates))
             return trip_updates
 
         except Exception as e:
-            logger.error(f"Error parsing GTFS-RT trip updates: {e}")
+            logger.error("Error parsing GTFS-RT trip updates: %s", e)
             return []
 
     @staticmethod
@@ -163,11 +163,11 @@ class GTFSRTParser:
 
                     vehicle_positions.append(vehicle_info)
 
-            logger.info(f"Parsed {len(vehicle_positions)} vehicle positions from GTFS-RT feed")
+            logger.info("Parsed %s vehicle positions from GTFS-RT feed", len(vehicle_positions))
             return vehicle_positions
 
         except Exception as e:
-            logger.error(f"Error parsing GTFS-RT vehicle positions: {e}")
+            logger.error("Error parsing GTFS-RT vehicle positions: %s", e)
             return []
 
     @staticmethod
@@ -243,11 +243,11 @@ class GTFSRTParser:
 
                     service_alerts.append(alert_info)
 
-            logger.info(f"Parsed {len(service_alerts)} service alerts from GTFS-RT feed")
+            logger.info("Parsed %s service alerts from GTFS-RT feed", len(service_alerts))
             return service_alerts
 
         except Exception as e:
-            logger.error(f"Error parsing GTFS-RT service alerts: {e}")
+            logger.error("Error parsing GTFS-RT service alerts: %s", e)
             return []
 
     @staticmethod
@@ -288,8 +288,8 @@ class GTFSRTParser:
                 if resolved_id:
                     stop_id = resolved_id
                     logger.debug(
-                        f"Mapped stop name '{stop_identifier}' to stop ID '{stop_id}' "
-                        f"(route: {route_id}, route-based selection)"
+                        "Mapped stop name '%s' to stop ID '%s' (route: %s, route-based selection)",
+                        stop_identifier, stop_id, route_id
                     )
                 else:
                     # Fallback: try to find all matching stops
@@ -297,8 +297,8 @@ class GTFSRTParser:
                     if all_matching:
                         stop_id = all_matching[0].stop_id
                         logger.debug(
-                            f"Mapped stop name '{stop_identifier}' to stop ID '{stop_id}' "
-                            f"(found {len(all_matching)} matches, using first)"
+                            "Mapped stop name '%s' to stop ID '%s' (found %s matches, using first)",
+                            stop_identifier, stop_id, len(all_matching)
                         )
 
         # Get all matching stop IDs if we have multiple bays
@@ -308,7 +308,7 @@ class GTFSRTParser:
             if len(all_matching_stops) > 1:
                 # Try all matching stops (for multi-bay stops)
                 stop_ids_to_try = [s.stop_id for s in all_matching_stops]
-                logger.debug(f"Trying {len(stop_ids_to_try)} stop IDs for '{stop_identifier}'")
+                logger.debug("Trying %s stop IDs for '%s'", len(stop_ids_to_try), stop_identifier)
 
         # Find matching trip updates for this route
         for trip_update in trip_updates:
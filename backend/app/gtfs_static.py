@@ -74,10 +74,10 @@ class GTFSStaticParser:
             return True
 
         if not self.gtfs_path.exists():
-            logger.warning(f"GTFS directory not found: {self.gtfs_path}")
+            logger.warning("GTFS directory not found: %s", self.gtfs_path)
             logger.info("To use GTFS static feed:")
             logger.info("1. Download TransLink GTFS feed from: https://www.translink.ca/about-us/doing-business-with-translink/app-developer-resources")
-            logger.info(f"2. Extract to: {self.gtfs_path}")
+            logger.info("2. Extract to: %s", self.gtfs_path)
             return False
 
         try:
@@ -85,39 +85,39 @@ class GTFSStaticParser:
             stops_file = self.gtfs_path / "stops.txt"
             if stops_file.exists():
                 self._load_stops(stops_file)
-                logger.info(f"Loaded {len(self.stops)} stops from GTFS static feed")
+                logger.info("Loaded %s stops from GTFS static feed", len(self.stops))
             else:
-                logger.warning(f"stops.txt not found in {self.gtfs_path}")
+                logger.warning("stops.txt not found in %s", self.gtfs_path)
 
             # Load routes.txt
             routes_file = self.gtfs_path / "routes.txt"
             if routes_file.exists():
                 self._load_routes(routes_file)
-                logger.info(f"Loaded {len(self.routes)} routes from GTFS static feed")
+                logger.info("Loaded %s routes from GTFS static feed", len(self.routes))
             else:
-                logger.warning(f"routes.txt not found in {self.gtfs_path}")
+                logger.warning("routes.txt not found in %s", self.gtfs_path)
 
             # Load trips.txt (for route → trip mapping)
             trips_file = self.gtfs_path / "trips.txt"
             if trips_file.exists():
                 self._load_trips(trips_file)
-                logger.info(f"Loaded {len(self.trips)} trips from GTFS static feed")
+                logger.info("Loaded %s trips from GTFS static feed", len(self.trips))
             else:
-                logger.warning(f"trips.txt not found in {self.gtfs_path}")
+                logger.warning("trips.txt not found in %s", self.gtfs_path)
 
             # Load stop_times.txt (for trip → stop mapping)
             stop_times_file = self.gtfs_path / "stop_times.txt"
             if stop_times_file.exists():
                 self._load_stop_times(stop_times_file)
-                logger.info(f"Built route-to-stop mapping for {len(self.route_to_stops)} routes")
+                logger.info("Built route-to-stop mapping for %s routes", len(self.route_to_stops))
             else:
-                logger.warning(f"stop_times.txt not found in {self.gtfs_path}")
+                logger.warning("stop_times.txt not found in %s", self.gtfs_path)
 
             self._loaded = True
             return True
 
         except Exception as e:
-            logger.error(f"Error loading GTFS static feed: {e}")
+            logger.error("Error loading GTFS static feed: %s", e)
             return False
 
     def _load_stops(self, stops_file: Path) -> None:
@@ -147,7 +147,7 @@ class GTFSStaticParser:
                         self.stops_by_name[stop_name_lower].append(stop)
 
                 except (ValueError, KeyError) as e:
-                    logger.debug(f"Skipping invalid stop row: {e}")
+                    logger.debug("Skipping invalid stop row: %s", e)
                     continue
 
     def _load_routes(self, routes_file: Path) -> None:
@@ -195,7 +195,7 @@ class GTFSStaticParser:
                                     self.routes_by_short_name[word].append(route)
 
                 except (ValueError, KeyError) as e:
-                    logger.debug(f"Skipping invalid route row: {e}")
+                    logger.debug("Skipping invalid route row: %s", e)
                     continue
 
     def _load_trips(self, trips_file: Path) -> None:
@@ -217,7 +217,7 @@ class GTFSStaticParser:
                         }
 
                 except (ValueError, KeyError) as e:
-                    logger.debug(f"Skipping invalid trip row: {e}")
+                    logger.debug("Skipping invalid trip row: %s", e)
                     continue
 
     def _load_stop_times(self, stop_times_file: Path) -> None:
@@ -246,7 +246,7 @@ class GTFSStaticParser:
                             route_stops[route_id].add(stop_id)
 
                 except (ValueError, KeyError) as e:
-                    logger.debug(f"Skipping invalid stop_times row: {e}")
+                    logger.debug("Skipping invalid stop_times row: %s", e)
                     continue
 
         # Convert sets to lists
@@ -349,8 +349,8 @@ class GTFSStaticParser:
 
                 if matching_route_stops:
                     logger.debug(
-                        f"Found {len(matching_route_stops)} stops matching route {route_id} "
-                        f"out of {len(stops)} total matches"
+                        "Found %s stops matching route %s out of %s total matches",
+                        len(matching_route_stops), route_id, len(stops)
                     )
                     return matching_route_stops[0].stop_id
 
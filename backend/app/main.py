@@ -8,8 +8,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
 import logging
-from typing import List, Optional, Dict, Tuple
-from datetime import datetime, timedelta
+import numpy as np
+from typing import List, Optional, Tuple
+from datetime import datetime
 
 from .models import (
     RouteRequest, RouteResponse, Point, UserProfile, GamificationStats,
@@ -17,11 +18,13 @@ from .models import (
 )
 from .routing_engine import RoutingEngine
 from .graph_builder import VancouverGraphBuilder
+from .api_clients import APIClientManager
 from .gamification import GamificationEngine
-from .config import settings, validate_api_keys, get_api_key_instructions
+from .cache import AsyncTTLCache, MISSING
+from .config import get_settings, validate_api_keys, get_api_key_instructions
 
 # Configure logging
-logging.basicConfig(level=getattr(logging, settings.log_level))
+logging.basicConfig(level=getattr(logging, get_settings().log_level))
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
@@ -34,26 +37,28 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=get_settings().cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 # Global instances
+api_client = None
 graph_builder = None
 routing_engine = None
 gamification_engine = GamificationEngine()
 
-# Geocoding cache (address -> (point, timestamp))
-_geocoding_cache: Dict[str, Tuple[Point, datetime]] = {}
-_cache_ttl = timedelta(minutes=30)  # Cache for 30 minutes
+# Geocoding cache (normalized address -> Point); addresses rarely move, so keep
+# results for a day and let the LRU bound the size
+GEOCODE_CACHE_TTL = 86_400  # seconds
+_geocoding_cache = AsyncTTLCache(maxsize=10_000)
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize the application on startup."""
-    global graph_builder, routing_engine
+    global api_client, graph_builder, routing_engine
 
     logger.info("Starting Route Recommendation System...")
 
@@ -63,9 +68,11 @@ async def startup_event():
         logger.warning("Some API keys are missing. Check the configuration.")
         logger.info(get_api_key_instructions())
 
-    # Initialize graph builder and routing engine
-    graph_builder = VancouverGraphBuilder()
-    routing_engine = RoutingEngine(graph_builder)
+    # Initialize graph builder and routing engine, sharing one set of API clients
+    # so every request reuses the same connection pool and response caches
+    api_client = APIClientManager()
+    graph_builder = VancouverGraphBuilder(api_client)
+    routing_engine = RoutingEngine(graph_builder, api_client)
 
     logger.info("Application started successfully!")
 
@@ -73,12 +80,14 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
-    global graph_builder, routing_engine
+    global api_client, graph_builder, routing_engine
 
     if routing_engine:
         await routing_engine.close()
     if graph_builder:
         await graph_builder.close()
+    if api_client:
+        await api_client.close()
 
     logger.info("Application shutdown complete.")
 
@@ -115,7 +124,7 @@ async def get_config():
     return {
         "api_keys_status": validate_api_keys(),
         "instructions": get_api_key_instructions(),
-        "vancouver_bounds": settings.vancouver_bounds,
+        "vancouver_bounds": get_settings().vancouver_bounds,
         "supported_modes": [mode.value for mode in TransportMode],
         "supported_preferences": [pref.value for pref in RoutePreference]
     }
@@ -147,7 +156,7 @@ async def calculate_route(request: RouteRequest):
             dest_in_bounds = _is_within_vancouver_bounds(request.destination)
 
             if not origin_in_bounds or not dest_in_bounds:
-                bounds = settings.vancouver_bounds
+                bounds = get_settings().vancouver_bounds
                 error_details = []
                 if not origin_in_bounds:
                     error_details.append(
@@ -160,7 +169,7 @@ async def calculate_route(request: RouteRequest):
                         f"(lat: {bounds['south']}-{bounds['north']}, lng: {bounds['west']}-{bounds['east']})"
                     )
 
-                logger.warning(f"Route request outside bounds: {', '.join(error_details)}")
+                logger.warning("Route request outside bounds: %s", ', '.join(error_details))
                 raise HTTPException(
                     status_code=400,
                     detail=f"Origin and destination must be within Vancouver city limits. {', '.join(error_details)}"
@@ -174,7 +183,7 @@ async def calculate_route(request: RouteRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error calculating route: {e}")
+        logger.error("Error calculating route: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -194,15 +203,11 @@ async def geocode_address(address: str):
         # Normalize address for cache key
         cache_key = address.lower().strip()
 
-        # Check cache first
-        if cache_key in _geocoding_cache:
-            cached_point, cached_time = _geocoding_cache[cache_key]
-            if datetime.now() - cached_time < _cache_ttl:
-                logger.debug(f"Using cached geocode for: {address}")
-                return cached_point
-            else:
-                # Remove expired entry
-                del _geocoding_cache[cache_key]
+        # Check cache first; stale entries are refetched rather than served
+        cached_point, fresh = _geocoding_cache.get(cache_key)
+        if cached_point is not MISSING and fresh:
+            logger.debug("Using cached geocode for: %s", address)
+            return cached_point
 
         # Check if we have API keys
         api_keys_status = validate_api_keys()
@@ -213,7 +218,7 @@ async def geocode_address(address: str):
             from .demo import DemoDataProvider
             point = DemoDataProvider.geocode_address(address)
             # Cache demo result too
-            _geocoding_cache[cache_key] = (point, datetime.now())
+            _geocoding_cache.set(cache_key, point, GEOCODE_CACHE_TTL)
             return point
 
         if not routing_engine or not routing_engine.api_client:
@@ -224,25 +229,15 @@ async def geocode_address(address: str):
         if not point:
             raise HTTPException(status_code=404, detail="Address not found")
 
-        # Cache the result
-        _geocoding_cache[cache_key] = (point, datetime.now())
-
-        # Clean up old cache entries periodically (keep cache size reasonable)
-        if len(_geocoding_cache) > 1000:
-            now = datetime.now()
-            expired_keys = [
-                key for key, (_, timestamp) in _geocoding_cache.items()
-                if now - timestamp > _cache_ttl
-            ]
-            for key in expired_keys:
-                del _geocoding_cache[key]
+        # Cache the result; the LRU evicts the oldest addresses past maxsize
+        _geocoding_cache.set(cache_key, point, GEOCODE_CACHE_TTL)
 
         return point
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error geocoding address: {e}")
+        logger.error("Error geocoding address: %s", e)
         # Fallback to demo mode
         logger.info("Falling back to demo geocoding due to error")
         from .demo import DemoDataProvider
@@ -281,7 +276,7 @@ async def calculate_rewards(route: dict, user_profile: dict):
         return rewards
 
     except Exception as e:
-        logger.error(f"Error calculating rewards: {e}")
+        logger.error("Error calculating rewards: %s", e)
         # Fallback to demo mode
         logger.info("Falling back to demo gamification due to error")
         from .demo import DemoGamificationProvider
@@ -317,7 +312,7 @@ async def get_achievements():
             ]
         }
     except Exception as e:
-        logger.error(f"Error getting achievements: {e}")
+        logger.error("Error getting achievements: %s", e)
         # Fallback to demo mode
         from .demo import DemoGamificationProvider
         return {"achievements": DemoGamificationProvider.get_demo_achievements()}
@@ -349,7 +344,7 @@ async def get_badges():
             ]
         }
     except Exception as e:
-        logger.error(f"Error getting badges: {e}")
+        logger.error("Error getting badges: %s", e)
         # Fallback to demo mode
         from .demo import DemoGamificationProvider
         return {"badges": DemoGamificationProvider.get_demo_badges()}
@@ -372,7 +367,7 @@ async def get_daily_challenges():
             "challenges": gamification_engine.get_daily_challenges()
         }
     except Exception as e:
-        logger.error(f"Error getting challenges: {e}")
+        logger.error("Error getting challenges: %s", e)
         # Fallback to demo mode
         from .demo import DemoGamificationProvider
         return {"challenges": DemoGamificationProvider.get_demo_daily_challenges()}
@@ -395,7 +390,7 @@ async def get_leaderboard(limit: int = 10):
             "leaderboard": gamification_engine.get_leaderboard_data(limit)
         }
     except Exception as e:
-        logger.error(f"Error getting leaderboard: {e}")
+        logger.error("Error getting leaderboard: %s", e)
         # Fallback to demo mode
         from .demo import DemoGamificationProvider
         return {"leaderboard": DemoGamificationProvider.get_demo_leaderboard()}
@@ -418,12 +413,18 @@ async def get_sustainability_tips():
             "tips": gamification_engine.get_sustainability_tips()
         }
     except Exception as e:
-        logger.error(f"Error getting tips: {e}")
+        logger.error("Error getting tips: %s", e)
         # Fallback to demo mode
         from .demo import DemoGamificationProvider
         return {"tips": DemoGamificationProvider.get_demo_sustainability_tips()}
 
 
+def _vancouver_bounds() -> Tuple[float, float, float, float]:
+    """Current Vancouver bounds as (south, north, west, east), read from the settings on each call."""
+    bounds = get_settings().vancouver_bounds
+    return bounds["south"], bounds["north"], bounds["west"], bounds["east"]
+
+
 def _is_within_vancouver_bounds(point: Point) -> bool:
     """
     Check if a point is within Vancouver city bounds.
@@ -434,11 +435,25 @@ def _is_within_vancouver_bounds(point: Point) -> bool:
     Returns:
         True if point is within bounds, False otherwise
     """
-    bounds = settings.vancouver_bounds
-    return (
-        bounds["south"] <= point.lat <= bounds["north"] and
-        bounds["west"] <= point.lng <= bounds["east"]
-    )
+    south, north, west, east = _vancouver_bounds()
+    return south <= point.lat <= north and west <= point.lng <= east
+
+
+def _is_within_vancouver_bounds_array(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """
+    Check which of a batch of points are within Vancouver city bounds.
+
+    Args:
+        lats: Latitudes of the points
+        lngs: Longitudes of the points
+
+    Returns:
+        Boolean array, True where the point is within bounds
+    """
+    south, north, west, east = _vancouver_bounds()
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    return (lats >= south) & (lats <= north) & (lngs >= west) & (lngs <= east)
 
 
 if __name__ == "__main__":
@@ -446,6 +461,6 @@ if __name__ == "__main__":
         "backend.app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.debug,
-        log_level=settings.log_level.lower()
+        reload=get_settings().debug,
+        log_level=get_settings().log_level.lower()
     )
@@ -85,7 +85,8 @@ class Edge(BaseModel):
     distance: float = Field(..., description="Distance in meters")
     allowed_modes: List[TransportMode] = Field(..., description="Allowed transportation modes")
 
-    # Dynamic attributes (updated in real-time)
+    # Dynamic attributes (updated in real-time); for graph edges the builder keeps
+    # them in its edge columns and VancouverGraphBuilder.get_edge fills them in
     current_traffic_speed: Optional[float] = None  # km/h
     slope: Optional[float] = None  # percentage grade
     weather_penalty: float = Field(default=1.0, ge=0.0)
@@ -184,7 +185,8 @@ class WeatherData(BaseModel):
 
 class TrafficData(BaseModel):
     """Real-time traffic information."""
-    edge_id: str
+    edge_id: Optional[str] = None  # Graph edge ID, when the source knows it
+    edge_key: Optional[Tuple[float, float]] = None  # (lat, lng) of the segment start, for sources without edge IDs
     current_speed: float  # km/h
     free_flow_speed: float  # km/h
     congestion_level: float = Field(ge=0.0, le=1.0)  # 0 = no congestion, 1 = severe
@@ -0,0 +1,135 @@
+"""
+Resilience helpers for calls to external APIs.
+Provides retry with exponential backoff and jitter, and per-host circuit breakers.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Upstream statuses worth retrying (rate limiting and transient server errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited because the host's breaker is open."""
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Get the Retry-After delay (seconds) from an HTTP error, if present."""
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    value = error.response.headers.get("Retry-After", "")
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def retry(
+    max_attempts: int = 3,
+    base: float = 0.2,
+    max_backoff: float = 2.0,
+    retry_on: Tuple[Type[Exception], ...] = (httpx.TransportError, httpx.HTTPStatusError)
+):
+    """
+    Retry an async function with exponential backoff and full jitter.
+
+    Status errors are only retried for RETRYABLE_STATUS_CODES, and an upstream
+    ``Retry-After`` header is honored (capped at ``max_backoff``).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(max_attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except retry_on as e:
+                    if isinstance(e, httpx.HTTPStatusError) and e.response.status_code not in RETRYABLE_STATUS_CODES:
+                        raise
+                    if attempt == max_attempts - 1:
+                        raise
+
+                    delay = _retry_after(e)
+                    if delay is None:
+                        delay = random.uniform(0, base * 2 ** attempt)
+                    delay = min(delay, max_backoff)
+                    logger.debug("Retrying %s in %.2fs after %s: %s", func.__name__, delay, type(e).__name__, e)
+                    await asyncio.sleep(delay)
+        return wrapper
+    return decorator
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single upstream host.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and calls
+    fail fast with CircuitOpenError. Once ``reset_timeout`` seconds have passed
+    one trial call is let through; success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open, or half_open."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Call ``func`` through the breaker."""
+        state = self.state
+        if state == "open":
+            raise CircuitOpenError("Circuit open, skipping call to failing upstream")
+        if state == "half_open":
+            # Let a single trial through; concurrent callers keep failing fast
+            self.opened_at = time.monotonic()
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+
+        self.failures = 0
+        self.opened_at = None
+        return result
+
+    def _record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning("Circuit opened after %s consecutive failures", self.failures)
+            self.opened_at = time.monotonic()
+
+
+class HostCircuitBreakers:
+    """Registry of circuit breakers keyed by URL host."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def __call__(self, url: str) -> CircuitBreaker:
+        """Get the circuit breaker for the host of a URL."""
+        host = httpx.URL(url).host
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return breaker
@@ -278,17 +278,18 @@ def filter_routes_with_closures(
         if has_closure:
             filtered_routes.append(route)
             closures_by_route[route.id] = route_closures
-            logger.debug(
-                f"Filtered route {route.id} due to {len(route_closures)} closure(s): "
-                f"{[c.get('description', 'Unknown')[:50] for c in route_closures]}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Filtered route %s due to %s closure(s): %s",
+                    route.id, len(route_closures), [c.get('description', 'Unknown')[:50] for c in route_closures]
+                )
         else:
             valid_routes.append(route)
 
     if filtered_routes:
         logger.info(
-            f"Filtered {len(filtered_routes)} routes due to closures/construction "
-            f"(total closures: {len(all_closures)})"
+            "Filtered %s routes due to closures/construction (total closures: %s)",
+            len(filtered_routes), len(all_closures)
         )
 
     return valid_routes, filtered_routes, closures_by_route
@@ -3,7 +3,8 @@ Cost functions for different route preferences.
 Each function calculates the cost of traversing an edge based on the preference.
 """
 
-from typing import Optional
+import functools
+from typing import Dict, NamedTuple, Optional
 from ..models import Edge, TransportMode, RoutePreference
 
 
@@ -19,6 +20,9 @@ MODE_SPEEDS = {
     TransportMode.WESTCOAST_EXPRESS: 60.0
 }
 
+# Seconds per meter for each mode, so travel time is one multiply per edge
+MODE_INV_SPEED_MPS = {mode: 3600.0 / (speed * 1000.0) for mode, speed in MODE_SPEEDS.items()}
+
 # Mode switching costs (seconds)
 MODE_SWITCH_COSTS = {
     (TransportMode.WALKING, TransportMode.BIKING): 60,
@@ -43,147 +47,122 @@ MODE_SWITCH_COSTS = {
     (TransportMode.BUS, TransportMode.CAR): 240,
 }
 
+# Switch costs as a dense mode -> mode -> seconds table (0 where no cost is
+# defined), so the per-edge lookup needs no tuple key
+MODE_SWITCH_COST_TABLE = {
+    previous: {mode: MODE_SWITCH_COSTS.get((previous, mode), 0) for mode in TransportMode}
+    for previous in TransportMode
+}
 
-def fastest_cost_function(edge: Edge, mode: TransportMode, previous_mode: Optional[TransportMode]) -> float:
-    """Cost function for fastest route (time-based)."""
-    base_time = edge.distance / (MODE_SPEEDS[mode] * 1000 / 3600)  # seconds
-
-    # Apply penalties
-    effective_time = base_time * edge.weather_penalty * edge.event_penalty
-
-    # Add mode switching cost
-    if previous_mode and previous_mode != mode:
-        switch_cost = MODE_SWITCH_COSTS.get((previous_mode, mode), 0)
-        effective_time += switch_cost
-
-    return effective_time
-
-
-def safest_cost_function(edge: Edge, mode: TransportMode, previous_mode: Optional[TransportMode]) -> float:
-    """Cost function for safest route (safety-weighted time)."""
-    base_time = edge.distance / (MODE_SPEEDS[mode] * 1000 / 3600)
-
-    # Safety penalty based on mode and road conditions
-    safety_penalty = 1.0
-    if mode == TransportMode.CAR and not edge.is_bike_lane:
-        safety_penalty = 1.2  # Cars are less safe
-    elif mode in [TransportMode.BIKING, TransportMode.SCOOTER] and not edge.is_bike_lane:
-        safety_penalty = 1.5  # Bikes/scooters on roads without bike lanes
+# Energy efficiency weight per meter by mode (energy-efficient preference)
+ENERGY_WEIGHTS = {
+    TransportMode.WALKING: 0.1,
+    TransportMode.BIKING: 0.2,
+    TransportMode.SCOOTER: 0.3,
+    TransportMode.BUS: 0.4,
+    TransportMode.SKYTRAIN: 0.4,
+    TransportMode.CAR: 1.0
+}
 
-    effective_time = base_time * edge.weather_penalty * edge.event_penalty * safety_penalty
+# Scenic bonus (negative cost) for slower, more scenic modes
+SCENIC_BONUS = {
+    TransportMode.WALKING: -0.2,
+    TransportMode.BIKING: -0.1,
+    TransportMode.SCOOTER: 0.0,
+    TransportMode.BUS: 0.0,
+    TransportMode.CAR: 0.1
+}
 
-    # Add mode switching cost
-    if previous_mode and previous_mode != mode:
-        switch_cost = MODE_SWITCH_COSTS.get((previous_mode, mode), 0)
-        effective_time += switch_cost
+# Health bonus for active modes
+HEALTH_BONUS = {
+    TransportMode.WALKING: -0.3,
+    TransportMode.BIKING: -0.2,
+    TransportMode.SCOOTER: -0.1,
+    TransportMode.BUS: 0.0,
+    TransportMode.CAR: 0.2
+}
 
-    return effective_time
+# Relative cost per km by mode (cheapest preference)
+COST_WEIGHTS = {
+    TransportMode.WALKING: 0.0,
+    TransportMode.BIKING: 0.1,
+    TransportMode.SCOOTER: 0.5,
+    TransportMode.BUS: 0.3,
+    TransportMode.SKYTRAIN: 0.4,
+    TransportMode.CAR: 1.0
+}
 
 
-def energy_efficient_cost_function(edge: Edge, mode: TransportMode, previous_mode: Optional[TransportMode]) -> float:
-    """Cost function for energy-efficient route."""
-    base_time = edge.distance / (MODE_SPEEDS[mode] * 1000 / 3600)
+# Extra time multiplier for modes sharing a road without a bike lane (safest preference)
+SAFETY_PENALTIES = {
+    TransportMode.CAR: 1.2,
+    TransportMode.BIKING: 1.5,
+    TransportMode.SCOOTER: 1.5
+}
 
-    # Energy efficiency weights
-    energy_weights = {
-        TransportMode.WALKING: 0.1,
-        TransportMode.BIKING: 0.2,
-        TransportMode.SCOOTER: 0.3,
-        TransportMode.BUS: 0.4,
-        TransportMode.SKYTRAIN: 0.4,
-        TransportMode.CAR: 1.0
-    }
 
-    energy_cost = edge.distance * energy_weights.get(mode, 0.5)
-    effective_time = base_time + energy_cost
+class CostProfile(NamedTuple):
+    """Per-preference edge cost parameters, dense over every transport mode."""
+    time_factor: Dict[TransportMode, float]  # multiplier on travel time
+    per_meter: Dict[TransportMode, float]  # cost added per meter of edge
+    uses_penalties: bool  # apply edge weather/event penalties
+    uses_safety: bool  # apply SAFETY_PENALTIES off bike lanes
 
-    # Add mode switching cost
-    if previous_mode and previous_mode != mode:
-        switch_cost = MODE_SWITCH_COSTS.get((previous_mode, mode), 0)
-        effective_time += switch_cost
 
-    return effective_time
+def _per_mode(values: Dict[TransportMode, float], default: float, scale: float = 1.0) -> Dict[TransportMode, float]:
+    """Fill a mode table for every transport mode, scaling each value."""
+    return {mode: values.get(mode, default) * scale for mode in TransportMode}
 
 
-def scenic_cost_function(edge: Edge, mode: TransportMode, previous_mode: Optional[TransportMode]) -> float:
-    """Cost function for scenic route."""
-    base_time = edge.distance / (MODE_SPEEDS[mode] * 1000 / 3600)
+def _bonus_factors(bonuses: Dict[TransportMode, float]) -> Dict[TransportMode, float]:
+    """Turn per-mode bonuses into travel time multipliers."""
+    return {mode: 1 + bonus for mode, bonus in _per_mode(bonuses, 0.0).items()}
 
-    # Scenic bonus (negative cost) for slower, more scenic modes
-    scenic_bonus = {
-        TransportMode.WALKING: -0.2,
-        TransportMode.BIKING: -0.1,
-        TransportMode.SCOOTER: 0.0,
-        TransportMode.BUS: 0.0,
-        TransportMode.CAR: 0.1
-    }
 
-    effective_time = base_time * (1 + scenic_bonus.get(mode, 0))
+_ONES = _per_mode({}, 1.0)
+_ZEROS = _per_mode({}, 0.0)
 
-    # Add mode switching cost
-    if previous_mode and previous_mode != mode:
-        switch_cost = MODE_SWITCH_COSTS.get((previous_mode, mode), 0)
-        effective_time += switch_cost
+COST_PROFILES = {
+    RoutePreference.FASTEST: CostProfile(_ONES, _ZEROS, True, False),
+    RoutePreference.SAFEST: CostProfile(_ONES, _ZEROS, True, True),
+    RoutePreference.ENERGY_EFFICIENT: CostProfile(_ONES, _per_mode(ENERGY_WEIGHTS, 0.5), False, False),
+    RoutePreference.SCENIC: CostProfile(_bonus_factors(SCENIC_BONUS), _ZEROS, False, False),
+    RoutePreference.HEALTHY: CostProfile(_bonus_factors(HEALTH_BONUS), _ZEROS, False, False),
+    # COST_WEIGHTS are per km
+    RoutePreference.CHEAPEST: CostProfile(_ONES, _per_mode(COST_WEIGHTS, 0.5, scale=0.001), False, False),
+}
 
-    return effective_time
 
+def edge_cost(edge: Edge, mode: TransportMode, previous_mode: Optional[TransportMode],
+              profile: CostProfile = COST_PROFILES[RoutePreference.FASTEST]) -> float:
+    """
+    Cost of traversing an edge in a mode under one preference's cost profile.
 
-def healthy_cost_function(edge: Edge, mode: TransportMode, previous_mode: Optional[TransportMode]) -> float:
-    """Cost function for healthy route (encourages active transportation)."""
-    base_time = edge.distance / (MODE_SPEEDS[mode] * 1000 / 3600)
+    Graph edges should come from VancouverGraphBuilder.get_edge so the
+    weather and event penalties are current.
+    """
+    cost = edge.distance * MODE_INV_SPEED_MPS[mode] * profile.time_factor[mode]  # seconds
 
-    # Health bonus for active modes
-    health_bonus = {
-        TransportMode.WALKING: -0.3,
-        TransportMode.BIKING: -0.2,
-        TransportMode.SCOOTER: -0.1,
-        TransportMode.BUS: 0.0,
-        TransportMode.CAR: 0.2
-    }
+    if profile.uses_penalties:
+        cost *= edge.weather_penalty * edge.event_penalty
+    if profile.uses_safety and not edge.is_bike_lane:
+        cost *= SAFETY_PENALTIES.get(mode, 1.0)
 
-    effective_time = base_time * (1 + health_bonus.get(mode, 0))
+    cost += edge.distance * profile.per_meter[mode]
 
     # Add mode switching cost
-    if previous_mode and previous_mode != mode:
-        switch_cost = MODE_SWITCH_COSTS.get((previous_mode, mode), 0)
-        effective_time += switch_cost
-
-    return effective_time
-
-
-def cheapest_cost_function(edge: Edge, mode: TransportMode, previous_mode: Optional[TransportMode]) -> float:
-    """Cost function for cheapest route."""
-    base_time = edge.distance / (MODE_SPEEDS[mode] * 1000 / 3600)
+    if previous_mode:
+        cost += MODE_SWITCH_COST_TABLE[previous_mode][mode]
 
-    # Cost per mode (relative)
-    cost_weights = {
-        TransportMode.WALKING: 0.0,
-        TransportMode.BIKING: 0.1,
-        TransportMode.SCOOTER: 0.5,
-        TransportMode.BUS: 0.3,
-        TransportMode.SKYTRAIN: 0.4,
-        TransportMode.CAR: 1.0
-    }
-
-    cost = base_time + (edge.distance / 1000) * cost_weights.get(mode, 0.5)
+    return cost
 
-    # Add mode switching cost
-    if previous_mode and previous_mode != mode:
-        switch_cost = MODE_SWITCH_COSTS.get((previous_mode, mode), 0)
-        cost += switch_cost
 
-    return cost
+COST_FUNCTIONS = {
+    preference: functools.partial(edge_cost, profile=profile)
+    for preference, profile in COST_PROFILES.items()
+}
 
 
 def get_cost_function(preference: RoutePreference):
     """Get cost function based on route preference."""
-    cost_functions = {
-        RoutePreference.FASTEST: fastest_cost_function,
-        RoutePreference.SAFEST: safest_cost_function,
-        RoutePreference.ENERGY_EFFICIENT: energy_efficient_cost_function,
-        RoutePreference.SCENIC: scenic_cost_function,
-        RoutePreference.HEALTHY: healthy_cost_function,
-        RoutePreference.CHEAPEST: cheapest_cost_function,
-    }
-    return cost_functions.get(preference, fastest_cost_function)
-
+    return COST_FUNCTIONS.get(preference, COST_FUNCTIONS[RoutePreference.FASTEST])
@@ -36,16 +36,19 @@ async def update_graph_with_real_time_data(graph_builder, real_time_data: Dict):
         # Update weather penalties
         weather = real_time_data.get("weather")
         if weather:
-            weather_penalty = calculate_weather_penalty(weather)
-            for edge in graph_builder.edges.values():
-                edge.weather_penalty = weather_penalty
+            graph_builder.edge_weather_penalty[:] = calculate_weather_penalty(weather)
 
-        # Update traffic data
+        # Update traffic data for the edges it names, in one indexed write
         traffic_data = real_time_data.get("traffic", [])
-        for traffic in traffic_data:
-            if traffic.edge_id in graph_builder.edges:
-                edge = graph_builder.edges[traffic.edge_id]
-                edge.current_traffic_speed = traffic.current_speed
+        edge_rows = graph_builder.edge_rows
+        matched = [
+            (edge_rows[traffic.edge_id], traffic.current_speed)
+            for traffic in traffic_data
+            if traffic.edge_id in edge_rows
+        ]
+        if matched:
+            rows, speeds = zip(*matched)
+            graph_builder.edge_traffic_speed[list(rows)] = speeds
 
         # Update event penalties (road closures, construction)
         road_closures = real_time_data.get("road_closures", [])
@@ -55,7 +58,7 @@ async def update_graph_with_real_time_data(graph_builder, real_time_data: Dict):
         # For now, we'll use default values
 
     except Exception as e:
-        logger.error(f"Error updating graph with real-time data: {e}")
+        logger.error("Error updating graph with real-time data: %s", e)
 
 
 async def get_realtime_transit_info(
@@ -20,6 +20,17 @@ from .realtime_integration import calculate_weather_penalty, get_realtime_transi
 
 logger = logging.getLogger(__name__)
 
+# Strips HTML tags from Google step instructions
+_HTML_TAG = re.compile('<[^<]+?>')
+
+# Prefix for step instructions in bad weather, by weather condition value
+WEATHER_NOTES = {
+    "rain": "🌧️ Rainy conditions",
+    "snow": "❄️ Snowy conditions",
+    "fog": "🌫️ Foggy conditions",
+    "extreme": "⚠️ Extreme weather"
+}
+
 
 async def convert_google_route_to_route(
     google_route: Dict[str, any],
@@ -35,6 +46,16 @@ async def convert_google_route_to_route(
         total_time = 0
         total_sustainability_points = 0
 
+        # Weather adjustments are the same for every step of the route, so work
+        # them out once up front
+        weather = real_time_data.get("weather")
+        weather_penalty = None
+        weather_note = ""
+        if weather and transport_mode in [TransportMode.WALKING, TransportMode.BIKING]:
+            weather_penalty = calculate_weather_penalty(weather)
+            if weather.condition.value != "clear":
+                weather_note = WEATHER_NOTES.get(weather.condition.value, "")
+
         # Process each leg in the route
         for leg in google_route.get("legs", []):
             leg_distance = leg.get("distance", {}).get("value", 0)  # meters
@@ -49,13 +70,15 @@ async def convert_google_route_to_route(
                 start_location = step.get("start_location", {})
                 end_location = step.get("end_location", {})
 
-                start_point = Point(
-                    lat=start_location.get("lat", request.origin.lat),
-                    lng=start_location.get("lng", request.origin.lng)
+                # Steps are rebuilt for every route on every request, so points and
+                # steps skip validation; every value is coerced or computed here
+                start_point = Point.model_construct(
+                    lat=float(start_location.get("lat", request.origin.lat)),
+                    lng=float(start_location.get("lng", request.origin.lng))
                 )
-                end_point = Point(
-                    lat=end_location.get("lat", request.destination.lat),
-                    lng=end_location.get("lng", request.destination.lng)
+                end_point = Point.model_construct(
+                    lat=float(end_location.get("lat", request.destination.lat)),
+                    lng=float(end_location.get("lng", request.destination.lng))
                 )
 
                 # Extract polyline for accurate route rendering
@@ -66,28 +89,19 @@ async def convert_google_route_to_route(
                 # Get step instructions
                 instructions = step.get("html_instructions", "")
                 # Remove HTML tags
-                instructions = re.sub('<[^<]+?>', '', instructions)
+                instructions = _HTML_TAG.sub('', instructions)
 
                 # Calculate sustainability points
                 sustainability_points = calculate_sustainability_points(transport_mode, step_distance)
 
                 # Apply weather penalties to walking and biking
-                weather = real_time_data.get("weather")
-                if weather and transport_mode in [TransportMode.WALKING, TransportMode.BIKING]:
-                    weather_penalty = calculate_weather_penalty(weather)
+                if weather_penalty is not None:
                     # Adjust time based on weather
                     step_duration = int(step_duration * weather_penalty)
 
                     # Add weather info to instructions
-                    if weather.condition.value != "clear":
-                        weather_note = {
-                            "rain": "🌧️ Rainy conditions",
-                            "snow": "❄️ Snowy conditions",
-                            "fog": "🌫️ Foggy conditions",
-                            "extreme": "⚠️ Extreme weather"
-                        }.get(weather.condition.value, "")
-                        if weather_note:
-                            instructions = f"{weather_note} - {instructions}"
+                    if weather_note:
+                        instructions = f"{weather_note} - {instructions}"
 
                 # Determine effort level based on distance, mode, and weather
                 effort_level = _determine_effort_level(transport_mode, step_distance, weather)
@@ -105,10 +119,10 @@ async def convert_google_route_to_route(
                     step_duration
                 )
 
-                route_step = RouteStep(
+                route_step = RouteStep.model_construct(
                     mode=transport_mode,
-                    distance=step_distance,
-                    estimated_time=step_duration,
+                    distance=float(step_distance),
+                    estimated_time=int(step_duration),
                     slope=slope,
                     effort_level=effort_level,
                     instructions=instructions or f"Continue {step_distance/1000:.1f}km",
@@ -151,7 +165,7 @@ async def convert_google_route_to_route(
         return route
 
     except Exception as e:
-        logger.error(f"Error converting Google route: {e}")
+        logger.error("Error converting Google route: %s", e)
         return None
 
 
@@ -278,11 +292,11 @@ async def _extract_transit_details(
                     step_duration += real_time_arrival.get("delay_seconds", 0)
 
                 logger.debug(
-                    f"Applied real-time delay for route {route_short_name}: "
-                    f"{real_time_arrival.get('delay_minutes', 0)} minutes"
+                    "Applied real-time delay for route %s: %s minutes",
+                    route_short_name, real_time_arrival.get('delay_minutes', 0)
                 )
         except Exception as e:
-            logger.debug(f"Could not get real-time data for route {route_short_name}: {e}")
+            logger.debug("Could not get real-time data for route %s: %s", route_short_name, e)
 
     # Apply weather penalty to transit time if weather is bad
     weather = real_time_data.get("weather")
@@ -5,6 +5,9 @@ Route scoring and sorting based on user preferences.
 from typing import List
 from ..models import Route, RoutePreference
 
+# Minimum relative difference in total distance for a route to count as distinct
+MIN_DISTANCE_DIFFERENCE = 0.2
+
 
 def apply_preference_scoring(route: Route, preferences: List[RoutePreference]) -> Route:
     """Apply preference-based scoring to enhance route metrics."""
@@ -57,18 +60,24 @@ def is_significantly_different(route: Route, existing_routes: List[Route]) -> bo
     if not existing_routes:
         return True
 
+    # The candidate's modes don't change between comparisons, so collect them once
+    route_modes = {step.mode for step in route.steps}
+
     # Check if route uses different modes or has significantly different distance
     for existing_route in existing_routes:
         # Compare total distance (should be at least 20% different)
         distance_ratio = abs(route.total_distance - existing_route.total_distance) / existing_route.total_distance
-        if distance_ratio < 0.2:
+        if distance_ratio < MIN_DISTANCE_DIFFERENCE:
             return False
 
-        # Compare modes used
-        route_modes = set(step.mode for step in route.steps)
-        existing_modes = set(step.mode for step in existing_route.steps)
-        if route_modes == existing_modes:
-            return False
+        # Compare modes used, stopping at the first step with a mode the candidate lacks
+        existing_modes = set()
+        for step in existing_route.steps:
+            if step.mode not in route_modes:
+                break
+            existing_modes.add(step.mode)
+        else:
+            if existing_modes == route_modes:
+                return False
 
     return True
-
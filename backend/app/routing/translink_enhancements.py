@@ -85,12 +85,12 @@ def filter_routes_with_service_alerts(routes: List[Route]) -> Tuple[List[Route],
     for route in routes:
         if has_service_alerts(route):
             filtered_routes.append(route)
-            logger.debug(f"Filtered route {route.id} due to service alerts")
+            logger.debug("Filtered route %s due to service alerts", route.id)
         else:
             valid_routes.append(route)
 
     if filtered_routes:
-        logger.info(f"Filtered {len(filtered_routes)} routes due to service alerts")
+        logger.info("Filtered %s routes due to service alerts", len(filtered_routes))
 
     return valid_routes, filtered_routes
 
@@ -136,12 +136,12 @@ def filter_routes_by_delay_threshold(
         max_delay = get_route_max_delay(route)
         if max_delay > max_delay_minutes:
             filtered_routes.append(route)
-            logger.debug(f"Filtered route {route.id} due to delay ({max_delay}min > {max_delay_minutes}min)")
+            logger.debug("Filtered route %s due to delay (%smin > %smin)", route.id, max_delay, max_delay_minutes)
         else:
             valid_routes.append(route)
 
     if filtered_routes:
-        logger.info(f"Filtered {len(filtered_routes)} routes due to delays exceeding {max_delay_minutes} minutes")
+        logger.info("Filtered %s routes due to delays exceeding %s minutes", len(filtered_routes), max_delay_minutes)
 
     return valid_routes, filtered_routes
 
@@ -233,8 +233,8 @@ def find_alternative_transit_routes(
     alternatives = sort_routes_by_delay(alternatives)
 
     logger.info(
-        f"Found {len(alternatives)} alternative routes for delayed route "
-        f"(delay: {max_delay}min, threshold: {delay_threshold}min)"
+        "Found %s alternative routes for delayed route (delay: %smin, threshold: %smin)",
+        len(alternatives), max_delay, delay_threshold
     )
 
     return alternatives[:3]  # Return top 3 alternatives
@@ -293,8 +293,8 @@ def apply_translink_enhancements(
         enhanced_routes = sort_routes_by_delay(enhanced_routes, prefer_on_time=True)
 
     logger.info(
-        f"TransLink enhancements: {len(enhanced_routes)} routes remaining "
-        f"(filtered {len(filtered_routes)}, found {len(alternatives_by_route)} alternatives)"
+        "TransLink enhancements: %s routes remaining (filtered %s, found %s alternatives)",
+        len(enhanced_routes), len(filtered_routes), len(alternatives_by_route)
     )
 
     return enhanced_routes, filtered_routes, alternatives_by_route
@@ -6,16 +6,18 @@ This is the refactored version that uses modular components from the routing pac
 """
 
 import time
-from typing import List, Dict, Optional
+import uuid
+from typing import Hashable, List, Dict, Optional, Tuple
 from datetime import datetime
 import logging
 import asyncio
 
 from .models import (
-    RouteRequest, RouteResponse, TransportMode
+    RouteRequest, RouteResponse, TransportMode, Route
 )
 from .graph_builder import VancouverGraphBuilder
 from .api_clients import APIClientManager
+from .cache import AsyncTTLCache, MISSING
 from .routing import (
     convert_google_route_to_route,
     apply_preference_scoring,
@@ -26,13 +28,39 @@ from .routing import (
 
 logger = logging.getLogger(__name__)
 
+# How long a computed route response is reused for the same trip (seconds);
+# short enough that traffic, weather and transit delays stay current
+ROUTE_CACHE_TTL = 60
+
+# Origins/destinations are snapped to this many decimal places (~10m) for the
+# route cache key, so repeated requests for the same trip share an entry
+ROUTE_CACHE_PRECISION = 4
+
+
+def _route_cache_key(request: RouteRequest) -> Hashable:
+    """Key for the route response cache: snapped endpoints plus every option that changes the routes."""
+    return (
+        round(request.origin.lat, ROUTE_CACHE_PRECISION), round(request.origin.lng, ROUTE_CACHE_PRECISION),
+        round(request.destination.lat, ROUTE_CACHE_PRECISION), round(request.destination.lng, ROUTE_CACHE_PRECISION),
+        tuple(request.preferences),
+        tuple(request.transport_modes),
+        request.avoid_highways,
+        request.departure_time is not None
+    )
+
 
 class RoutingEngine:
     """Routing engine using Google Maps Directions API with multi-modal support."""
 
-    def __init__(self, graph_builder: VancouverGraphBuilder):
+    def __init__(self, graph_builder: VancouverGraphBuilder, api_client: Optional[APIClientManager] = None):
         self.graph_builder = graph_builder
-        self.api_client = APIClientManager()
+
+        # Share the caller's API clients (and connection pool) when given one
+        self._owns_api_client = api_client is None
+        self.api_client = api_client or APIClientManager()
+
+        # Recent responses by trip, so repeated requests skip the upstream calls
+        self._route_cache = AsyncTTLCache(maxsize=1024)
 
     async def find_routes(self, request: RouteRequest) -> RouteResponse:
         """
@@ -56,6 +84,16 @@ class RoutingEngine:
                 from .demo import DemoDataProvider
                 return DemoDataProvider.generate_demo_routes(request)
 
+            cache_key = _route_cache_key(request)
+            cached, fresh = self._route_cache.get(cache_key)
+            if cached is not MISSING and fresh:
+                logger.debug("Using cached routes for %s -> %s", request.origin, request.destination)
+                # Deep copy so callers can't change the cached routes
+                return cached.model_copy(deep=True, update={
+                    "request_id": str(uuid.uuid4()),
+                    "processing_time": (datetime.now() - start_time).total_seconds()
+                })
+
             # Get real-time data (weather, transit, etc.) for enhancement
             real_time_data = await self._fetch_realtime_data(request)
 
@@ -80,95 +118,80 @@ class RoutingEngine:
             transit_modes = {TransportMode.BUS, TransportMode.SKYTRAIN}
             processed_modes = set()
 
-            # Get routes for each requested transport mode
+            # Pick the requested modes that need their own Google Maps query
+            mode_queries = []
             for transport_mode in request.transport_modes:
-                try:
-                    # Skip if we already processed transit modes
-                    if transport_mode in transit_modes and "transit" in processed_modes:
-                        logger.debug(f"Skipping {transport_mode} - transit already processed")
-                        continue
+                # Skip if we already processed transit modes
+                if transport_mode in transit_modes and "transit" in processed_modes:
+                    logger.debug("Skipping %s - transit already processed", transport_mode)
+                    continue
 
-                    google_mode = mode_mapping.get(transport_mode, "driving")
-                    if google_mode in processed_modes:
-                        logger.debug(f"Skipping {transport_mode} - {google_mode} already processed")
-                        continue
+                google_mode = mode_mapping.get(transport_mode, "driving")
+                if google_mode in processed_modes:
+                    logger.debug("Skipping %s - %s already processed", transport_mode, google_mode)
+                    continue
 
-                    processed_modes.add(google_mode)
-                    logger.info(f"Processing transport mode: {transport_mode} -> Google Maps mode: {google_mode}")
-
-                    # Build avoid list based on preferences
-                    avoid_list = []
-                    if request.avoid_highways:
-                        avoid_list.append("highways")
-
-                    # Get directions from Google Maps (with timeout)
-                    api_start_time = time.time()
-                    try:
-                        directions_data = await asyncio.wait_for(
-                            self.api_client.google_maps.get_directions(
-                                origin=request.origin,
-                                destination=request.destination,
-                                mode=google_mode,
-                                alternatives=True,
-                                avoid=avoid_list if avoid_list else None,
-                                departure_time="now" if request.departure_time else None
-                            ),
-                            timeout=5.0  # 5 second timeout for Google Maps API
-                        )
-                        elapsed = time.time() - api_start_time
-                        logger.info(f"Google Maps API call for {google_mode} completed in {elapsed:.2f}s")
-                    except asyncio.TimeoutError:
-                        logger.error(f"Google Maps API call for {google_mode} timed out after 5 seconds")
-                        continue
-                    except Exception as e:
-                        logger.error(f"Google Maps API call for {google_mode} failed: {type(e).__name__}: {e}")
-                        continue
+                processed_modes.add(google_mode)
+                logger.info("Processing transport mode: %s -> Google Maps mode: %s", transport_mode, google_mode)
+                mode_queries.append((transport_mode, google_mode))
+
+            # Build avoid list based on preferences
+            avoid_list = []
+            if request.avoid_highways:
+                avoid_list.append("highways")
 
+            # Query Google Maps for every mode at once, so the wait is the slowest
+            # call rather than the sum of them
+            all_directions = await asyncio.gather(*(
+                self._get_directions(request, google_mode, avoid_list)
+                for _, google_mode in mode_queries
+            ))
+
+            # Get routes for each requested transport mode
+            for (transport_mode, google_mode), directions_data in zip(mode_queries, all_directions):
+                try:
                     if not directions_data or not directions_data.get("routes"):
-                        logger.warning(f"No routes found for mode {transport_mode} (Google Maps mode: {google_mode})")
+                        logger.warning("No routes found for mode %s (Google Maps mode: %s)", transport_mode, google_mode)
                         continue
 
-                    logger.info(f"Found {len(directions_data.get('routes', []))} routes for {transport_mode}")
-
-                    # Process each route from Google Maps
-                    for route_idx, google_route in enumerate(directions_data.get("routes", [])):
-                        try:
-                            # Determine actual transport mode from route data
-                            actual_mode = self._determine_actual_mode(google_route, transport_mode, google_mode)
-
-                            # Convert Google Maps route to our Route model
-                            route = await convert_google_route_to_route(
-                                google_route,
-                                request,
-                                actual_mode,
-                                real_time_data,
-                                self.api_client
-                            )
+                    logger.info("Found %s routes for %s", len(directions_data.get('routes', [])), transport_mode)
+
+                    # Convert the primary route and its alternatives concurrently; each
+                    # one waits on its own transit lookups
+                    results = await asyncio.gather(
+                        *(
+                            self._convert_google_route(google_route, request, transport_mode, google_mode, real_time_data)
+                            for google_route in directions_data.get("routes", [])
+                        ),
+                        return_exceptions=True
+                    )
 
-                            if route:
-                                # Apply preference-based scoring
-                                route = apply_preference_scoring(route, request.preferences)
-
-                                if route_idx == 0:
-                                    routes.append(route)
-                                    logger.info(f"Added route for {actual_mode} (primary)")
-                                else:
-                                    alternatives.append(route)
-                                    logger.debug(f"Added alternative route for {actual_mode}")
-                            else:
-                                logger.warning(f"Route conversion returned None for {transport_mode} route {route_idx}")
-                        except Exception as e:
-                            logger.error(f"Error processing route {route_idx} for {transport_mode}: {e}", exc_info=True)
+                    for route_idx, result in enumerate(results):
+                        if isinstance(result, Exception):
+                            logger.error(
+                                "Error processing route %s for %s: %s", route_idx, transport_mode, result,
+                                exc_info=result
+                            )
                             continue
+
+                        actual_mode, route = result
+                        if not route:
+                            logger.warning("Route conversion returned None for %s route %s", transport_mode, route_idx)
+                        elif route_idx == 0:
+                            routes.append(route)
+                            logger.info("Added route for %s (primary)", actual_mode)
+                        else:
+                            alternatives.append(route)
+                            logger.debug("Added alternative route for %s", actual_mode)
                 except Exception as e:
-                    logger.error(f"Error processing transport mode {transport_mode}: {e}", exc_info=True)
+                    logger.error("Error processing transport mode %s: %s", transport_mode, e, exc_info=True)
                     continue
 
             # If no routes found, try with first requested mode (not always car)
             if not routes and request.transport_modes:
                 first_mode = request.transport_modes[0]
                 google_mode = mode_mapping.get(first_mode, "driving")
-                logger.warning(f"No routes found with requested modes, trying fallback: {first_mode} ({google_mode})")
+                logger.warning("No routes found with requested modes, trying fallback: %s (%s)", first_mode, google_mode)
 
                 try:
                     directions_data = await self.api_client.google_maps.get_directions(
@@ -189,9 +212,9 @@ class RoutingEngine:
                         if route:
                             route = apply_preference_scoring(route, request.preferences)
                             routes.append(route)
-                            logger.info(f"Added fallback route for {first_mode}")
+                            logger.info("Added fallback route for %s", first_mode)
                 except Exception as e:
-                    logger.error(f"Error in fallback route calculation: {e}", exc_info=True)
+                    logger.error("Error in fallback route calculation: %s", e, exc_info=True)
 
             # Apply TransLink real-time enhancements
             # Filter routes with service alerts and high delays, prefer on-time routes
@@ -214,7 +237,7 @@ class RoutingEngine:
                 for alt_route in alt_routes:
                     if alt_route not in alternatives and alt_route not in routes:
                         alternatives.append(alt_route)
-                        logger.info(f"Added alternative route {alt_route.id} for delayed route {delayed_route_id}")
+                        logger.info("Added alternative route %s for delayed route %s", alt_route.id, delayed_route_id)
 
             # Sort routes by preference priority (now includes delay considerations)
             routes = sort_routes_by_preferences(routes, request.preferences)
@@ -222,20 +245,77 @@ class RoutingEngine:
 
             processing_time = (datetime.now() - start_time).total_seconds()
 
-            return RouteResponse(
+            response = RouteResponse(
                 routes=routes[:3],  # Limit to top 3 routes
                 alternatives=alternatives[:3],  # Limit to top 3 alternatives
                 processing_time=processing_time,
                 data_sources=["Google Maps", "TransLink", "Lime", "OpenWeatherMap", "Vancouver Open Data"]
             )
 
+            # Only cache real results; an empty response may be a transient upstream failure
+            if response.routes:
+                self._route_cache.set(cache_key, response.model_copy(deep=True), ROUTE_CACHE_TTL)
+
+            return response
+
         except Exception as e:
-            logger.error(f"Error finding routes: {e}")
+            logger.error("Error finding routes: %s", e)
             # Fallback to demo mode if real routing fails
             logger.info("Falling back to demo mode due to error")
             from .demo import DemoDataProvider
             return DemoDataProvider.generate_demo_routes(request)
 
+    async def _get_directions(self, request: RouteRequest, google_mode: str, avoid_list: List[str]) -> Optional[Dict]:
+        """Get directions from Google Maps for one mode, or None if the call fails or times out."""
+        api_start_time = time.time()
+        try:
+            directions_data = await asyncio.wait_for(
+                self.api_client.google_maps.get_directions(
+                    origin=request.origin,
+                    destination=request.destination,
+                    mode=google_mode,
+                    alternatives=True,
+                    avoid=avoid_list if avoid_list else None,
+                    departure_time="now" if request.departure_time else None
+                ),
+                timeout=5.0  # 5 second timeout for Google Maps API
+            )
+            elapsed = time.time() - api_start_time
+            logger.info("Google Maps API call for %s completed in %.2fs", google_mode, elapsed)
+            return directions_data
+        except asyncio.TimeoutError:
+            logger.error("Google Maps API call for %s timed out after 5 seconds", google_mode)
+        except Exception as e:
+            logger.error("Google Maps API call for %s failed: %s: %s", google_mode, type(e).__name__, e)
+        return None
+
+    async def _convert_google_route(
+        self,
+        google_route: Dict,
+        request: RouteRequest,
+        transport_mode: TransportMode,
+        google_mode: str,
+        real_time_data: Dict
+    ) -> Tuple[TransportMode, Optional[Route]]:
+        """Convert one Google Maps route and apply preference scoring."""
+        # Determine actual transport mode from route data
+        actual_mode = self._determine_actual_mode(google_route, transport_mode, google_mode)
+
+        # Convert Google Maps route to our Route model
+        route = await convert_google_route_to_route(
+            google_route,
+            request,
+            actual_mode,
+            real_time_data,
+            self.api_client
+        )
+
+        if route:
+            # Apply preference-based scoring
+            route = apply_preference_scoring(route, request.preferences)
+
+        return actual_mode, route
+
     async def _fetch_realtime_data(self, request: RouteRequest) -> Dict:
         """Fetch real-time data if needed based on request complexity."""
         # Only fetch if we have multiple transport modes or preferences that benefit from it
@@ -298,17 +378,17 @@ class RoutingEngine:
                 if not isinstance(results[0], Exception):
                     translink_trip_updates = results[0]
                 else:
-                    logger.warning(f"Could not fetch TransLink trip updates: {results[0]}")
+                    logger.warning("Could not fetch TransLink trip updates: %s", results[0])
                 if not isinstance(results[1], Exception):
                     translink_service_alerts = results[1]
                 else:
-                    logger.warning(f"Could not fetch TransLink service alerts: {results[1]}")
+                    logger.warning("Could not fetch TransLink service alerts: %s", results[1])
                 real_time_data['translink_trip_updates'] = translink_trip_updates
                 real_time_data['translink_service_alerts'] = translink_service_alerts
             except asyncio.TimeoutError:
                 logger.warning("TransLink GTFS-RT data fetch timed out")
             except Exception as e:
-                logger.warning(f"Could not fetch TransLink GTFS-RT data: {e}")
+                logger.warning("Could not fetch TransLink GTFS-RT data: %s", e)
 
         return real_time_data
 
@@ -332,6 +412,7 @@ class RoutingEngine:
         return actual_mode
 
     async def close(self):
-        """Close API client connections."""
-        await self.api_client.close()
+        """Close API client connections, unless they were passed in by the caller."""
+        if self._owns_api_client:
+            await self.api_client.close()
 
@@ -0,0 +1,135 @@
+"""
+Spatial index for graph node lookups.
+Projects coordinates to local meters so nearest-node and radius queries
+don't need a full scan with haversine distances.
+"""
+
+import math
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+# Optional imports with fallbacks
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Earth radius used by Point.distance_to (meters)
+EARTH_RADIUS_M = 6371000
+_METERS_PER_DEGREE = math.radians(EARTH_RADIUS_M)
+
+# Slack on projected query radii so the equirectangular approximation never
+# drops a point that is inside the radius by haversine distance
+_RADIUS_SLACK = 1.01
+
+# Below this many distances the compiled kernel's call overhead outweighs its gain
+NUMBA_MIN_SIZE = 1024
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _haversine_kernel(lat1, lng1, lat2, lng2, out):
+        """Fill ``out`` with haversine distances in a single fused, multi-threaded loop."""
+        for i in prange(out.shape[0]):
+            phi1 = math.radians(lat1[i])
+            phi2 = math.radians(lat2[i])
+            a = (
+                math.sin((phi2 - phi1) / 2) ** 2 +
+                math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2[i] - lng1[i]) / 2) ** 2
+            )
+            out[i] = 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Haversine distance in meters between two points, on plain floats."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2 +
+        math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def haversine_distances(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """
+    Haversine distances in meters between points.
+
+    Arguments are scalars or arrays of degrees and broadcast against each
+    other, so one point can be measured against many or pairs element-wise.
+    Large inputs use a Numba kernel when Numba is installed.
+    """
+    if NUMBA_AVAILABLE:
+        arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (lat1, lng1, lat2, lng2)))
+        if arrays[0].size >= NUMBA_MIN_SIZE:
+            out = np.empty(arrays[0].shape)
+            _haversine_kernel(*(np.ascontiguousarray(a).ravel() for a in arrays), out.reshape(-1))
+            return out
+
+    lat1, lng1, lat2, lng2 = map(np.radians, (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+class SpatialIndex:
+    """
+    Nearest-neighbour and radius index over a fixed set of points.
+
+    Points are projected equirectangularly around ``ref_lat`` so Euclidean
+    distance approximates geodesic distance at city scale. Uses a SciPy
+    cKDTree when available, otherwise vectorized NumPy scans. Distance limits
+    are checked with exact haversine distances.
+    """
+
+    def __init__(self, ids: Sequence[str], lats: Sequence[float], lngs: Sequence[float], ref_lat: float):
+        self.ids = list(ids)
+        self.lats = np.asarray(lats, dtype=float)
+        self.lngs = np.asarray(lngs, dtype=float)
+        self._x_scale = _METERS_PER_DEGREE * math.cos(math.radians(ref_lat))
+        self._xy = np.column_stack((self.lngs * self._x_scale, self.lats * _METERS_PER_DEGREE))
+        self._tree = cKDTree(self._xy) if SCIPY_AVAILABLE and self.ids else None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _project(self, lat: float, lng: float) -> np.ndarray:
+        return np.array((lng * self._x_scale, lat * _METERS_PER_DEGREE))
+
+    def nearest(self, lat: float, lng: float, max_distance: float = float('inf')) -> Optional[str]:
+        """Get the id of the nearest point closer than ``max_distance`` meters, if any."""
+        if not self.ids:
+            return None
+
+        target = self._project(lat, lng)
+        if self._tree is not None:
+            _, index = self._tree.query(target, distance_upper_bound=max_distance * _RADIUS_SLACK)
+            if index == len(self.ids):
+                return None
+        else:
+            index = int(np.argmin(((self._xy - target) ** 2).sum(axis=1)))
+
+        distance = haversine_distances(lat, lng, self.lats[index:index + 1], self.lngs[index:index + 1])[0]
+        return self.ids[index] if distance < max_distance else None
+
+    def within(self, lat: float, lng: float, radius: float) -> List[str]:
+        """Get the ids of all points within ``radius`` meters, in insertion order."""
+        if not self.ids:
+            return []
+
+        target = self._project(lat, lng)
+        search_radius = radius * _RADIUS_SLACK + 1.0
+        if self._tree is not None:
+            candidates = np.sort(np.asarray(self._tree.query_ball_point(target, search_radius), dtype=np.intp))
+        else:
+            candidates = np.flatnonzero(((self._xy - target) ** 2).sum(axis=1) <= search_radius ** 2)
+
+        distances = haversine_distances(lat, lng, self.lats[candidates], self.lngs[candidates])
+        return [self.ids[i] for i in candidates[distances <= radius]]
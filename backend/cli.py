@@ -21,14 +21,16 @@ from app.models import (
 )
 from app.routing_engine import RoutingEngine
 from app.graph_builder import VancouverGraphBuilder
+from app.api_clients import APIClientManager
 from app.gamification import GamificationEngine
-from app.config import settings, validate_api_keys
+from app.config import validate_api_keys
 
 
 class RouteCLI:
     """Command Line Interface for route recommendations."""
 
     def __init__(self):
+        self.api_client = None
         self.graph_builder = None
         self.routing_engine = None
         self.gamification_engine = GamificationEngine()
@@ -50,8 +52,9 @@ class RouteCLI:
             print("   Check env.example for API key setup instructions.")
 
         # Initialize components
-        self.graph_builder = VancouverGraphBuilder()
-        self.routing_engine = RoutingEngine(self.graph_builder)
+        self.api_client = APIClientManager()
+        self.graph_builder = VancouverGraphBuilder(self.api_client)
+        self.routing_engine = RoutingEngine(self.graph_builder, self.api_client)
 
         print("✅ System initialized successfully!")
 
@@ -61,6 +64,8 @@ class RouteCLI:
             await self.routing_engine.close()
         if self.graph_builder:
             await self.graph_builder.close()
+        if self.api_client:
+            await self.api_client.close()
 
     async def find_route(self, origin: str, destination: str, preferences: List[str] = None):
         """Find routes between two locations."""
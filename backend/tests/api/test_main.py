@@ -172,6 +172,22 @@ class TestGeocodeEndpoint:
         assert response2.status_code == 200
         assert response1.json() == response2.json()
 
+    @patch('app.main.validate_api_keys')
+    @patch('app.main.routing_engine')
+    def test_geocode_endpoint_caches_google_result(self, mock_routing_engine, mock_validate_keys, client):
+        """Test repeated addresses only hit Google once, regardless of case and spacing."""
+        mock_validate_keys.return_value = {"all_required": True}
+        mock_routing_engine.api_client.google_maps.geocode = AsyncMock(
+            return_value=Point(lat=49.2606, lng=-123.2460)
+        )
+
+        response1 = client.get("/api/v1/route/geocode?address=UBC Campus")
+        response2 = client.get("/api/v1/route/geocode?address=  ubc campus ")
+
+        assert response1.status_code == 200
+        assert response1.json() == response2.json()
+        mock_routing_engine.api_client.google_maps.geocode.assert_awaited_once()
+
 
 @pytest.mark.api
 class TestRouteEndpoint:
@@ -367,3 +383,38 @@ class TestGamificationEndpoints:
         data = response.json()
         assert "sustainability_points" in data or "achievements_unlocked" in data
 
+
+@pytest.mark.api
+class TestVancouverBounds:
+    """Tests for the Vancouver bounds helpers."""
+
+    def test_array_matches_scalar_check(self):
+        """Test the batch bounds check agrees with the per-point check."""
+        from app.main import _is_within_vancouver_bounds, _is_within_vancouver_bounds_array
+
+        points = [
+            Point(lat=49.2827, lng=-123.1207),  # Downtown
+            Point(lat=49.2606, lng=-123.2460),  # UBC
+            Point(lat=47.6062, lng=-122.3321),  # Seattle
+            Point(lat=49.2827, lng=-122.5000),  # Too far east
+        ]
+
+        result = _is_within_vancouver_bounds_array(
+            [p.lat for p in points], [p.lng for p in points]
+        )
+
+        assert result.tolist() == [_is_within_vancouver_bounds(p) for p in points]
+        assert result.tolist() == [True, True, False, False]
+
+    def test_bounds_follow_current_settings(self):
+        """Test bounds checks read the settings on each call, not at import."""
+        from app.main import _is_within_vancouver_bounds
+
+        seattle = Point(lat=47.6062, lng=-122.3321)
+        settings = MagicMock(
+            vancouver_bounds={"south": 47.0, "north": 50.0, "west": -124.0, "east": -122.0}
+        )
+
+        with patch("app.main.get_settings", return_value=settings):
+            assert _is_within_vancouver_bounds(seattle)
+        assert not _is_within_vancouver_bounds(seattle)
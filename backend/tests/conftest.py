@@ -17,6 +17,7 @@ backend_dir = Path(__file__).parent.parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
+from app.config import get_settings
 from app.models import (
     Point, RouteRequest, RouteResponse, Route, RouteStep,
     TransportMode, RoutePreference, UserProfile
@@ -44,6 +45,18 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """
+    Point the on-disk API and graph caches at a per-test directory, so tests
+    never read responses persisted by earlier runs or leave files behind.
+    """
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.fixture
 def sample_point_vancouver() -> Point:
     """Sample point in Vancouver downtown."""
@@ -231,3 +231,26 @@ class TestRoutingEngineFindRoutes:
         assert response.processing_time > 0
         assert isinstance(response.processing_time, float)
 
+    @patch('app.config.validate_api_keys')
+    @pytest.mark.asyncio
+    async def test_find_routes_reuses_cached_response(
+        self, mock_validate_keys, routing_engine, sample_route_request, mock_google_maps_response
+    ):
+        """Test that a repeated trip is served from the route cache."""
+        mock_validate_keys.return_value = {"all_required": True}
+        google_maps = routing_engine.api_client.google_maps
+        google_maps.get_directions = AsyncMock(return_value=mock_google_maps_response)
+
+        first = await routing_engine.find_routes(sample_route_request)
+        second = await routing_engine.find_routes(sample_route_request)
+
+        google_maps.get_directions.assert_awaited_once()
+        assert [route.id for route in second.routes] == [route.id for route in first.routes]
+        assert second.request_id != first.request_id
+
+        # Responses are copies, so changing one doesn't change later cache hits
+        first.routes.clear()
+        second.routes[0].steps.clear()
+        third = await routing_engine.find_routes(sample_route_request)
+        assert [route.id for route in third.routes] == [route.id for route in second.routes]
+        assert third.routes[0].steps
@@ -0,0 +1,242 @@
+"""
+Unit tests for external API clients.
+
+Tests cover:
+- In-flight request deduplication
+- Per-host concurrency limits
+- Per-point elevation caching
+- Conditional GET revalidation
+- Streamed Open Data records
+- Coalesced endpoint searches
+- Traffic metric computation
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from app.api_clients import (
+    dedupe, _Dedup, _APIClient, HostSemaphores, GoogleMapsClient, VancouverOpenDataClient,
+    _nearby_for_endpoints, _traffic_metrics
+)
+from app.models import Point
+
+
+class _CountingClient(_Dedup):
+    """Minimal client that counts how many requests actually go out."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    @dedupe(key=lambda self, value: value)
+    async def fetch(self, value):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return [value]
+
+
+@pytest.mark.unit
+class TestDedupe:
+    """Tests for the in-flight deduplication decorator."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_request(self):
+        """Concurrent calls with the same key issue a single request."""
+        client = _CountingClient()
+
+        results = await asyncio.gather(*(client.fetch("a") for _ in range(5)))
+
+        assert client.calls == 1
+        assert all(result == ["a"] for result in results)
+        assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_shared(self):
+        """Calls with different keys are issued separately."""
+        client = _CountingClient()
+
+        await asyncio.gather(client.fetch("a"), client.fetch("b"))
+
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_shared(self):
+        """Completed requests are not reused by later calls."""
+        client = _CountingClient()
+
+        await client.fetch("a")
+        await client.fetch("a")
+
+        assert client.calls == 2
+
+
+@pytest.mark.unit
+class TestHostSemaphores:
+    """Tests for the per-host concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_configured_hosts_get_their_own_limit(self):
+        """Listed hosts use their configured limit; other hosts use the default."""
+        semaphores = HostSemaphores(limit=50, host_limits={"maps.googleapis.com": 2})
+        in_flight = peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with semaphores("https://maps.googleapis.com/maps/api/geocode/json"):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+        assert semaphores("https://maps.googleapis.com/other") is semaphores("https://maps.googleapis.com/x")
+        assert semaphores("https://api.openweathermap.org/data")._value == 50
+
+
+@pytest.mark.unit
+class TestElevationCache:
+    """Tests for GoogleMapsClient elevation caching."""
+
+    @pytest.mark.asyncio
+    async def test_only_missing_points_fetched(self):
+        """Cached points are not re-sent; results keep input order."""
+        client = GoogleMapsClient()
+        client.api_key = "key"
+        a, b, c = Point(lat=49.1, lng=-123.1), Point(lat=49.2, lng=-123.2), Point(lat=49.3, lng=-123.3)
+        client._fetch_elevations = AsyncMock(return_value=[10.0, 20.0])
+
+        assert await client.get_elevation([a, b]) == [10.0, 20.0]
+
+        client._fetch_elevations = AsyncMock(return_value=[30.0])
+        assert await client.get_elevation([c, a, b, c]) == [30.0, 10.0, 20.0, 30.0]
+        client._fetch_elevations.assert_awaited_once_with(((49.3, -123.3),))
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_not_cached(self):
+        """Errors fall back to zero elevation without caching it."""
+        client = GoogleMapsClient()
+        client.api_key = "key"
+        point = Point(lat=49.1, lng=-123.1)
+        client._fetch_elevations = AsyncMock(side_effect=ValueError("OVER_QUERY_LIMIT"))
+
+        assert await client.get_elevation([point]) == [0.0]
+        assert len(client._elevation_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_large_requests_chunked(self):
+        """Misses beyond the per-request location limit are split into chunks."""
+        client = GoogleMapsClient()
+        client.api_key = "key"
+        points = [Point(lat=49.0 + i * 1e-4, lng=-123.0) for i in range(600)]
+        client._fetch_elevations = AsyncMock(side_effect=lambda chunk: [1.0] * len(chunk))
+
+        assert await client.get_elevation(points) == [1.0] * 600
+        assert [len(call.args[0]) for call in client._fetch_elevations.await_args_list] == [512, 88]
+
+
+@pytest.mark.unit
+class TestConditionalGet:
+    """Tests for ETag revalidation in _APIClient."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_replays_cached_response(self):
+        """A 304 returns the stored response and sends If-None-Match."""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"value": 1}, headers={"ETag": '"v1"'})
+
+        client = _APIClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        first = await client._get("https://example.com/data", params={"q": "x"})
+        second = await client._get("https://example.com/data", params={"q": "x"})
+
+        assert seen_headers == [None, '"v1"']
+        assert second.status_code == 200
+        assert second.content == first.content
+
+
+@pytest.mark.unit
+class TestOpenDataStreaming:
+    """Tests for streamed Open Data record parsing."""
+
+    @pytest.mark.asyncio
+    async def test_records_parsed_from_stream(self):
+        """Records are collected from a body delivered in several chunks."""
+        body = b'{"success": true, "result": {"records": [{"id": 1, "lat": 49.28}, {"id": 2}]}}'
+
+        class ChunkedStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for start in range(0, len(body), 16):
+                    yield body[start:start + 16]
+
+        def handler(request):
+            return httpx.Response(200, stream=ChunkedStream())
+
+        client = VancouverOpenDataClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+        records = await client.get_road_closures()
+
+        assert records == [{"id": 1, "lat": 49.28}, {"id": 2}]
+
+
+@pytest.mark.unit
+class TestNearbyForEndpoints:
+    """Tests for coalescing nearby searches around route endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_close_endpoints_share_one_search(self):
+        """Endpoints within the radius are covered by a single midpoint search."""
+        get_nearby = AsyncMock(return_value=["stop"])
+        origin, destination = Point(lat=49.2800, lng=-123.1200), Point(lat=49.2820, lng=-123.1200)
+
+        results = await _nearby_for_endpoints(get_nearby, origin, destination, radius=500)
+
+        assert results == [["stop"], ["stop"]]
+        get_nearby.assert_awaited_once()
+        midpoint, radius = get_nearby.await_args.args
+        assert midpoint.lat == pytest.approx(49.2810)
+        assert radius > 500 + origin.distance_to(destination) / 2 - 1
+
+    @pytest.mark.asyncio
+    async def test_distant_endpoints_searched_separately(self):
+        """Endpoints farther apart than the radius get their own searches."""
+        get_nearby = AsyncMock(side_effect=lambda point, radius: [point.lat])
+        origin, destination = Point(lat=49.28, lng=-123.12), Point(lat=49.25, lng=-123.10)
+
+        results = await _nearby_for_endpoints(get_nearby, origin, destination, radius=500)
+
+        assert results == [[49.28], [49.25]]
+        assert get_nearby.await_count == 2
+
+
+@pytest.mark.unit
+class TestTrafficMetrics:
+    """Tests for traffic congestion and speed computation."""
+
+    def test_scalar_values(self):
+        """Congestion is clamped to [0, 1] and zero durations are safe."""
+        congestion, current, free_flow = _traffic_metrics([100, 100, 0], [150, 300, 10], [1000, 1000, 0])
+
+        assert congestion == [0.5, 1.0, 0]
+        assert current == pytest.approx([24.0, 12.0, 0.0])
+        assert free_flow == pytest.approx([36.0, 36.0, 0.0])
+
+    def test_vectorized_matches_scalar(self):
+        """The NumPy path gives the same results as the scalar path."""
+        durations = [60 + i for i in range(40)] + [0]
+        in_traffic = [d + (i % 7) * 10 - 20 for i, d in enumerate(durations)]
+        distances = [500.0 + i * 3 for i in range(41)]
+
+        vectorized = _traffic_metrics(durations, in_traffic, distances)
+        scalar = [_traffic_metrics([d], [t], [x]) for d, t, x in zip(durations, in_traffic, distances)]
+
+        for index, values in enumerate(vectorized):
+            assert values == pytest.approx([result[index][0] for result in scalar])
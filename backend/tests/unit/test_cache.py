@@ -0,0 +1,152 @@
+"""
+Unit tests for the API response cache.
+
+Tests cover:
+- Fresh hits and misses
+- Stale-while-revalidate refreshes
+- LRU eviction
+- Disk-backed persistence
+- Batched disk reads/writes and purging expired rows
+"""
+
+import asyncio
+import time
+
+import pytest
+from app.cache import AsyncTTLCache, DISK_CACHE_PURGE_AFTER, DiskCache, MISSING
+
+
+class _Fetcher:
+    """Async fetch callable that returns an incrementing value."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.calls
+
+
+@pytest.mark.unit
+class TestAsyncTTLCache:
+    """Tests for AsyncTTLCache."""
+
+    def test_get_missing_key(self):
+        """Missing keys return the MISSING sentinel."""
+        cache = AsyncTTLCache()
+        value, fresh = cache.get("missing")
+        assert value is MISSING
+        assert fresh is False
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted past maxsize."""
+        cache = AsyncTTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert len(cache) == 2
+        assert cache.get("b")[0] is MISSING
+        assert cache.get("a")[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_skips_fetch(self):
+        """Fresh entries are served without fetching."""
+        cache = AsyncTTLCache()
+        fetch = _Fetcher()
+
+        first = await cache.get_or_fetch("key", fetch, ttl=60)
+        second = await cache.get_or_fetch("key", fetch, ttl=60)
+
+        assert first == second == 1
+        assert fetch.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_hit_served_and_refreshed(self):
+        """Stale entries are returned immediately and refreshed in the background."""
+        cache = AsyncTTLCache()
+        fetch = _Fetcher()
+        cache.set("key", 0, ttl=-1)
+
+        value = await cache.get_or_fetch("key", fetch, ttl=60)
+        assert value == 0
+
+        await asyncio.sleep(0)
+        assert fetch.calls == 1
+        assert cache.get("key") == (1, True)
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self):
+        """A failing refresh leaves the stale value in place."""
+        cache = AsyncTTLCache()
+        cache.set("key", "stale", ttl=-1)
+
+        async def failing_fetch():
+            raise RuntimeError("upstream down")
+
+        assert await cache.get_or_fetch("key", failing_fetch, ttl=60) == "stale"
+        await asyncio.sleep(0)
+        assert cache.get("key") == ("stale", False)
+
+    def test_disk_store_survives_restart(self, tmp_path):
+        """Entries written through a disk store are found by a new cache."""
+        path = str(tmp_path / "cache.sqlite")
+        cache = AsyncTTLCache(store=DiskCache(path))
+        cache.set((49.28, -123.12), 42.5, ttl=float("inf"))
+        cache.set("closures", [{"id": 1}], ttl=-1)
+        cache.store.close()
+
+        restarted = AsyncTTLCache(store=DiskCache(path))
+
+        assert restarted.get((49.28, -123.12)) == (42.5, True)
+        assert restarted.get("closures") == ([{"id": 1}], False)
+        assert restarted.get("missing")[0] is MISSING
+
+    @pytest.mark.asyncio
+    async def test_batched_disk_reads_and_writes(self, tmp_path):
+        """set_many persists all entries; get_many reads them back after a restart."""
+        path = str(tmp_path / "cache.sqlite")
+        cache = AsyncTTLCache(store=DiskCache(path))
+        await cache.set_many({(49.28, -123.12): 42.5, (49.29, -123.13): 17.0}, ttl=60)
+        cache.store.close()
+
+        restarted = AsyncTTLCache(store=DiskCache(path))
+        found = await restarted.get_many([(49.28, -123.12), (49.29, -123.13), "missing"])
+        restarted.store.close()
+
+        assert found == {(49.28, -123.12): (42.5, True), (49.29, -123.13): (17.0, True)}
+
+
+@pytest.mark.unit
+class TestDiskCache:
+    """Tests for the SQLite-backed DiskCache."""
+
+    def test_purge_drops_long_expired_rows(self, tmp_path):
+        """Rows long past their expiry are deleted; recently stale ones are kept."""
+        store = DiskCache(str(tmp_path / "cache.sqlite"))
+        now = time.time()
+        store.set_many([
+            ("old", 1, now - DISK_CACHE_PURGE_AFTER - 60),
+            ("stale", 2, now - 60),
+            ("fresh", 3, now + 60),
+        ])
+
+        store.purge_expired()
+
+        assert store.get_many(["old", "stale", "fresh"]) == {
+            "stale": (2, now - 60),
+            "fresh": (3, now + 60)
+        }
+        store.close()
+
+    def test_database_opened_on_first_use(self, tmp_path):
+        """Creating a store touches no files until it is read or written."""
+        path = tmp_path / "nested" / "cache.sqlite"
+        store = DiskCache(str(path))
+        assert not path.exists()
+
+        store.set("key", 1, time.time() + 60)
+
+        assert path.exists()
+        store.close()
@@ -0,0 +1,66 @@
+"""
+Unit tests for the per-preference edge cost functions.
+
+Tests cover:
+- Travel time from mode speeds
+- Per-preference mode weighting
+- Mode switching costs
+"""
+
+import pytest
+from app.models import Edge, RoutePreference, TransportMode
+from app.routing.cost_functions import get_cost_function
+
+
+@pytest.fixture
+def edge():
+    """A 1 km street edge with a rain penalty."""
+    return Edge(
+        id="a_b",
+        from_node="a",
+        to_node="b",
+        distance=1000.0,
+        allowed_modes=[TransportMode.WALKING, TransportMode.BIKING, TransportMode.CAR],
+        weather_penalty=1.5
+    )
+
+
+@pytest.mark.unit
+class TestCostFunctions:
+    """Tests for get_cost_function and the functions it returns."""
+
+    def test_fastest_is_penalized_travel_time(self, edge):
+        """Fastest cost is travel time in seconds times the edge penalties."""
+        cost = get_cost_function(RoutePreference.FASTEST)
+
+        assert cost(edge, TransportMode.WALKING, None) == pytest.approx(720 * 1.5)
+        assert cost(edge, TransportMode.CAR, None) == pytest.approx(72 * 1.5)
+
+    @pytest.mark.parametrize("preference, mode, expected", [
+        (RoutePreference.SAFEST, TransportMode.BIKING, 240 * 1.5 * 1.5),
+        (RoutePreference.SAFEST, TransportMode.CAR, 72 * 1.5 * 1.2),
+        (RoutePreference.ENERGY_EFFICIENT, TransportMode.WALKING, 720 + 1000 * 0.1),
+        (RoutePreference.ENERGY_EFFICIENT, TransportMode.SEABUS, 240 + 1000 * 0.5),
+        (RoutePreference.SCENIC, TransportMode.WALKING, 720 * 0.8),
+        (RoutePreference.HEALTHY, TransportMode.CAR, 72 * 1.2),
+        (RoutePreference.CHEAPEST, TransportMode.BIKING, 240 + 0.1),
+    ])
+    def test_preference_weights(self, edge, preference, mode, expected):
+        """Each preference weights the travel time of a mode as documented."""
+        assert get_cost_function(preference)(edge, mode, None) == pytest.approx(expected)
+
+    def test_mode_switch_cost_added(self, edge):
+        """Switching modes adds the switch cost; staying in a mode adds nothing."""
+        cost = get_cost_function(RoutePreference.FASTEST)
+        base = cost(edge, TransportMode.BIKING, None)
+
+        assert cost(edge, TransportMode.BIKING, TransportMode.BIKING) == pytest.approx(base)
+        assert cost(edge, TransportMode.BIKING, TransportMode.WALKING) == pytest.approx(base + 60)
+        assert cost(edge, TransportMode.BIKING, TransportMode.SEABUS) == pytest.approx(base)
+
+    def test_safest_skips_penalty_on_bike_lane(self, edge):
+        """Bike lanes remove the safety penalty but keep the weather penalty."""
+        edge.is_bike_lane = True
+        cost = get_cost_function(RoutePreference.SAFEST)
+
+        assert cost(edge, TransportMode.BIKING, None) == pytest.approx(240 * 1.5)
@@ -0,0 +1,62 @@
+"""
+Unit tests for app.demo module.
+
+Tests cover:
+- Demo geocoding
+- Approximate distance
+- Demo route generation
+- Demo weather data
+"""
+
+import pytest
+from app.demo import DemoDataProvider, _cheap_distance
+from app.models import Point, Route, RouteRequest, RoutePreference, WeatherData
+
+
+@pytest.mark.unit
+class TestDemoDataProvider:
+    """Tests for DemoDataProvider."""
+
+    def test_geocode_matches(self):
+        """Exact, whole-word and partial-word addresses resolve to known locations."""
+        locations = DemoDataProvider.VANCOUVER_LOCATIONS
+
+        assert DemoDataProvider.geocode_address("  Stanley Park ") == locations["stanley park"]
+        assert DemoDataProvider.geocode_address("near gastown") == locations["gastown"]
+        assert DemoDataProvider.geocode_address("gran") == locations["granville island"]
+        # An earlier substring match beats a later whole-word match, as in table order
+        assert DemoDataProvider.geocode_address("4th st") == locations["stanley park"]
+
+    def test_geocode_unknown_address_falls_back(self):
+        """Unknown addresses return one of the known locations."""
+        assert DemoDataProvider.geocode_address("zzqq") in DemoDataProvider.VANCOUVER_LOCATIONS.values()
+
+    def test_cheap_distance_matches_haversine(self):
+        """The equirectangular approximation is within 0.1% of haversine across the region."""
+        airport = DemoDataProvider.VANCOUVER_LOCATIONS["airport"]
+        for point in DemoDataProvider.VANCOUVER_LOCATIONS.values():
+            if point != airport:
+                assert _cheap_distance(airport, point) == pytest.approx(airport.distance_to(point), rel=1e-3)
+
+    def test_generated_routes_are_valid_models(self):
+        """Routes built without validation still pass full model validation."""
+        request = RouteRequest(
+            origin=Point(lat=49.2827, lng=-123.1207),
+            destination=Point(lat=49.3043, lng=-123.1443),
+            preferences=[RoutePreference.FASTEST, RoutePreference.HEALTHY]
+        )
+
+        response = DemoDataProvider.generate_demo_routes(request)
+
+        assert len(response.routes) == 2
+        for route in response.routes + response.alternatives:
+            validated = Route.model_validate(route.model_dump())
+            assert validated.total_distance == pytest.approx(sum(step.distance for step in route.steps))
+            assert validated.total_time == sum(step.estimated_time for step in route.steps)
+            assert route.steps[0].start_point == request.origin
+            assert route.steps[-1].end_point.lat == pytest.approx(request.destination.lat)
+
+    def test_weather_data_is_valid_model(self):
+        """Demo weather data passes full model validation."""
+        weather = DemoDataProvider.get_demo_weather_data()
+        assert WeatherData.model_validate(weather.model_dump()) == weather
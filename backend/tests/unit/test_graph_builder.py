@@ -0,0 +1,305 @@
+"""
+Unit tests for the routing graph builder.
+
+Tests cover:
+- Saving and reloading built graphs
+- Column-wise edge cost updates
+- Shortest-path queries
+- Tiled OSM downloads
+- Collapsing parallel OSM edges
+"""
+
+import os
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import networkx as nx
+import pytest
+from app.graph_builder import (
+    DYNAMIC_EDGE_FIELDS, GRAPH_CACHE_TTL, MODE_COLUMNS, OSM_TILE_GRID, InsufficientResponseError,
+    VancouverGraphBuilder, _shortest_parallel_edges
+)
+from app.models import Point, RoutePreference, TransportMode
+from app.routing.cost_functions import get_cost_function
+
+
+async def _fallback_builder() -> VancouverGraphBuilder:
+    """Graph builder holding a small fallback grid."""
+    builder = VancouverGraphBuilder()
+    await builder._create_fallback_network(Point(lat=49.2827, lng=-123.1207), 300)
+    return builder
+
+
+@pytest.mark.unit
+class TestGraphCache:
+    """Tests for the on-disk graph cache."""
+
+    @pytest.mark.asyncio
+    async def test_saved_graph_reloads(self, tmp_path):
+        """A saved graph is restored with its nodes and edges."""
+        path = str(tmp_path / "graph.pkl")
+        builder = await _fallback_builder()
+        builder._save_cached_graph(path)
+
+        restored = VancouverGraphBuilder()
+        try:
+            assert restored._load_cached_graph(path)
+            assert set(restored.graph.nodes) == set(builder.graph.nodes)
+            assert restored.edges.keys() == builder.edges.keys()
+            assert restored.get_nearest_node(Point(lat=49.2827, lng=-123.1207)) == "grid_0_0"
+        finally:
+            await builder.close()
+            await restored.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_or_missing_graph_not_loaded(self, tmp_path):
+        """Graphs older than the TTL, or never saved, are rebuilt."""
+        path = str(tmp_path / "graph.pkl")
+        builder = await _fallback_builder()
+        try:
+            assert not builder._load_cached_graph(path)
+
+            builder._save_cached_graph(path)
+            expired = time.time() - GRAPH_CACHE_TTL - 60
+            os.utime(path, (expired, expired))
+
+            assert not builder._load_cached_graph(path)
+        finally:
+            await builder.close()
+
+    @pytest.mark.asyncio
+    async def test_fallback_graph_not_saved(self, tmp_path):
+        """A graph built from the fallback grid is not cached, so OSM is retried next time."""
+        path = tmp_path / "graph.pkl"
+        builder = VancouverGraphBuilder()
+        try:
+            with patch("app.graph_builder.OSMNX_AVAILABLE", False), \
+                    patch.object(builder, "_graph_cache_path", return_value=str(path)), \
+                    patch.object(builder, "_add_transit_network", AsyncMock()), \
+                    patch.object(builder, "_add_shared_mobility_stations", AsyncMock()), \
+                    patch.object(builder, "_add_pedestrian_bike_network", AsyncMock()), \
+                    patch.object(builder, "_update_edge_costs", AsyncMock()):
+                await builder.build_graph(Point(lat=49.2827, lng=-123.1207), 300)
+
+            assert builder.graph.number_of_nodes() > 0
+            assert not path.exists()
+        finally:
+            await builder.close()
+
+
+@pytest.mark.unit
+class TestEdgeCosts:
+    """Tests for the per-edge cost columns."""
+
+    @pytest.mark.asyncio
+    async def test_update_fills_allowed_modes(self):
+        """Energy costs are set for allowed modes only, scaled by distance."""
+        builder = await _fallback_builder()
+        try:
+            await builder._update_edge_costs()
+            edge = builder.get_edge(builder.edge_ids[0])
+
+            assert len(builder.edge_ids) == len(builder.edges)
+            assert edge.current_traffic_speed == builder.mode_speeds[TransportMode.WALKING]
+            assert edge.weather_penalty == edge.event_penalty == 1.0
+            assert edge.energy_cost == pytest.approx({
+                TransportMode.WALKING: edge.distance * 0.1,
+                TransportMode.BIKING: edge.distance * 0.05,
+                TransportMode.CAR: edge.distance * 0.5
+            })
+        finally:
+            await builder.close()
+
+    @pytest.mark.asyncio
+    async def test_realtime_costs_only_in_columns(self):
+        """Real-time penalties reach edges read through get_edge, not stale copies."""
+        builder = await _fallback_builder()
+        try:
+            await builder._update_edge_costs()
+            builder.edge_weather_penalty[:] = 1.3
+            edge = builder.get_edge(builder.edge_ids[0])
+            cost = get_cost_function(RoutePreference.FASTEST)
+
+            assert edge.weather_penalty == pytest.approx(1.3)
+            expected = edge.distance * 0.72 * 1.3  # Walking seconds per meter times the penalty
+            assert cost(edge, TransportMode.WALKING, None) == pytest.approx(expected)
+            assert DYNAMIC_EDGE_FIELDS.isdisjoint(builder.graph.edges[edge.from_node, edge.to_node])
+        finally:
+            await builder.close()
+
+
+@pytest.mark.unit
+class TestShortestPath:
+    """Tests for shortest-path queries over the built graph."""
+
+    @pytest.mark.asyncio
+    async def test_path_follows_grid(self):
+        """Paths run along adjacent grid nodes and respect the mode."""
+        builder = await _fallback_builder()
+        try:
+            await builder._update_edge_costs()
+            builder._build_igraph()
+
+            path = builder.shortest_path("grid_0_0", "grid_2_0", mode=TransportMode.CAR)
+
+            assert path == ["grid_0_0", "grid_1_0", "grid_2_0"]
+            assert builder.shortest_path("grid_0_0", "grid_2_0", mode=TransportMode.BUS) == []
+        finally:
+            await builder.close()
+
+    @pytest.mark.asyncio
+    async def test_networkx_fallback_matches(self):
+        """Without igraph, the bidirectional search finds the same path."""
+        builder = await _fallback_builder()
+        try:
+            builder.igraph = None
+
+            path = builder.shortest_path("grid_0_0", "grid_2_0", mode=TransportMode.CAR)
+
+            assert path == ["grid_0_0", "grid_1_0", "grid_2_0"]
+            assert builder.shortest_path("grid_0_0", "grid_2_0", mode=TransportMode.BUS) == []
+        finally:
+            await builder.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_igraph", [True, False])
+    async def test_unknown_node_has_no_path(self, use_igraph):
+        """Both backends return an empty path for node ids not in the graph."""
+        builder = await _fallback_builder()
+        try:
+            await builder._update_edge_costs()
+            builder._build_igraph()
+            if not use_igraph:
+                builder.igraph = None
+
+            assert builder.shortest_path("grid_0_0", "nowhere") == []
+            assert builder.shortest_path("nowhere", "grid_0_0", mode=TransportMode.CAR) == []
+        finally:
+            await builder.close()
+
+    @pytest.mark.asyncio
+    async def test_igraph_matches_networkx(self):
+        """igraph paths over a mode-filtered subgraph match the networkx search."""
+        pytest.importorskip("igraph")
+        builder = await _fallback_builder()
+        try:
+            # Make a few edges walk-only, so the mode filter drops edges from the middle of the rows
+            for edge in builder.edges.values():
+                if edge.from_node in ("grid_1_0", "grid_1_1"):
+                    edge.allowed_modes = [TransportMode.WALKING]
+                    attrs = builder.graph.edges[edge.from_node, edge.to_node]
+                    attrs["allowed_modes"] = edge.allowed_modes
+            await builder._update_edge_costs()
+            builder._build_igraph()
+
+            def length(path):
+                return sum(builder.graph.edges[u, v]["distance"] for u, v in zip(path, path[1:]))
+
+            igraph = builder.igraph
+            for mode in (None, TransportMode.WALKING, TransportMode.CAR):
+                for target in ("grid_0_2", "grid_2_1", "grid_2_-2", "grid_-2_1"):
+                    assert target in builder.graph
+                    builder.igraph = igraph
+                    fast = builder.shortest_path("grid_0_0", target, mode=mode)
+                    builder.igraph = None
+                    slow = builder.shortest_path("grid_0_0", target, mode=mode)
+
+                    assert fast and slow
+                    assert length(fast) == pytest.approx(length(slow))
+                    if mode is not None:
+                        assert all(
+                            mode in builder.graph.edges[u, v]["allowed_modes"]
+                            for u, v in zip(fast, fast[1:])
+                        )
+        finally:
+            await builder.close()
+
+    @pytest.mark.asyncio
+    async def test_igraph_mode_views_built_once(self):
+        """Per-mode igraph views are built with the igraph copy and dropped with the edge rows."""
+        pytest.importorskip("igraph")
+        builder = await _fallback_builder()
+        try:
+            await builder._update_edge_costs()
+            builder._build_igraph()
+            graph, weights = builder._igraph_views[TransportMode.CAR]
+
+            assert builder._igraph_views.keys() == {None, *MODE_COLUMNS}
+            assert graph.ecount() == len(weights) == len(builder.edges)
+            assert builder._igraph_views[TransportMode.BUS][0].ecount() == 0
+
+            builder.shortest_path("grid_0_0", "grid_2_0", mode=TransportMode.CAR)
+            assert builder._igraph_views[TransportMode.CAR][0] is graph
+
+            await builder._update_edge_costs()
+            assert builder.igraph is None and not builder._igraph_views
+        finally:
+            await builder.close()
+
+
+@pytest.mark.unit
+class TestTiledDownload:
+    """Tests for downloading the OSM network tile by tile."""
+
+    @pytest.mark.asyncio
+    async def test_tiles_merge_on_shared_nodes(self):
+        """Every tile is fetched, empty tiles are skipped and boundary nodes merge."""
+        calls = []
+        center = Point(lat=49.2827, lng=-123.1207)
+
+        def graph_from_bbox(*, bbox, **kwargs):
+            west, south, east, north = bbox
+            calls.append(bbox)
+            if north < center.lat and west < center.lng - 0.005:
+                # The south-west tile is empty
+                raise InsufficientResponseError("No data elements in server response")
+            tile = nx.MultiDiGraph(crs="EPSG:4326")
+            # Node 0 sits on every tile's boundary; the others are per tile
+            tile.add_node(0, x=center.lng, y=center.lat)
+            tile.add_node((south, west), x=west, y=south)
+            tile.add_edge(0, (south, west), key=0)
+            return tile
+
+        builder = VancouverGraphBuilder()
+        fake_ox = MagicMock(graph_from_bbox=MagicMock(side_effect=graph_from_bbox))
+        try:
+            with patch("app.graph_builder.ox", fake_ox, create=True), \
+                    patch("app.graph_builder.OSMNX_V2", True):
+                graph = await builder._download_osm_graph(center, 1000)
+
+            assert len(calls) == OSM_TILE_GRID ** 2
+            # Shared node + one per non-empty tile
+            assert graph.number_of_nodes() == OSM_TILE_GRID ** 2
+            assert graph.number_of_edges() == OSM_TILE_GRID ** 2 - 1
+        finally:
+            await builder.close()
+
+    @pytest.mark.asyncio
+    async def test_download_errors_propagate(self):
+        """Errors other than an empty result are not mistaken for empty tiles."""
+        builder = VancouverGraphBuilder()
+        fake_ox = MagicMock(graph_from_bbox=MagicMock(side_effect=TypeError("unexpected argument")))
+        try:
+            with patch("app.graph_builder.ox", fake_ox, create=True):
+                with pytest.raises(TypeError):
+                    await builder._download_osm_graph(Point(lat=49.2827, lng=-123.1207), 1000)
+        finally:
+            await builder.close()
+
+
+@pytest.mark.unit
+class TestParallelEdges:
+    """Tests for collapsing parallel OSM edges."""
+
+    def test_shortest_edge_kept(self):
+        """Only the shortest edge between a pair of nodes survives, per direction."""
+        edges = [
+            (1, 2, 0, {"length": 120.0, "highway": "primary"}),
+            (1, 2, 1, {"length": 80.0, "highway": "service"}),
+            (2, 1, 0, {"length": 120.0, "highway": "primary"}),
+        ]
+
+        assert _shortest_parallel_edges(edges) == [
+            (1, 2, {"length": 80.0, "highway": "service"}),
+            (2, 1, {"length": 120.0, "highway": "primary"}),
+        ]
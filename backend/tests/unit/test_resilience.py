@@ -0,0 +1,88 @@
+"""
+Unit tests for retry and circuit breaker helpers.
+
+Tests cover:
+- Retrying transient errors
+- Circuit breaker state transitions
+"""
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.resilience import retry, CircuitBreaker, CircuitOpenError
+
+
+def _status_error(status_code: int, headers: dict = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code, request=request, headers=headers)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.unit
+class TestRetry:
+    """Tests for the retry decorator."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        """Transient failures are retried until success."""
+        func = AsyncMock(side_effect=[httpx.ConnectError("down"), _status_error(503), "ok"])
+
+        with patch("app.resilience.asyncio.sleep", new=AsyncMock()):
+            result = await retry(max_attempts=3)(func)()
+
+        assert result == "ok"
+        assert func.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self):
+        """Non-retryable statuses are raised immediately."""
+        func = AsyncMock(side_effect=_status_error(404))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await retry(max_attempts=3)(func)()
+
+        assert func.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self):
+        """Retry-After delays are used, capped at max_backoff."""
+        func = AsyncMock(side_effect=[_status_error(429, {"Retry-After": "10"}), "ok"])
+        sleep = AsyncMock()
+
+        with patch("app.resilience.asyncio.sleep", new=sleep):
+            await retry(max_attempts=2, max_backoff=2.0)(func)()
+
+        sleep.assert_awaited_once_with(2.0)
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold(self):
+        """Consecutive failures open the breaker and later calls fail fast."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+        failing = AsyncMock(side_effect=httpx.ConnectError("down"))
+
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await breaker.call(failing)
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(failing)
+        assert failing.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_half_open_success_closes(self):
+        """A successful trial call after the reset timeout closes the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+
+        with pytest.raises(httpx.ConnectError):
+            await breaker.call(AsyncMock(side_effect=httpx.ConnectError("down")))
+
+        assert breaker.state == "half_open"
+        assert await breaker.call(AsyncMock(return_value="ok")) == "ok"
+        assert breaker.state == "closed"
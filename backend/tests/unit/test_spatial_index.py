@@ -0,0 +1,89 @@
+"""
+Unit tests for the graph node spatial index.
+
+Tests cover:
+- Nearest-node lookups
+- Radius queries
+- Vectorized haversine distances
+"""
+
+import numpy as np
+import pytest
+from app.models import Point
+from app.spatial_index import SpatialIndex, haversine, haversine_distances
+
+
+@pytest.fixture
+def grid_points():
+    """A 20x20 grid of points around downtown Vancouver."""
+    lats, lngs = np.meshgrid(49.27 + np.arange(20) * 0.001, -123.13 + np.arange(20) * 0.0015)
+    return [Point(lat=lat, lng=lng) for lat, lng in zip(lats.ravel(), lngs.ravel())]
+
+
+@pytest.fixture
+def index(grid_points):
+    """Spatial index over the grid points."""
+    return SpatialIndex(
+        [f"n{i}" for i in range(len(grid_points))],
+        [p.lat for p in grid_points],
+        [p.lng for p in grid_points],
+        ref_lat=49.25
+    )
+
+
+@pytest.mark.unit
+class TestSpatialIndex:
+    """Tests for SpatialIndex."""
+
+    def test_haversine_matches_point_distance(self, grid_points):
+        """Vectorized distances match Point.distance_to."""
+        origin = Point(lat=49.2827, lng=-123.1207)
+        distances = haversine_distances(
+            origin.lat, origin.lng,
+            np.array([p.lat for p in grid_points]), np.array([p.lng for p in grid_points])
+        )
+
+        assert distances == pytest.approx([origin.distance_to(p) for p in grid_points])
+
+    def test_haversine_pairs_elementwise(self, grid_points):
+        """Arrays of start and end points give element-wise distances."""
+        starts, ends = grid_points[:-1], grid_points[1:]
+        distances = haversine_distances(
+            [p.lat for p in starts], [p.lng for p in starts],
+            [p.lat for p in ends], [p.lng for p in ends]
+        )
+
+        assert distances == pytest.approx([a.distance_to(b) for a, b in zip(starts, ends)])
+
+    def test_scalar_haversine_matches_point_distance(self, grid_points):
+        """The float haversine matches Point.distance_to."""
+        origin = Point(lat=49.2827, lng=-123.1207)
+
+        assert [haversine(origin.lat, origin.lng, p.lat, p.lng) for p in grid_points] == pytest.approx(
+            [origin.distance_to(p) for p in grid_points]
+        )
+
+    def test_nearest_matches_linear_scan(self, index, grid_points):
+        """The nearest id is the one a full haversine scan finds."""
+        for query in (Point(lat=49.2801, lng=-123.1204), Point(lat=49.2733, lng=-123.1111)):
+            expected = min(range(len(grid_points)), key=lambda i: query.distance_to(grid_points[i]))
+            assert index.nearest(query.lat, query.lng) == f"n{expected}"
+
+    def test_nearest_respects_max_distance(self, index):
+        """No id is returned when the nearest point is too far away."""
+        assert index.nearest(49.2700, -123.1300, max_distance=50) == "n0"
+        assert index.nearest(49.2600, -123.1300, max_distance=200) is None
+
+    def test_within_matches_linear_scan(self, index, grid_points):
+        """Radius queries return the same ids, in insertion order, as a full scan."""
+        query = Point(lat=49.2795, lng=-123.1160)
+        expected = [f"n{i}" for i, p in enumerate(grid_points) if query.distance_to(p) <= 350]
+
+        assert index.within(query.lat, query.lng, 350) == expected
+
+    def test_empty_index(self):
+        """An empty index returns no matches."""
+        index = SpatialIndex([], [], [], ref_lat=49.25)
+
+        assert index.nearest(49.28, -123.12) is None
+        assert index.within(49.28, -123.12, 1000) == []